@@ -1,3 +1,5 @@
+from startup import startup_timer # Importado primeiro: marca o início da medição de inicialização
+
 import os
 import sys
 import tkinter as tk
@@ -14,7 +16,10 @@ def resource_path(relative_path):
 
 # === IMPORTAÇÃO DE CONFIG E LOG ===
 try:
-    from config import logger, Config
+    with startup_timer.measure_import("config"):
+        from config import logger, Config, init_app
+    init_app()
+    from profiling import Profiler
 except ImportError as e:
     import logging
     logging.basicConfig(level=logging.INFO, format='[%(asctime)s] [%(levelname)s] %(message)s')
@@ -31,7 +36,8 @@ except ImportError as e:
 
 # === IMPORTAÇÃO DA JANELA DE LOGIN ===
 try:
-    from gui.login_window import LoginWindow
+    with startup_timer.measure_import("gui.login_window"):
+        from gui.login_window import LoginWindow
 except ImportError as e:
     logger.critical(f"Falha ao importar módulos da aplicação: {e}", exc_info=True)
     try:
@@ -48,6 +54,9 @@ except ImportError as e:
 
 # === FUNÇÃO PÚBLICA PARA SER CHAMADA PELO main.py ===
 def iniciar_app():
+    # Perfilamento da sessão inteira (AGENDA_PROFILE=1 ou --profile), para diagnosticar lentidão relatada
+    if Profiler.session_requested(sys.argv[1:]):
+        Profiler.start("sessao")
     try:
         logger.info(f"Iniciando aplicação {Config.APP_NAME} v{Config.VERSION}")
         LoginWindow()
@@ -65,3 +74,5 @@ def iniciar_app():
         except Exception as tk_e:
             logger.error(f"Falha ao exibir erro fatal com Tkinter: {tk_e}")
         sys.exit(1)
+    finally:
+        Profiler.stop_and_write()
@@ -0,0 +1,245 @@
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np # Dependência opcional: verifique config.HAS_NUMPY antes de importar este módulo
+
+from config import logger
+
+UNKNOWN_USER_LABEL = "(desconhecido)"
+NO_CATEGORY_LABEL = "(Sem categoria)"
+SECONDS_PER_DAY = 86400
+
+
+class GroupStats:
+    """Estatísticas de um grupo (prioridade, categoria ou total): quantidade, mediana, p90 e máximo, em dias."""
+
+    def __init__(self, key, count: int, median_days: float, p90_days: float, max_days: float):
+        self.key = key
+        self.count = count
+        self.median_days = median_days
+        self.p90_days = p90_days
+        self.max_days = max_days
+
+
+class ProductivitySummary:
+    """Resultado da análise de produtividade, pronto para a janela de resumo e para o relatório PDF."""
+
+    def __init__(self, generated_at: datetime):
+        self.generated_at = generated_at
+        self.total_tasks = 0
+        self.completed_count = 0
+        self.pending_count = 0
+        self.week_starts: List[date] = [] # Segunda-feira de cada semana exibida, da mais antiga à atual
+        self.weekly_by_user: List[Tuple[str, List[int]]] = [] # (usuário, concluídas por semana)
+        self.weekly_totals: List[int] = []
+        self.lead_time: Optional[GroupStats] = None # Criação -> conclusão, todas as concluídas
+        self.lead_time_by_priority: List[GroupStats] = []
+        self.backlog_age: Optional[GroupStats] = None # Idade das pendentes
+        self.backlog_age_by_priority: List[GroupStats] = []
+        self.backlog_age_by_category: List[GroupStats] = []
+        self.elapsed_s = 0.0
+
+
+class TaskColumns:
+    """As colunas usadas pela análise, em arrays NumPy (uma posição por tarefa)."""
+
+    def __init__(self, created_at: List[Optional[str]], completed_at: List[Optional[str]],
+                 is_completed: List[bool], users: List[str], priorities: List, categories: List[str]):
+        self.created_at = _parse_timestamps(created_at)
+        self.completed_at = _parse_timestamps(completed_at)
+        self.is_completed = np.array(is_completed, dtype=bool)
+        # Textos viram códigos inteiros (índice em *_names): agrupar inteiros é bem mais rápido que strings
+        self.user_codes, self.user_names = _factorize(users)
+        self.priorities = _as_priorities(priorities)
+        self.category_codes, self.category_names = _factorize(categories)
+
+    def __len__(self) -> int:
+        return len(self.is_completed)
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable) -> 'TaskColumns':
+        """Monta as colunas a partir de objetos Task (ex.: instantâneo do repositório)."""
+        tasks = list(tasks)
+        return cls(
+            [task.created_at for task in tasks],
+            [task.completed_at for task in tasks],
+            [bool(task.is_completed) for task in tasks],
+            # Produtividade conta para quem concluiu; sem essa informação, para o dono da tarefa
+            [task.completed_by or task.user or UNKNOWN_USER_LABEL for task in tasks],
+            [task.priority for task in tasks],
+            [task.category or NO_CATEGORY_LABEL for task in tasks],
+        )
+
+    @classmethod
+    def from_dicts(cls, tasks_data: Iterable[Dict]) -> 'TaskColumns':
+        """Monta as colunas a partir dos dicionários de tarefas (formato do tasks.json)."""
+        tasks_data = list(tasks_data)
+        return cls(
+            [task_dict.get('created_at') for task_dict in tasks_data],
+            [task_dict.get('completed_at') for task_dict in tasks_data],
+            [bool(task_dict.get('is_completed')) for task_dict in tasks_data],
+            [task_dict.get('completed_by') or task_dict.get('user') or UNKNOWN_USER_LABEL for task_dict in tasks_data],
+            [task_dict.get('priority') for task_dict in tasks_data],
+            [task_dict.get('category') or NO_CATEGORY_LABEL for task_dict in tasks_data],
+        )
+
+
+def _factorize(values: List[str]) -> Tuple[np.ndarray, List[str]]:
+    codes_by_value: Dict[str, int] = {}
+    codes = [codes_by_value.setdefault(value, len(codes_by_value)) for value in values]
+    return np.array(codes, dtype=np.int64), list(codes_by_value)
+
+
+def _as_priorities(values: List) -> np.ndarray:
+    try:
+        return np.array(values, dtype=np.int64)
+    except (TypeError, ValueError):
+        # Prioridade ausente ou fora do padrão em alguma tarefa: converte uma a uma (0 = sem prioridade)
+        return np.array([_as_priority(value) for value in values], dtype=np.int64)
+
+
+def _as_priority(value) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _parse_timestamps(values: List[Optional[str]]) -> np.ndarray:
+    """Converte datas ISO em datetime64[s] de uma vez; ausentes ou inválidas viram NaT."""
+    # Os 19 primeiros caracteres (AAAA-MM-DDTHH:MM:SS) bastam e evitam frações/fuso na conversão
+    trimmed = [value[:19] if value else None for value in values]
+    try:
+        return np.array(trimmed, dtype='datetime64[s]')
+    except ValueError:
+        # Algum valor fora do padrão: converte um a um só neste caso, descartando os inválidos
+        logger.warning("Datas fora do formato ISO encontradas na análise; valores inválidos serão ignorados.")
+        return np.array([_parse_one_timestamp(value) for value in trimmed], dtype='datetime64[s]')
+
+
+def _parse_one_timestamp(value: Optional[str]):
+    if not value:
+        return None
+    try:
+        return np.datetime64(value, 's')
+    except ValueError:
+        return None
+
+
+def _group_stats(keys: np.ndarray, values_days: np.ndarray, key_labels: Optional[List] = None) -> List[GroupStats]:
+    """Quantidade, mediana, p90 e máximo de `values_days` (>= 0) por chave inteira, sem laço por tarefa.
+
+    Ordena por (chave, valor) uma única vez; os percentis de cada grupo saem por posição.
+    Com `key_labels`, a chave de cada grupo é o rótulo correspondente ao código.
+    """
+    if values_days.size == 0:
+        return []
+    group_keys, group_index = np.unique(keys, return_inverse=True)
+    # Índice do grupo na parte inteira e o valor normalizado na fracionária: uma única ordenação numérica
+    order = np.argsort(group_index + values_days / (values_days.max() + 1.0))
+    sorted_values = values_days[order]
+    counts = np.bincount(group_index, minlength=len(group_keys))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    medians = _sorted_percentile(sorted_values, starts, counts, 0.5)
+    p90s = _sorted_percentile(sorted_values, starts, counts, 0.9)
+    maximums = sorted_values[starts + counts - 1]
+    labels = [key_labels[key] for key in group_keys.tolist()] if key_labels is not None else group_keys.tolist()
+    return [
+        GroupStats(label, int(count), float(median), float(p90), float(maximum))
+        for label, count, median, p90, maximum in zip(labels, counts, medians, p90s, maximums)
+    ]
+
+
+def _sorted_percentile(sorted_values: np.ndarray, starts: np.ndarray, counts: np.ndarray, quantile: float) -> np.ndarray:
+    """Percentil (interpolação linear, como np.percentile) de cada grupo contíguo já ordenado."""
+    positions = starts + quantile * (counts - 1)
+    lower = np.floor(positions).astype(np.int64)
+    upper = np.ceil(positions).astype(np.int64)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (positions - lower)
+
+
+def _overall_stats(values_days: np.ndarray) -> Optional[GroupStats]:
+    stats = _group_stats(np.zeros(values_days.size, dtype=np.int64), values_days)
+    if not stats:
+        return None
+    stats[0].key = None
+    return stats[0]
+
+
+class ProductivityAnalytics:
+    """Indicadores de produtividade calculados de forma vetorizada sobre as colunas das tarefas."""
+    WEEKS_SHOWN = 8 # Semanas exibidas na tabela de concluídas por usuário, incluindo a atual
+
+    @staticmethod
+    def summarize(columns: TaskColumns, now: Optional[datetime] = None) -> ProductivitySummary:
+        started_at = time.perf_counter()
+        now = now or datetime.now()
+        summary = ProductivitySummary(generated_at=now)
+        now_s = np.datetime64(now.replace(microsecond=0), 's')
+
+        summary.total_tasks = len(columns)
+        summary.completed_count = int(np.count_nonzero(columns.is_completed))
+        summary.pending_count = summary.total_tasks - summary.completed_count
+
+        ProductivityAnalytics._weekly_completed(columns, now_s, summary)
+
+        # Tempo de conclusão: só concluídas com as duas datas válidas (e em ordem)
+        lead_seconds = (columns.completed_at - columns.created_at).astype(np.int64)
+        has_lead_time = (columns.is_completed & ~np.isnat(columns.created_at)
+                         & ~np.isnat(columns.completed_at))
+        has_lead_time &= lead_seconds >= 0
+        lead_days = lead_seconds[has_lead_time] / SECONDS_PER_DAY
+        summary.lead_time = _overall_stats(lead_days)
+        summary.lead_time_by_priority = _group_stats(columns.priorities[has_lead_time], lead_days)
+
+        # Backlog: idade das pendentes desde a criação
+        is_backlog = ~columns.is_completed & ~np.isnat(columns.created_at)
+        backlog_days = np.maximum((now_s - columns.created_at[is_backlog]).astype(np.int64), 0) / SECONDS_PER_DAY
+        summary.backlog_age = _overall_stats(backlog_days)
+        summary.backlog_age_by_priority = _group_stats(columns.priorities[is_backlog], backlog_days)
+        summary.backlog_age_by_category = sorted(
+            _group_stats(columns.category_codes[is_backlog], backlog_days, columns.category_names),
+            key=lambda stats: (-stats.count, stats.key)
+        )
+
+        summary.elapsed_s = time.perf_counter() - started_at
+        logger.info(f"Análise de produtividade calculada: {summary.total_tasks} tarefas em {summary.elapsed_s:.3f}s.")
+        return summary
+
+    @staticmethod
+    def _weekly_completed(columns: TaskColumns, now_s: np.datetime64, summary: ProductivitySummary):
+        """Concluídas por usuário em cada uma das últimas WEEKS_SHOWN semanas (segunda a domingo)."""
+        weeks_shown = ProductivityAnalytics.WEEKS_SHOWN
+        # Dias desde 1970-01-01 (uma quinta-feira); +3 alinha o início da semana na segunda-feira
+        current_week = (now_s.astype('datetime64[D]').astype(np.int64) + 3) // 7
+        first_week = current_week - weeks_shown + 1
+        summary.week_starts = [date(1970, 1, 1) + timedelta(days=int(week * 7 - 3))
+                               for week in range(first_week, current_week + 1)]
+
+        has_completion = columns.is_completed & ~np.isnat(columns.completed_at)
+        completion_weeks = (columns.completed_at[has_completion].astype('datetime64[D]').astype(np.int64) + 3) // 7
+        in_window = (completion_weeks >= first_week) & (completion_weeks <= current_week)
+        week_offsets = completion_weeks[in_window] - first_week
+        user_codes = columns.user_codes[has_completion][in_window]
+        if user_codes.size == 0:
+            summary.weekly_totals = [0] * weeks_shown
+            return
+
+        user_ids, user_index = np.unique(user_codes, return_inverse=True)
+        user_names = np.array([columns.user_names[code] for code in user_ids.tolist()], dtype=str)
+        counts = np.bincount(user_index * weeks_shown + week_offsets,
+                             minlength=len(user_names) * weeks_shown).reshape(len(user_names), weeks_shown)
+        totals = counts.sum(axis=1)
+        order = np.lexsort((user_names, -totals)) # Quem mais concluiu primeiro; empate por nome
+        summary.weekly_by_user = [(str(user_names[i]), counts[i].tolist()) for i in order]
+        summary.weekly_totals = counts.sum(axis=0).tolist()
+
+    @staticmethod
+    def format_days(days: Optional[float]) -> str:
+        """Duração legível: horas abaixo de um dia, dias com uma casa decimal acima."""
+        if days is None:
+            return "-"
+        if days < 1:
+            return f"{days * 24:.1f} h"
+        return f"{days:.1f} d"
@@ -0,0 +1,197 @@
+import http.client
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+from urllib.parse import urlencode, urlsplit
+
+from config import logger
+from services import TaskService, _run_write
+from sync_engine import SHARED_DIR_ENV_VAR, ReplicaTaskService, replica_backend
+
+# Com AGENDA_API_URL=http://127.0.0.1:8765 a GUI usa o servidor de api_server.py em vez dos arquivos
+API_URL_ENV_VAR = "AGENDA_API_URL"
+# Segredo compartilhado com o servidor: obrigatório quando ele escuta fora do loopback
+API_TOKEN_ENV_VAR = "AGENDA_API_TOKEN"
+
+
+class ApiClientError(Exception):
+    """Falha de comunicação com o servidor ou resposta de erro (`status` é None se não houve resposta)."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+class TaskApiClient:
+    """Cliente JSON do servidor de api_server.py.
+
+    Mantém uma conexão HTTP/1.1 aberta por thread (keep-alive), reaberta automaticamente
+    se o servidor a encerrou por inatividade.
+    """
+    TIMEOUT_S = 30
+
+    def __init__(self, base_url: str, token: Optional[str] = None):
+        parsed_url = urlsplit(base_url)
+        if parsed_url.scheme != 'http' or not parsed_url.hostname:
+            raise ValueError(f"URL da API inválida: '{base_url}' (esperado http://host:porta).")
+        self.base_url = base_url
+        self.host = parsed_url.hostname
+        self.port = parsed_url.port or 80
+        self.token = token if token is not None else os.environ.get(API_TOKEN_ENV_VAR) or None
+        self._local = threading.local()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = self._local.connection = http.client.HTTPConnection(self.host, self.port, timeout=self.TIMEOUT_S)
+        return connection
+
+    def _drop_connection(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def request(self, method: str, path: str, payload: Optional[Union[Dict, List]] = None) -> Dict:
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8') if payload is not None else None
+        headers = {'Content-Type': 'application/json; charset=utf-8'} if body is not None else {}
+        if self.token:
+            headers['Authorization'] = f"Bearer {self.token}"
+        for attempt in range(2):
+            connection = self._connection()
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+                response_body = response.read()
+                break
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError) as e:
+                # Conexão keep-alive encerrada pelo servidor: tenta uma vez numa conexão nova
+                self._drop_connection()
+                if attempt:
+                    raise ApiClientError(f"Conexão com o servidor perdida ({self.base_url}): {e}") from e
+            except (OSError, http.client.HTTPException) as e:
+                self._drop_connection()
+                raise ApiClientError(f"Servidor indisponível em {self.base_url}: {e}") from e
+        if response.getheader('Connection', "").lower() == 'close':
+            self._drop_connection()
+        try:
+            content = json.loads(response_body.decode('utf-8')) if response_body else {}
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ApiClientError(f"Resposta inválida do servidor: {e}", response.status) from e
+        if response.status >= 400:
+            raise ApiClientError(content.get('error') or f"Erro HTTP {response.status}", response.status)
+        return content
+
+    # --- Rotas ---
+    def health(self) -> Dict:
+        return self.request('GET', '/health')
+
+    def list_tasks(self, **query) -> List[Dict]:
+        query_string = urlencode({name: value for name, value in query.items() if value not in (None, "")})
+        return self.request('GET', '/tasks' + (f"?{query_string}" if query_string else ""))['tasks']
+
+    def replace_tasks(self, tasks: List[Dict]) -> Dict:
+        return self.request('PUT', '/tasks', {'tasks': tasks})
+
+    def add_task(self, task_data: Dict) -> Dict:
+        return self.request('POST', '/tasks', task_data)['task']
+
+    def reserve_task_id(self, count: int = 1) -> str:
+        """Reserva `count` IDs consecutivos no servidor e retorna o primeiro."""
+        return self.request('POST', '/tasks/next-id', {'count': count})['task_id']
+
+    def update_task(self, task_id: str, **fields) -> Dict:
+        return self.request('PATCH', f"/tasks/{task_id}", fields)['task']
+
+    def remove_task(self, task_id: str):
+        self.request('DELETE', f"/tasks/{task_id}")
+
+    def complete_task(self, task_id: str, completed_by: str) -> Dict:
+        return self.request('POST', f"/tasks/{task_id}/complete", {'completed_by': completed_by})['task']
+
+    def reopen_task(self, task_id: str) -> Dict:
+        return self.request('POST', f"/tasks/{task_id}/reopen")['task']
+
+    def batch(self, operations: List[Dict]) -> List[Dict]:
+        """Envia várias operações numa requisição; retorna um resultado ({'ok': ...}) por operação."""
+        return self.request('POST', '/batch', {'operations': operations})['results']
+
+    def generate_report(self, report_type: str, user: Optional[str] = None) -> Optional[str]:
+        """Gera o PDF no servidor e retorna o caminho do arquivo (na máquina do servidor)."""
+        return self.request('POST', '/reports', {'type': report_type, 'user': user})['path']
+
+
+class RemoteTaskService:
+    """Mesma interface de TaskService usada pela GUI, mas com o servidor como dono dos dados.
+
+    `save_tasks` recebe a lista completa (como TaskService) e envia apenas a diferença em
+    relação ao último estado sincronizado, num único /batch.
+    """
+
+    def __init__(self, client: TaskApiClient):
+        self.client = client
+        self._synced: Dict[str, Dict] = {}
+        self._synced_lock = threading.Lock()
+
+    def load_tasks(self) -> List[Dict]:
+        tasks = self.client.list_tasks()
+        with self._synced_lock:
+            # Cópias: quem chamou pode alterar os dicts devolvidos, e a diferença precisa enxergar isso
+            self._synced = {str(task_dict['task_id']): dict(task_dict) for task_dict in tasks}
+        logger.info(f"Tarefas carregadas do servidor {self.client.base_url}: {len(tasks)} registros.")
+        return tasks
+
+    def save_tasks(self, tasks: List[Dict]) -> None:
+        with self._synced_lock:
+            current = {str(task_dict['task_id']): task_dict for task_dict in tasks}
+            operations = [{'op': 'upsert', 'task': task_dict} for task_id, task_dict in current.items()
+                          if self._synced.get(task_id) != task_dict]
+            operations += [{'op': 'remove', 'task_id': task_id} for task_id in self._synced if task_id not in current]
+            if not operations:
+                return
+            results = self.client.batch(operations)
+            failures = []
+            for operation, result in zip(operations, results):
+                task_id = str(operation['task']['task_id']) if operation['op'] == 'upsert' else operation['task_id']
+                if result.get('ok'):
+                    if operation['op'] == 'upsert':
+                        self._synced[task_id] = dict(operation['task'])
+                    else:
+                        self._synced.pop(task_id, None)
+                elif operation['op'] == 'remove' and result.get('status') == 404:
+                    self._synced.pop(task_id, None) # Já removida por outro cliente
+                else:
+                    failures.append(f"{task_id}: {result.get('error')}")
+        logger.info(f"{len(operations) - len(failures)} alteração(ões) de tarefas enviadas ao servidor.")
+        if failures:
+            raise ApiClientError(f"{len(failures)} alteração(ões) recusada(s) pelo servidor: {'; '.join(failures[:5])}")
+
+    async def load_tasks_async(self) -> List[Dict]:
+        return await _run_write(self.load_tasks) # Depois das alterações ainda na fila de envio
+
+    async def save_tasks_async(self, tasks: List[Dict]) -> None:
+        await _run_write(self.save_tasks, tasks)
+
+    def get_next_task_id(self) -> str:
+        # Reservado no servidor: dois clientes nunca recebem o mesmo ID
+        return self.client.reserve_task_id()
+
+    def reserve_task_ids(self, count: int) -> int:
+        return int(self.client.reserve_task_id(count))
+
+
+_remote_service: Optional[RemoteTaskService] = None
+
+def task_backend() -> Union[type, RemoteTaskService, ReplicaTaskService]:
+    """TaskService (arquivos locais), RemoteTaskService (AGENDA_API_URL) ou ReplicaTaskService (AGENDA_SHARED_DIR)."""
+    global _remote_service
+    api_url = os.getenv(API_URL_ENV_VAR, "").strip()
+    if not api_url:
+        shared_dir = os.getenv(SHARED_DIR_ENV_VAR, "").strip()
+        return replica_backend(Path(shared_dir)) if shared_dir else TaskService
+    if _remote_service is None or _remote_service.client.base_url != api_url:
+        _remote_service = RemoteTaskService(TaskApiClient(api_url))
+        logger.info(f"Usando o servidor de tarefas em {api_url}.")
+    return _remote_service
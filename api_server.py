@@ -0,0 +1,455 @@
+"""Servidor HTTP local (JSON) que mantém as tarefas e os usuários em memória.
+
+Uso:
+    python api_server.py                       # 127.0.0.1:8765
+    AGENDA_API_TOKEN=segredo python api_server.py --host 0.0.0.0 --porta 9000
+
+Com AGENDA_API_TOKEN definido, toda requisição precisa do cabeçalho "Authorization: Bearer <token>"
+(os clientes com a mesma variável já o enviam). Sem token o servidor só escuta no loopback.
+
+Um único processo passa a ser o dono dos arquivos de dados: os clientes (AGENDA_API_URL, ver
+api_client.py) deixam de reler e regravar o tasks.json inteiro a cada mudança. As conexões
+HTTP/1.1 são mantidas abertas (keep-alive) e /batch aplica várias operações numa requisição.
+
+Rotas:
+    GET    /health                         estado do servidor
+    GET    /tasks?q=&status=&user=&category=&priority=
+    PUT    /tasks                          substitui todas as tarefas {"tasks": [...]}
+    POST   /tasks                          cria uma tarefa (ID reservado pelo servidor se ausente)
+    POST   /tasks/next-id                  reserva o próximo ID numérico ({"count": n} reserva um bloco)
+    GET    /tasks/<id>
+    PATCH  /tasks/<id>                     altera campos {"description": ..., "priority": ...}
+    DELETE /tasks/<id>
+    POST   /tasks/<id>/complete            {"completed_by": "usuario"}
+    POST   /tasks/<id>/reopen
+    POST   /batch                          {"operations": [{"op": "upsert"|"add"|"update"|"remove"|"complete"|"reopen", ...}]}
+    GET    /users                          usuários (sem o hash da senha)
+    POST   /login                          {"username": ..., "password": ...}
+    POST   /reports                        {"type": "pending"|"completed"|"analytics", "user": opcional}
+"""
+import argparse
+import asyncio
+import hmac
+import ipaddress
+import json
+import os
+import signal
+import sys
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from api_client import API_TOKEN_ENV_VAR
+from config import Config, logger, init_app, HAS_NUMPY
+from metrics import Metrics
+from models import Task
+from repository import TaskRepository, EVENT_RESET, EVENT_REMOVED
+from services import TaskService, UserService
+from task_filter import TaskFilter, TaskFilterCriteria, STATUS_ALL, STATUS_PENDING, STATUS_COMPLETED
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+KEEP_ALIVE_TIMEOUT_S = 60
+MAX_BODY_BYTES = 64 * 1024 * 1024
+SAVE_DELAY_S = 0.5 # Agrupa as mudanças próximas numa única gravação do tasks.json
+
+HTTP_REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found",
+                405: "Method Not Allowed", 409: "Conflict", 413: "Payload Too Large", 500: "Internal Server Error",
+                501: "Not Implemented", 503: "Service Unavailable"}
+EDITABLE_FIELDS = ('description', 'user', 'priority', 'category', 'created_at', 'completed_at', 'completed_by',
+                   'due_at', 'remind_at')
+
+
+class ApiError(Exception):
+    """Erro de requisição: vira uma resposta HTTP com `status` e a mensagem em {"error": ...}."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class TaskStore:
+    """Tarefas e usuários em memória. Só é acessado pela thread do loop asyncio, então dispensa locks."""
+
+    def __init__(self):
+        self.repository = TaskRepository()
+        self.task_filter = TaskFilter()
+        self.users: Dict[str, Dict] = {}
+        self.version = 0 # Incrementada a cada mudança; os clientes podem usá-la para saber se estão em dia
+        self._next_id = 1
+        self._save_handle: Optional[asyncio.TimerHandle] = None
+        self._pending_save: Optional[asyncio.Task] = None
+        self.repository.subscribe(self._on_repository_changed)
+
+    def load(self):
+        self.users = UserService.load_users()
+        self.repository.reset(Task.from_dict(task_dict) for task_dict in TaskService.load_tasks())
+        self._next_id = self._highest_numeric_id() + 1
+        logger.info(f"Servidor: {len(self.repository)} tarefas e {len(self.users)} usuários em memória.")
+
+    def _highest_numeric_id(self) -> int:
+        return max((int(task.task_id) for task in self.repository if task.task_id.isdigit()), default=0)
+
+    def _on_repository_changed(self, event: str, tasks: List[Task]):
+        if event == EVENT_RESET:
+            self.task_filter.reset(self.repository)
+            return # Carga inicial ou replace_all, que cuida da versão e da gravação
+        if event == EVENT_REMOVED:
+            self.task_filter.forget(task.task_id for task in tasks)
+        else:
+            self.task_filter.update(tasks)
+        self.version += 1
+        self._schedule_save()
+        for task in tasks:
+            if task.task_id.isdigit():
+                self._next_id = max(self._next_id, int(task.task_id) + 1)
+
+    # --- Persistência ---
+    def _schedule_save(self):
+        if self._save_handle is None:
+            self._save_handle = asyncio.get_running_loop().call_later(SAVE_DELAY_S, self._start_save)
+
+    def _start_save(self):
+        self._save_handle = None
+        # O instantâneo é tirado no loop; a gravação roda no executor de escrita, na ordem dos pedidos
+        self._pending_save = asyncio.ensure_future(TaskService.save_tasks_async(self.repository.to_dicts()))
+        self._pending_save.add_done_callback(self._on_save_done)
+
+    @staticmethod
+    def _on_save_done(save_future: asyncio.Future):
+        # Os dados continuam na memória: a próxima alteração (ou o encerramento) tenta gravar de novo
+        if not save_future.cancelled() and save_future.exception() is not None:
+            logger.error(f"Erro ao gravar as tarefas do servidor: {save_future.exception()}")
+
+    async def flush(self):
+        """Grava imediatamente as mudanças pendentes (usado ao encerrar o servidor)."""
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._start_save()
+        if self._pending_save is not None:
+            await self._pending_save
+
+    # --- Operações ---
+    def reserve_task_id(self, count: int = 1) -> str:
+        """Reserva `count` IDs consecutivos e retorna o primeiro."""
+        if not isinstance(count, int) or count < 1:
+            raise ApiError(400, f"Quantidade de IDs inválida: {count!r}.")
+        task_id = str(self._next_id)
+        self._next_id += count
+        return task_id
+
+    def get(self, task_id: str) -> Task:
+        task = self.repository.get(task_id)
+        if task is None:
+            raise ApiError(404, f"Tarefa '{task_id}' não encontrada.")
+        return task
+
+    def query(self, params: Dict[str, str]) -> List[Task]:
+        status = params.get('status', STATUS_ALL)
+        if status not in (STATUS_ALL, STATUS_PENDING, STATUS_COMPLETED):
+            raise ApiError(400, f"Status inválido: '{status}'.")
+        priority = params.get('priority')
+        if priority is not None and not priority.isdigit():
+            raise ApiError(400, f"Prioridade inválida: '{priority}'.")
+        criteria = TaskFilterCriteria(text=params.get('q', ""), category=params.get('category'), user=params.get('user'),
+                                      priority=int(priority) if priority else None, status=status)
+        visible_ids = self.task_filter.apply(criteria)
+        if visible_ids is None:
+            return list(self.repository)
+        return [task for task in self.repository if task.task_id in visible_ids]
+
+    def add(self, task_data: Dict) -> Task:
+        task_data = self._validated(task_data)
+        if not task_data.get('task_id'):
+            task_data['task_id'] = self.reserve_task_id()
+        if str(task_data['task_id']) in self.repository:
+            raise ApiError(409, f"Já existe uma tarefa com o ID '{task_data['task_id']}'.")
+        return self.repository.add(Task.from_dict(task_data))
+
+    def update(self, task_id: str, fields: Dict) -> Task:
+        if not isinstance(fields, dict):
+            raise ApiError(400, "Os campos a alterar devem ser um objeto JSON.")
+        current = self.get(task_id)
+        unknown_fields = [field_name for field_name in fields if field_name not in EDITABLE_FIELDS]
+        if unknown_fields:
+            raise ApiError(400, f"Campos não editáveis: {', '.join(unknown_fields)}.")
+        self._validated({**current.to_dict(), **fields})
+        return self.repository.update(task_id, **fields)
+
+    def upsert(self, task_data: Dict) -> Task:
+        """Cria a tarefa ou alinha a existente com `task_data` (inclusive o estado concluída/pendente)."""
+        task_data = self._validated(task_data)
+        task_id = str(task_data.get('task_id') or "")
+        existing = self.repository.get(task_id) if task_id else None
+        if existing is None:
+            return self.add(task_data)
+        wants_completed = bool(task_data.get('is_completed'))
+        if wants_completed and not existing.is_completed:
+            self.repository.complete(task_id, task_data.get('completed_by') or "")
+        elif not wants_completed and existing.is_completed:
+            self.repository.reopen(task_id)
+        return self.repository.update(task_id, **{field_name: task_data[field_name]
+                                                  for field_name in EDITABLE_FIELDS if field_name in task_data})
+
+    def remove(self, task_id: str) -> Task:
+        self.get(task_id)
+        return self.repository.remove(task_id)
+
+    def complete(self, task_id: str, completed_by: str) -> Task:
+        self.get(task_id)
+        return self.repository.complete(task_id, completed_by)
+
+    def reopen(self, task_id: str) -> Task:
+        self.get(task_id)
+        return self.repository.reopen(task_id)
+
+    def replace_all(self, tasks_data: List[Dict]):
+        tasks = [Task.from_dict(self._validated(task_data)) for task_data in tasks_data]
+        self.repository.reset(tasks)
+        self._next_id = max(self._next_id, self._highest_numeric_id() + 1) # IDs já reservados não voltam a ser entregues
+        self.version += 1
+        self._schedule_save()
+
+    @staticmethod
+    def _validated(task_data: Dict) -> Dict:
+        if not isinstance(task_data, dict):
+            raise ApiError(400, "A tarefa deve ser um objeto JSON.")
+        validation_error = TaskService.validate_task_fields(str(task_data.get('description') or "").strip(),
+                                                            str(task_data.get('category') or ""), task_data.get('priority', 1),
+                                                            task_data.get('due_at'), task_data.get('remind_at'))
+        if validation_error:
+            raise ApiError(400, validation_error)
+        return dict(task_data)
+
+
+class ApiServer:
+    """Servidor HTTP/1.1 mínimo sobre asyncio.start_server, com keep-alive e corpo limitado por Content-Length."""
+
+    def __init__(self, store: TaskStore, token: Optional[str] = None):
+        self.store = store
+        self.token = token
+
+    def _authorized(self, headers: Dict[str, str]) -> bool:
+        if self.token is None:
+            return True
+        return hmac.compare_digest(headers.get('authorization', "").encode('utf-8'), f"Bearer {self.token}".encode('utf-8'))
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await asyncio.wait_for(reader.readline(), KEEP_ALIVE_TIMEOUT_S)
+                if not request_line.strip():
+                    break
+                try:
+                    method, target, http_version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self._write_response(writer, 400, {'error': "Linha de requisição inválida."}, keep_alive=False)
+                    break
+                headers = await self._read_headers(reader)
+                keep_alive = (headers.get('connection', "").lower() != 'close' if http_version == 'HTTP/1.1'
+                              else headers.get('connection', "").lower() == 'keep-alive')
+                if 'transfer-encoding' in headers:
+                    await self._write_response(writer, 501, {'error': "Use Content-Length (sem chunked)."}, keep_alive=False)
+                    break
+                content_length = int(headers.get('content-length') or 0)
+                if content_length > MAX_BODY_BYTES:
+                    await self._write_response(writer, 413, {'error': "Corpo da requisição grande demais."}, keep_alive=False)
+                    break
+                body = await reader.readexactly(content_length) if content_length else b""
+                if self._authorized(headers):
+                    status, payload = await self.dispatch(method.upper(), target, body)
+                else:
+                    status, payload = 401, {'error': f"Token ausente ou inválido (defina {API_TOKEN_ENV_VAR} no cliente)."}
+                await self._write_response(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass # Conexão ociosa, encerrada pelo cliente ou com cabeçalhos inválidos
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_headers(reader: asyncio.StreamReader) -> Dict[str, str]:
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                return headers
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+    @staticmethod
+    async def _write_response(writer: asyncio.StreamWriter, status: int, payload: Dict, keep_alive: bool):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        head = (f"HTTP/1.1 {status} {HTTP_REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+    async def dispatch(self, method: str, target: str, body: bytes) -> Tuple[int, Dict]:
+        url = urlsplit(target)
+        parts = [unquote(part) for part in url.path.strip('/').split('/') if part]
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        route_name = "/".join("<id>" if index == 1 and part != "next-id" else part for index, part in enumerate(parts))
+        try:
+            payload = json.loads(body.decode('utf-8')) if body else {}
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            return 400, {'error': f"JSON inválido: {e}"}
+        if not isinstance(payload, dict):
+            return 400, {'error': "O corpo da requisição deve ser um objeto JSON."}
+        try:
+            with Metrics.timer(f"api.{method} /{route_name}"):
+                return await self._route(method, parts, params, payload)
+        except ApiError as e:
+            return e.status, {'error': str(e)}
+        except Exception as e:
+            logger.error(f"Erro inesperado em {method} {target}: {e}", exc_info=True)
+            return 500, {'error': "Erro interno do servidor. Verifique o log."}
+
+    async def _route(self, method: str, parts: List[str], params: Dict[str, str], payload) -> Tuple[int, Dict]:
+        store = self.store
+        if parts == ['health'] and method == 'GET':
+            return 200, {'status': "ok", 'app': Config.APP_NAME, 'version': Config.VERSION,
+                         'tasks': len(store.repository), 'data_version': store.version}
+        if parts == ['tasks']:
+            if method == 'GET':
+                return 200, {'tasks': [task.to_dict() for task in store.query(params)], 'version': store.version}
+            if method == 'POST':
+                return 201, {'task': store.add(payload).to_dict(), 'version': store.version}
+            if method == 'PUT':
+                store.replace_all(payload.get('tasks', []))
+                return 200, {'count': len(store.repository), 'version': store.version}
+        elif parts == ['tasks', 'next-id'] and method == 'POST':
+            return 200, {'task_id': store.reserve_task_id(payload.get('count', 1))}
+        elif len(parts) == 2 and parts[0] == 'tasks':
+            task_id = parts[1]
+            if method == 'GET':
+                return 200, {'task': store.get(task_id).to_dict()}
+            if method == 'PATCH':
+                return 200, {'task': store.update(task_id, payload).to_dict(), 'version': store.version}
+            if method == 'DELETE':
+                store.remove(task_id)
+                return 200, {'removed': task_id, 'version': store.version}
+        elif len(parts) == 3 and parts[0] == 'tasks' and method == 'POST':
+            if parts[2] == 'complete':
+                return 200, {'task': store.complete(parts[1], payload.get('completed_by') or "").to_dict(), 'version': store.version}
+            if parts[2] == 'reopen':
+                return 200, {'task': store.reopen(parts[1]).to_dict(), 'version': store.version}
+        elif parts == ['batch'] and method == 'POST':
+            return 200, {'results': [self._run_operation(operation) for operation in payload.get('operations', [])],
+                         'version': store.version}
+        elif parts == ['users'] and method == 'GET':
+            return 200, {'users': [{'username': username, 'level': user_data.get('level'), 'email': user_data.get('email', "")}
+                                   for username, user_data in sorted(store.users.items())]}
+        elif parts == ['login'] and method == 'POST':
+            user_data = store.users.get(payload.get('username') or "")
+            if user_data is None or not UserService.verify_password(user_data.get('password_hash', ""), payload.get('password') or ""):
+                raise ApiError(401, "Usuário ou senha incorretos.")
+            return 200, {'username': payload['username'], 'level': user_data.get('level')}
+        elif parts == ['reports'] and method == 'POST':
+            return 200, await self._generate_report(payload)
+        else:
+            raise ApiError(404, f"Rota não encontrada: /{'/'.join(parts)}")
+        raise ApiError(405, f"Método {method} não suportado em /{'/'.join(parts)}")
+
+    def _run_operation(self, operation: Dict) -> Dict:
+        """Executa uma operação do lote; o erro de uma não impede as seguintes."""
+        store = self.store
+        try:
+            op = operation.get('op')
+            if op == 'upsert':
+                task = store.upsert(operation.get('task'))
+            elif op == 'add':
+                task = store.add(operation.get('task'))
+            elif op == 'update':
+                task = store.update(str(operation.get('task_id')), operation.get('fields') or {})
+            elif op == 'remove':
+                task = store.remove(str(operation.get('task_id')))
+            elif op == 'complete':
+                task = store.complete(str(operation.get('task_id')), operation.get('completed_by') or "")
+            elif op == 'reopen':
+                task = store.reopen(str(operation.get('task_id')))
+            else:
+                raise ApiError(400, f"Operação desconhecida: '{op}'.")
+            return {'ok': True, 'task': task.to_dict()}
+        except ApiError as e:
+            return {'ok': False, 'status': e.status, 'error': str(e)}
+        except (AttributeError, TypeError) as e:
+            return {'ok': False, 'status': 400, 'error': str(e)}
+
+    async def _generate_report(self, payload: Dict) -> Dict:
+        report_type = payload.get('type')
+        tasks_data = [task.to_dict() for task in self.store.repository
+                      if not payload.get('user') or task.user == payload['user']]
+        if report_type == 'analytics':
+            if not HAS_NUMPY:
+                raise ApiError(503, "A análise de produtividade requer a biblioteca NumPy no servidor.")
+            from analytics import ProductivityAnalytics, TaskColumns
+            from utils import PDFGenerator
+            summary = await asyncio.to_thread(lambda: ProductivityAnalytics.summarize(TaskColumns.from_dicts(tasks_data)))
+            return {'path': await asyncio.to_thread(PDFGenerator.generate_analytics_report, summary)}
+        if report_type not in (STATUS_PENDING, STATUS_COMPLETED):
+            raise ApiError(400, f"Tipo de relatório inválido: '{report_type}'.")
+        wants_completed = report_type == STATUS_COMPLETED
+        tasks_data = [task_dict for task_dict in tasks_data if bool(task_dict['is_completed']) == wants_completed]
+        if not tasks_data:
+            return {'path': None}
+        from utils import PDFGenerator
+        return {'path': await asyncio.to_thread(PDFGenerator.generate_task_report, tasks_data, report_type)}
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+async def serve(host: str, port: int, token: Optional[str] = None):
+    store = TaskStore()
+    await asyncio.to_thread(store.load)
+    api_server = ApiServer(store, token)
+    server = await asyncio.start_server(api_server.handle_connection, host, port)
+    logger.info(f"Servidor de API do {Config.APP_NAME} ouvindo em http://{host}:{port}")
+    print(f"Servidor ouvindo em http://{host}:{port} (Ctrl+C para encerrar)")
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signal_number, stop_event.set)
+        except (NotImplementedError, RuntimeError):
+            pass # Windows: o Ctrl+C chega como KeyboardInterrupt
+    try:
+        await stop_event.wait()
+    finally:
+        server.close()
+        await server.wait_closed()
+        await store.flush()
+        logger.info("Servidor de API encerrado; tarefas gravadas.")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=f"Servidor HTTP local (JSON) do {Config.APP_NAME}.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Endereço de escuta (padrão: {DEFAULT_HOST}).")
+    parser.add_argument("--porta", type=int, default=DEFAULT_PORT, help=f"Porta (padrão: {DEFAULT_PORT}).")
+    args = parser.parse_args(argv)
+    # Pela variável de ambiente, não por argumento: a linha de comando fica visível para os outros usuários
+    token = os.environ.get(API_TOKEN_ENV_VAR) or None
+    if token is None and not _is_loopback(args.host):
+        print(f"Nenhuma rota exige login: para escutar em {args.host} defina {API_TOKEN_ENV_VAR} "
+              f"no servidor e nos clientes.", file=sys.stderr)
+        return 2
+    init_app()
+    try:
+        asyncio.run(serve(args.host, args.porta, token))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+import sys
+import threading
+import weakref
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from config import Config, logger, HAS_PIL
+
+if TYPE_CHECKING:
+    import tkinter as tk
+    from fpdf import FPDF
+
+ImageSize = Optional[Tuple[int, int]]
+
+
+class AssetCache:
+    """Cache de imagens compartilhado pelo processo inteiro (janelas e relatórios).
+
+    Cada arquivo é decodificado uma única vez e guardado pronto para uso:
+    - PDF: o resultado da leitura do PNG pelo FPDF (dados já comprimidos + máscara alfa),
+      inserido direto em cada documento novo;
+    - Tk: a imagem decodificada pelo PIL (por tamanho) e um PhotoImage por interpretador Tk,
+      já que um PhotoImage só vale no interpretador em que foi criado.
+    Falhas também ficam em cache (como None), para não repetir a tentativa nem o aviso no log.
+    """
+    _lock = threading.Lock()
+    _pdf_images: Dict[str, Optional[Dict[str, Any]]] = {}
+    _decoded_images: Dict[Tuple[str, ImageSize], Any] = {} # Imagens PIL
+    # Tk raiz -> {(caminho, tamanho): PhotoImage}; some junto com a janela raiz
+    _photo_images: 'weakref.WeakKeyDictionary[tk.Tk, Dict[Tuple[str, ImageSize], Any]]' = weakref.WeakKeyDictionary()
+
+    # --- PDF ---
+    @staticmethod
+    def _pdf_image_info(image_path: Path) -> Optional[Dict[str, Any]]:
+        path_str = str(image_path)
+        with AssetCache._lock:
+            if path_str in AssetCache._pdf_images:
+                return AssetCache._pdf_images[path_str]
+            info = None
+            try:
+                from fpdf import FPDF
+                # Usa a própria leitura do FPDF num documento descartável: o resultado é o que ele embutiria
+                probe_pdf = FPDF()
+                probe_pdf.add_page()
+                probe_pdf.image(path_str, x=0, y=0, w=1)
+                info = dict(probe_pdf.images[path_str])
+                info.pop('i', None)
+                info.pop('n', None)
+            except Exception as e:
+                logger.warning(f"Não foi possível preparar a imagem {image_path} para PDF: {e}")
+            AssetCache._pdf_images[path_str] = info
+            return info
+
+    @staticmethod
+    def embed_in_pdf(pdf: 'FPDF', image_path: Path, x: float, y: float, w: float) -> bool:
+        """Desenha a imagem no PDF reaproveitando a versão já decodificada. Retorna False se não for possível."""
+        info = AssetCache._pdf_image_info(image_path)
+        if info is None:
+            return False
+        path_str = str(image_path)
+        if path_str not in pdf.images:
+            # Cópia por documento: o FPDF grava nela o número do objeto ao montar o arquivo
+            pdf.images[path_str] = dict(info, i=len(pdf.images) + 1)
+        pdf.image(path_str, x=x, y=y, w=w)
+        return True
+
+    # --- Tk ---
+    @staticmethod
+    def _decoded_image(image_path: Path, size: ImageSize):
+        key = (str(image_path), size)
+        with AssetCache._lock:
+            if key in AssetCache._decoded_images:
+                return AssetCache._decoded_images[key]
+        image = None
+        try:
+            from PIL import Image
+            with Image.open(image_path) as source_image:
+                source_image.load()
+                image = source_image.resize(size, Image.Resampling.LANCZOS) if size else source_image.copy()
+        except Exception as e:
+            logger.warning(f"Não foi possível carregar a imagem {image_path}: {e}")
+        with AssetCache._lock:
+            AssetCache._decoded_images[key] = image
+        return image
+
+    @staticmethod
+    def photo_image(image_path: Optional[Path], master: 'tk.Misc', size: ImageSize = None):
+        """Retorna um PhotoImage da imagem para o interpretador Tk de `master` (ou None se indisponível)."""
+        if not image_path or not Path(image_path).exists():
+            return None
+        root = master._root()
+        key = (str(image_path), size)
+        photos_for_root = AssetCache._photo_images.setdefault(root, {})
+        if key not in photos_for_root:
+            photos_for_root[key] = AssetCache._create_photo_image(Path(image_path), root, size)
+        return photos_for_root[key]
+
+    @staticmethod
+    def _create_photo_image(image_path: Path, root: 'tk.Tk', size: ImageSize):
+        if HAS_PIL:
+            image = AssetCache._decoded_image(image_path, size)
+            if image is None:
+                return None
+            from PIL import ImageTk
+            return ImageTk.PhotoImage(image, master=root)
+        import tkinter as tk
+        try:
+            # Sem PIL: o Tk lê PNG/GIF nativamente, mas no tamanho original
+            return tk.PhotoImage(file=str(image_path), master=root)
+        except tk.TclError as e:
+            logger.warning(f"Erro ao carregar PhotoImage para {image_path}: {e}")
+            return None
+
+    @staticmethod
+    def apply_window_icon(window: 'tk.Misc', icon_path: Optional[Path] = None):
+        """Aplica o ícone (padrão: Config.ICON_PATH) a uma janela, usando a imagem já decodificada."""
+        icon_path = icon_path if icon_path and Path(icon_path).exists() else Config.ICON_PATH
+        if not icon_path or not Path(icon_path).exists():
+            return
+        try:
+            if sys.platform == "win32":
+                window.iconbitmap(str(icon_path)) # Windows usa o .ico diretamente, sem decodificar
+                return
+            photo = AssetCache.photo_image(icon_path, window, size=(32, 32))
+            if photo is not None:
+                window.iconphoto(False, photo)
+        except Exception as e:
+            logger.warning(f"Não foi possível aplicar o ícone {icon_path}: {e}")
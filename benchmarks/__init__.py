@@ -0,0 +1 @@
+"""Benchmarks e gerador de dados sintéticos (execute a partir da raiz do projeto)."""
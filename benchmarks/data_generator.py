@@ -0,0 +1,119 @@
+"""Gerador de dados sintéticos (tasks.json / users.json) para os benchmarks.
+
+Uso isolado, para inspecionar ou reaproveitar um conjunto de dados:
+    python -m benchmarks.data_generator 10k --destino /tmp/agenda_10k
+"""
+import argparse
+import json
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from services import UserService
+
+# Tamanhos padrão dos conjuntos de dados
+DATASET_SIZES = {'1k': 1_000, '10k': 10_000, '100k': 100_000, '1M': 1_000_000}
+
+CATEGORY_WEIGHTS = [
+    ("Geral", 30), ("Financeiro", 15), ("TI", 15), ("Atendimento", 12), ("Compras", 8),
+    ("RH", 6), ("Jurídico", 4), ("", 10), # Tarefas sem categoria também existem na prática
+]
+PRIORITY_WEIGHTS = [(1, 50), (2, 35), (3, 15)]
+DESCRIPTION_WORDS = (
+    "verificar enviar conferir atualizar cadastro cliente contrato relatório pagamento boleto "
+    "reunião planilha sistema acesso senha impressora servidor backup fornecedor pedido nota "
+    "fiscal prazo documento aprovação orçamento chamado suporte treinamento agenda retorno "
+    "ligação proposta revisão conta cartão limite renegociação cobrança"
+).split()
+HISTORY_DAYS = 365
+COMPLETED_SHARE = 0.65
+
+
+def parse_size(size_text: str) -> int:
+    """'10k' -> 10000; também aceita números simples."""
+    if size_text in DATASET_SIZES:
+        return DATASET_SIZES[size_text]
+    multiplier = {'k': 1_000, 'm': 1_000_000}.get(size_text[-1:].lower(), 1)
+    return int(float(size_text[:-1] if multiplier > 1 else size_text) * multiplier)
+
+
+def generate_users(user_count: int) -> Dict[str, Dict]:
+    """Usuários no formato do users.json; o primeiro é o admin. Senha de todos: 'bench123'."""
+    password_hash = UserService.hash_password("bench123")
+    users = {'admin': {'password_hash': password_hash, 'level': 'admin', 'email': 'admin@example.com'}}
+    for user_index in range(1, user_count):
+        username = f"usuario{user_index:03d}"
+        users[username] = {'password_hash': password_hash, 'level': 'operador', 'email': f"{username}@example.com"}
+    return users
+
+
+def generate_tasks(task_count: int, usernames: List[str], seed: int = 42,
+                   now: Optional[datetime] = None) -> List[Dict]:
+    """Tarefas no formato do tasks.json, com distribuição realista e reproduzível (mesma semente, mesmos dados).
+
+    Poucos usuários concentram a maior parte das tarefas; tarefas antigas têm mais chance de estarem
+    concluídas; o tempo até a conclusão varia de minutos a semanas (distribuição log-normal).
+    """
+    rng = random.Random(seed)
+    now = now or datetime.now().replace(microsecond=0)
+    user_weights = [1.0 / (rank + 1) for rank in range(len(usernames))] # Distribuição de Zipf
+    categories, category_weights = zip(*CATEGORY_WEIGHTS)
+    priorities, priority_weights = zip(*PRIORITY_WEIGHTS)
+
+    owners = rng.choices(usernames, weights=user_weights, k=task_count)
+    task_categories = rng.choices(categories, weights=category_weights, k=task_count)
+    task_priorities = rng.choices(priorities, weights=priority_weights, k=task_count)
+    # Tarefas mais recentes são mais frequentes (o volume cresce com o tempo)
+    ages_s = sorted((int(HISTORY_DAYS * 86400 * (1 - rng.random() ** 0.5)) for _ in range(task_count)), reverse=True)
+
+    tasks = []
+    for task_index in range(task_count):
+        created_at = now - timedelta(seconds=ages_s[task_index])
+        age_share = ages_s[task_index] / (HISTORY_DAYS * 86400)
+        is_completed = rng.random() < min(0.98, COMPLETED_SHARE * 0.5 + age_share)
+        completed_at = completed_by = None
+        if is_completed:
+            lead_time_s = min(rng.lognormvariate(11, 1.5), ages_s[task_index]) # Mediana ~17 h
+            completed_at = (created_at + timedelta(seconds=lead_time_s)).isoformat()
+            completed_by = owners[task_index] if rng.random() < 0.8 else rng.choice(usernames)
+        tasks.append({
+            'task_id': str(task_index + 1),
+            'description': " ".join(rng.choices(DESCRIPTION_WORDS, k=rng.randint(3, 25))).capitalize(),
+            'user': owners[task_index],
+            'is_completed': is_completed,
+            'created_at': created_at.isoformat(),
+            'completed_at': completed_at,
+            'completed_by': completed_by,
+            'priority': task_priorities[task_index],
+            'category': task_categories[task_index],
+        })
+    return tasks
+
+
+def user_count_for(task_count: int) -> int:
+    """Quantidade de usuários proporcional ao volume (5 a 200)."""
+    return max(5, min(200, task_count // 2000))
+
+
+def write_dataset(target_dir: Path, task_count: int, seed: int = 42) -> Dict[str, Path]:
+    """Grava users.json e tasks.json em `target_dir` (no mesmo formato dos arquivos da aplicação)."""
+    target_dir.mkdir(parents=True, exist_ok=True)
+    users = generate_users(user_count_for(task_count))
+    tasks = generate_tasks(task_count, list(users), seed=seed)
+    users_path, tasks_path = target_dir / 'users.json', target_dir / 'tasks.json'
+    with open(users_path, 'w', encoding='utf-8') as f:
+        json.dump(users, f, indent=4, ensure_ascii=False)
+    with open(tasks_path, 'w', encoding='utf-8') as f:
+        json.dump(tasks, f, indent=4, ensure_ascii=False) # Mesmo formato gravado por TaskService.save_tasks
+    return {'users': users_path, 'tasks': tasks_path}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gera tasks.json/users.json sintéticos para benchmarks.")
+    parser.add_argument("tamanho", help=f"Quantidade de tarefas ({', '.join(DATASET_SIZES)} ou um número).")
+    parser.add_argument("--destino", type=Path, required=True, help="Diretório onde gravar os arquivos.")
+    parser.add_argument("--semente", type=int, default=42)
+    args = parser.parse_args()
+    paths = write_dataset(args.destino, parse_size(args.tamanho), seed=args.semente)
+    print(f"Gerado: {paths['tasks']} e {paths['users']}")
@@ -0,0 +1,214 @@
+"""Benchmarks das camadas de serviço, modelo e relatório, com comparação contra uma linha de base.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.run_benchmarks                          # 1k, 10k e 100k
+    python -m benchmarks.run_benchmarks --tamanhos 1k,10k,100k,1M --repeticoes 5
+    python -m benchmarks.run_benchmarks --salvar-baseline        # grava o resultado como linha de base
+
+Os dados sintéticos são gravados num diretório temporário: os arquivos reais da aplicação
+não são lidos nem alterados. Cada resultado vai para benchmarks/results/ em JSON e, se houver
+linha de base, é comparado com ela; operações acima do limite de tolerância são marcadas.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from config import Config
+from models import Task
+from services import TaskService
+from utils import PDFGenerator
+
+from benchmarks.data_generator import DATASET_SIZES, parse_size, write_dataset
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+RESULTS_DIR = BENCHMARKS_DIR / "results"
+DEFAULT_BASELINE_PATH = BENCHMARKS_DIR / "baseline.json"
+DEFAULT_SIZES = "1k,10k,100k"
+DEFAULT_PDF_MAX_TASKS = 10_000 # Relatórios PDF maiores levam minutos; aumente com --pdf-max
+REGRESSION_MIN_DELTA_S = 0.001 # Diferenças menores que isso são ruído, mesmo em porcentagem alta
+BATCH_OPERATION_SIZE = 50 # Tarefas por chamada no benchmark das operações em lote
+
+
+def _measure(func: Callable[[], object], repeats: int, before_each: Optional[Callable[[], None]] = None,
+             warmup: bool = False) -> Dict:
+    """Executa `func` `repeats` vezes e retorna os tempos (s), com mínimo e mediana.
+
+    Com `warmup`, uma execução extra não medida vem antes (custos únicos do processo, como a logo do PDF).
+    """
+    if warmup:
+        if before_each:
+            before_each()
+        func()
+    runs = []
+    for _ in range(repeats):
+        if before_each:
+            before_each()
+        gc.collect()
+        started_at = time.perf_counter()
+        func()
+        runs.append(time.perf_counter() - started_at)
+    return {'runs': [round(run, 6) for run in runs], 'min_s': round(min(runs), 6),
+            'median_s': round(statistics.median(runs), 6)}
+
+
+def _use_data_dir(data_dir: Path):
+    """Aponta os caminhos da aplicação para o diretório do benchmark."""
+    Config.DATA_DIR = data_dir
+    Config.TASKS_FILE = data_dir / 'tasks.json'
+    Config.USERS_FILE = data_dir / 'users.json'
+    Config.BACKUP_DIR = data_dir / 'Backups'
+    Config.REPORTS_DIR = data_dir / 'Reports'
+    Config.LOG_DIR = data_dir / 'Logs'
+
+
+def _clear_reports():
+    # O cache de relatórios reaproveitaria o PDF da execução anterior
+    shutil.rmtree(Config.REPORTS_DIR, ignore_errors=True)
+
+
+def run_size(task_count: int, repeats: int, pdf_max_tasks: int, work_dir: Path) -> Dict[str, Dict]:
+    data_dir = work_dir / f"dados_{task_count}"
+    write_dataset(data_dir, task_count)
+    _use_data_dir(data_dir)
+    results: Dict[str, Dict] = {}
+
+    def record(operation: str, measurement: Dict):
+        results[operation] = measurement
+        print(f"  {operation:<45} min {measurement['min_s'] * 1000:10.2f} ms   mediana {measurement['median_s'] * 1000:10.2f} ms")
+
+    record("TaskService.load_tasks", _measure(TaskService.load_tasks, repeats))
+    tasks_data = TaskService.load_tasks()
+    record("TaskService.save_tasks", _measure(lambda: TaskService.save_tasks(tasks_data), repeats))
+    record("TaskService.get_next_task_id", _measure(TaskService.get_next_task_id, repeats))
+
+    def add_one_task():
+        TaskService.add_task({'task_id': str(uuid.uuid4()), 'description': "Tarefa de benchmark", 'user': 'admin',
+                              'is_completed': False, 'created_at': datetime.now().isoformat(),
+                              'completed_at': None, 'completed_by': None, 'priority': 2, 'category': "Geral"})
+    record("TaskService.add_task", _measure(add_one_task, repeats))
+
+    pending_ids = iter([task_dict['task_id'] for task_dict in tasks_data if not task_dict['is_completed']])
+    record("TaskService.complete_task",
+           _measure(lambda: TaskService.complete_task(next(pending_ids), 'admin'), repeats))
+    record(f"TaskService.complete_tasks ({BATCH_OPERATION_SIZE} por lote)",
+           _measure(lambda: TaskService.complete_tasks([next(pending_ids) for _ in range(BATCH_OPERATION_SIZE)], 'admin')
+                    .raise_for_failures(), repeats))
+
+    task_objects: List[Task] = []
+    def build_tasks():
+        task_objects[:] = [Task.from_dict(task_dict) for task_dict in tasks_data]
+    record("Task.from_dict (todas)", _measure(build_tasks, repeats))
+    record("Task.to_dict (todas)", _measure(lambda: [task.to_dict() for task in task_objects], repeats))
+
+    if task_count <= pdf_max_tasks:
+        pending_tasks = [task_dict for task_dict in tasks_data if not task_dict['is_completed']]
+        completed_tasks = [task_dict for task_dict in tasks_data if task_dict['is_completed']]
+        record("PDFGenerator.generate_task_report[pending]",
+               _measure(lambda: PDFGenerator.generate_task_report(pending_tasks, "pending"), repeats, _clear_reports, warmup=True))
+        record("PDFGenerator.generate_task_report[completed]",
+               _measure(lambda: PDFGenerator.generate_task_report(completed_tasks, "completed"), repeats, _clear_reports, warmup=True))
+    else:
+        print(f"  (relatórios PDF ignorados acima de {pdf_max_tasks} tarefas; use --pdf-max)")
+
+    shutil.rmtree(data_dir, ignore_errors=True)
+    return results
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BENCHMARKS_DIR.parent,
+                              capture_output=True, text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def compare_with_baseline(current: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Imprime a comparação por operação e retorna as regressões acima da tolerância."""
+    regressions = []
+    print(f"\nComparação com a linha de base ({baseline.get('created_at', '?')}, commit {baseline.get('git_commit') or '?'}):")
+    for size_label, operations in current['results'].items():
+        baseline_operations = baseline.get('results', {}).get(size_label)
+        if not baseline_operations:
+            print(f"  {size_label}: sem dados na linha de base")
+            continue
+        for operation, measurement in operations.items():
+            baseline_measurement = baseline_operations.get(operation)
+            if not baseline_measurement:
+                continue
+            current_s, baseline_s = measurement['min_s'], baseline_measurement['min_s']
+            change = (current_s - baseline_s) / baseline_s if baseline_s else 0.0
+            is_regression = change > tolerance and current_s - baseline_s > REGRESSION_MIN_DELTA_S
+            marker = "  << REGRESSÃO" if is_regression else ""
+            print(f"  {size_label:>5} {operation:<45} {baseline_s * 1000:10.2f} -> {current_s * 1000:10.2f} ms ({change:+.1%}){marker}")
+            if is_regression:
+                regressions.append(f"{size_label} {operation}: {change:+.1%}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks do AgendaCompPro com dados sintéticos.")
+    parser.add_argument("--tamanhos", default=DEFAULT_SIZES,
+                        help=f"Tamanhos separados por vírgula ({', '.join(DATASET_SIZES)} ou números). Padrão: {DEFAULT_SIZES}.")
+    parser.add_argument("--repeticoes", type=int, default=3, help="Execuções de cada operação (padrão: 3).")
+    parser.add_argument("--pdf-max", type=int, default=DEFAULT_PDF_MAX_TASKS,
+                        help=f"Maior tamanho em que os relatórios PDF são medidos (padrão: {DEFAULT_PDF_MAX_TASKS}).")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH, help="Arquivo da linha de base.")
+    parser.add_argument("--salvar-baseline", action="store_true", help="Grava este resultado como nova linha de base.")
+    parser.add_argument("--tolerancia", type=float, default=0.20,
+                        help="Piora relativa tolerada antes de marcar regressão (padrão: 0.20 = 20%%).")
+    parser.add_argument("--falhar-em-regressao", action="store_true", help="Sai com código 1 se houver regressão.")
+    args = parser.parse_args(argv)
+
+    size_labels = [label.strip() for label in args.tamanhos.split(',') if label.strip()]
+    current = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'git_commit': _git_commit(),
+        'app_version': Config.VERSION,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'repeats': args.repeticoes,
+        'results': {},
+    }
+    with tempfile.TemporaryDirectory(prefix="agenda_bench_") as work_dir:
+        for size_label in size_labels:
+            task_count = parse_size(size_label)
+            print(f"\n== {size_label} ({task_count} tarefas) ==")
+            current['results'][size_label] = run_size(task_count, args.repeticoes, args.pdf_max, Path(work_dir))
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    results_path = RESULTS_DIR / f"bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    results_path.write_text(json.dumps(current, indent=2, ensure_ascii=False), encoding='utf-8')
+    print(f"\nResultados gravados em {results_path}")
+
+    regressions = []
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+        regressions = compare_with_baseline(current, baseline, args.tolerancia)
+        if regressions:
+            print(f"\n{len(regressions)} regressão(ões) acima de {args.tolerancia:.0%}:")
+            for regression in regressions:
+                print(f"  {regression}")
+    else:
+        print(f"Sem linha de base em {args.baseline}; use --salvar-baseline para criar uma.")
+
+    if args.salvar_baseline:
+        args.baseline.write_text(json.dumps(current, indent=2, ensure_ascii=False), encoding='utf-8')
+        print(f"Linha de base atualizada: {args.baseline}")
+    return 1 if regressions and args.falhar_em_regressao else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
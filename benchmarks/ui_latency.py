@@ -0,0 +1,137 @@
+"""Latência da interface: tempo de atualização da lista de tarefas com N linhas, medido no mainloop real.
+
+Precisa de um display; em servidores de CI, rode sob o Xvfb:
+    xvfb-run -a python -m benchmarks.ui_latency --linhas 1k,10k,100k
+
+Cada etapa roda como callback do mainloop (como na aplicação) e é cronometrada até o Tk terminar
+de desenhar (`update_idletasks`). O StallWatchdog roda junto: o atraso máximo do loop e os
+travamentos que ele registra em cada tamanho mostram o que o usuário sentiria.
+"""
+import argparse
+import json
+import random
+import sys
+import time
+import tkinter as tk
+from datetime import datetime
+from pathlib import Path
+from tkinter import ttk
+from typing import Dict, List, Optional
+
+from config import Config
+from models import Task
+from gui.stall_watchdog import StallWatchdog
+from gui.task_list_view import TaskListView
+
+from benchmarks.data_generator import generate_tasks, parse_size
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+DEFAULT_ROWS = "1k,10k"
+PRIORITY_LABELS = {1: "Baixa", 2: "Média", 3: "Alta"}
+USERNAMES = [f"usuario{user_index:03d}" for user_index in range(20)]
+
+
+def _build_view(root: tk.Tk) -> TaskListView:
+    """Treeview com as mesmas colunas e etiquetas da lista de pendentes da janela principal."""
+    columns = ('id', 'description', 'priority', 'category', 'created_by', 'created_at')
+    treeview = ttk.Treeview(root, columns=columns, show='headings')
+    for column_id in columns:
+        treeview.heading(column_id, text=column_id)
+    for priority_value in PRIORITY_LABELS:
+        treeview.tag_configure(f'priority_{priority_value}', background='#ffffff')
+    treeview.pack(fill=tk.BOTH, expand=True)
+    return TaskListView(
+        treeview,
+        sort_key=lambda t: (-t.priority, t.created_at),
+        row_values=lambda t: (t.task_id, t.description, PRIORITY_LABELS.get(t.priority, ""), t.category, t.user, t.created_at),
+        row_tags=lambda t: (f'priority_{t.priority}',),
+    )
+
+
+def _plan_steps(view: TaskListView, tasks: List[Task]) -> List[tuple]:
+    """Etapas medidas, na ordem em que acontecem na janela principal."""
+    rng = random.Random(7)
+    half_ids = {task.task_id for task in tasks if rng.random() < 0.5}
+    quarter_ids = {task_id for task_id in half_ids if rng.random() < 0.5}
+    changed_task = tasks[len(tasks) // 2]
+
+    def change_priority():
+        changed_task.priority = 3 if changed_task.priority != 3 else 1
+        view.upsert(changed_task)
+    return [
+        ("carregar (reset)", lambda: view.reset(tasks)),
+        ("filtrar 50%", lambda: view.set_filter(half_ids)),
+        ("refinar filtro 25%", lambda: view.set_filter(quarter_ids)),
+        ("limpar filtro", lambda: view.set_filter(None)),
+        ("alterar prioridade (upsert)", change_priority),
+        ("remover uma tarefa", lambda: view.remove(tasks[-1].task_id)),
+    ]
+
+
+def run_rows(root: tk.Tk, row_count: int, threshold_ms: int, settle_ms: int) -> Dict[str, Dict]:
+    tasks = [Task.from_dict(task_dict) for task_dict in generate_tasks(row_count, USERNAMES)]
+    view = _build_view(root)
+    watchdog = StallWatchdog(root, threshold_ms=threshold_ms)
+    steps = _plan_steps(view, tasks)
+    results: Dict[str, Dict] = {}
+
+    def run_step(step_index: int):
+        if step_index >= len(steps):
+            root.quit()
+            return
+        label, action = steps[step_index]
+        watchdog.reset_stats()
+        started_at = time.perf_counter()
+        action()
+        root.update_idletasks() # Inclui o redesenho da Treeview no tempo medido
+        elapsed_ms = (time.perf_counter() - started_at) * 1000
+
+        def finish_step():
+            # O atraso só aparece no tique seguinte do watchdog, por isso a espera antes de ler
+            results[label] = {'ms': round(elapsed_ms, 2), 'max_lag_ms': round(watchdog.max_lag_ms, 2),
+                              'stalls': watchdog.stall_count}
+            print(f"  {label:<30} {elapsed_ms:10.1f} ms   atraso máx. do loop {watchdog.max_lag_ms:8.1f} ms"
+                  f"   travamentos {watchdog.stall_count}")
+            run_step(step_index + 1)
+        root.after(settle_ms, finish_step)
+
+    watchdog.start()
+    root.after(settle_ms, lambda: run_step(0))
+    root.mainloop()
+    watchdog.stop()
+    view.treeview.destroy()
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Mede a latência da lista de tarefas do AgendaCompPro com N linhas.")
+    parser.add_argument("--linhas", default=DEFAULT_ROWS, help=f"Quantidades separadas por vírgula (padrão: {DEFAULT_ROWS}).")
+    parser.add_argument("--limite-ms", type=int, default=StallWatchdog.STALL_THRESHOLD_MS,
+                        help=f"Limite de travamento do watchdog (padrão: {StallWatchdog.STALL_THRESHOLD_MS} ms).")
+    args = parser.parse_args(argv)
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Sem display disponível ({e}). Rode sob o Xvfb: xvfb-run -a python -m benchmarks.ui_latency", file=sys.stderr)
+        return 2
+    root.geometry("1000x700")
+    settle_ms = StallWatchdog.TICK_MS * 3
+
+    current = {'created_at': datetime.now().isoformat(timespec='seconds'), 'app_version': Config.VERSION,
+               'threshold_ms': args.limite_ms, 'results': {}}
+    for size_label in [label.strip() for label in args.linhas.split(',') if label.strip()]:
+        row_count = parse_size(size_label)
+        print(f"\n== {size_label} ({row_count} linhas) ==")
+        current['results'][size_label] = run_rows(root, row_count, args.limite_ms, settle_ms)
+    root.destroy()
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    results_path = RESULTS_DIR / f"ui_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    results_path.write_text(json.dumps(current, indent=2, ensure_ascii=False), encoding='utf-8')
+    print(f"\nResultados gravados em {results_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
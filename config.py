@@ -1,8 +1,14 @@
+import atexit
+import json
+import multiprocessing
 import os
+import queue
 import sys
+import importlib.util
 from pathlib import Path
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, List, Optional
 from datetime import datetime # Importado para o COPYRIGHT_NOTICE
 
 # --- Caminhos Base ---
@@ -22,8 +28,85 @@ except NameError:
 ASSETS_DIR = BASE_DIR / 'assets'
 
 # --- Configuração de Logging ---
+# Variáveis de ambiente (opcionais). "Categoria" é o módulo que gerou o registro (services, main_window...):
+#   AGENDA_LOG_LEVEL=DEBUG                          nível geral (padrão INFO)
+#   AGENDA_LOG_LEVELS=services=WARNING,utils=DEBUG  nível por categoria
+#   AGENDA_LOG_SAMPLE=services=0.1                  fração dos registros INFO/DEBUG mantidos por categoria
+#   AGENDA_LOG_JSON=1                               grava também um arquivo JSON Lines (<app>.jsonl)
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 2
+
+_log_listener: Optional[QueueListener] = None
+
+
+def _parse_category_settings(text: str, parse_value) -> Dict[str, object]:
+    """Converte "categoria=valor,categoria=valor" num dicionário, ignorando itens inválidos."""
+    settings = {}
+    for item in text.split(','):
+        category, separator, value = item.partition('=')
+        if not separator or not category.strip():
+            continue
+        try:
+            settings[category.strip()] = parse_value(value.strip())
+        except ValueError:
+            print(f"AVISO: configuração de log ignorada: '{item.strip()}'")
+    return settings
+
+
+def _parse_level(level_name: str) -> int:
+    level = logging.getLevelName(level_name.upper())
+    if not isinstance(level, int):
+        raise ValueError(level_name)
+    return level
+
+
+class _CategoryFilter(logging.Filter):
+    """Nível mínimo e amostragem por categoria, aplicados na thread que registra (antes da fila).
+
+    Avisos e erros nunca são amostrados. A amostragem é determinística: com fração 0.1,
+    exatamente um a cada dez registros INFO/DEBUG da categoria é mantido.
+    """
+
+    def __init__(self, default_level: int, levels: Dict[str, int], sample_rates: Dict[str, float]):
+        super().__init__()
+        self.default_level = default_level
+        self.levels = levels
+        self.sample_rates = sample_rates
+        self._sample_counts: Dict[str, int] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < self.levels.get(record.module, self.default_level):
+            return False
+        sample_rate = self.sample_rates.get(record.module)
+        if sample_rate is None or record.levelno >= logging.WARNING:
+            return True
+        seen = self._sample_counts.get(record.module, 0)
+        self._sample_counts[record.module] = seen + 1
+        return int((seen + 1) * sample_rate) > int(seen * sample_rate)
+
+
+class _JsonLinesFormatter(logging.Formatter):
+    """Um objeto JSON por linha, para leitura por ferramentas de análise de log."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps({
+            'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'category': record.module,
+            'func': record.funcName,
+            'line': record.lineno,
+            'thread': record.threadName,
+            'message': record.getMessage(),
+        }, ensure_ascii=False)
+
+
 def setup_logging(log_dir_base: Path, app_name_safe: str) -> logging.Logger:
-    """Configura o logging para a aplicação."""
+    """Configura o logging para a aplicação.
+
+    O logger só coloca os registros numa fila; a gravação em arquivo (com rotação) e no console
+    é feita por uma thread de fundo (QueueListener), fora da thread do Tk.
+    """
+    global _log_listener
     log_dir = log_dir_base / app_name_safe / "Logs"
     try:
         log_dir.mkdir(parents=True, exist_ok=True)
@@ -34,8 +117,17 @@ def setup_logging(log_dir_base: Path, app_name_safe: str) -> logging.Logger:
         log_file = log_dir / f"{app_name_safe.lower()}_fallback.log"
         print(f"AVISO: Não foi possível criar o diretório de log padrão. Usando: {log_file}")
 
+    try:
+        default_level = _parse_level(os.getenv("AGENDA_LOG_LEVEL", "INFO"))
+    except ValueError:
+        print(f"AVISO: AGENDA_LOG_LEVEL inválido ({os.getenv('AGENDA_LOG_LEVEL')}); usando INFO.")
+        default_level = logging.INFO
+    category_levels = _parse_category_settings(os.getenv("AGENDA_LOG_LEVELS", ""), _parse_level)
+    sample_rates = _parse_category_settings(os.getenv("AGENDA_LOG_SAMPLE", ""), lambda value: min(1.0, max(0.0, float(value))))
+
     _logger = logging.getLogger(app_name_safe)
-    _logger.setLevel(logging.INFO)
+    # O logger deixa passar o menor nível configurado; o filtro aplica o nível de cada categoria
+    _logger.setLevel(min([default_level, *category_levels.values()]))
 
     formatter = logging.Formatter(
         '[%(asctime)s] [%(levelname)s] [%(name)s.%(funcName)s:%(lineno)d] %(message)s',
@@ -43,25 +135,55 @@ def setup_logging(log_dir_base: Path, app_name_safe: str) -> logging.Logger:
     )
 
     # Handler para arquivo com rotação
-    file_handler = RotatingFileHandler(log_file, maxBytes=5*1024*1024, backupCount=2, encoding='utf-8')
+    file_handler = RotatingFileHandler(log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8')
     file_handler.setFormatter(formatter)
-    _logger.addHandler(file_handler)
+    output_handlers: List[logging.Handler] = [file_handler]
 
     # Handler para console (útil para desenvolvimento)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    _logger.addHandler(console_handler)
-    
+    output_handlers.append(console_handler)
+
+    if os.getenv("AGENDA_LOG_JSON", "").strip().lower() in ("1", "true", "sim", "yes"):
+        json_handler = RotatingFileHandler(log_file.with_suffix(".jsonl"), maxBytes=LOG_MAX_BYTES,
+                                           backupCount=LOG_BACKUP_COUNT, encoding='utf-8')
+        json_handler.setFormatter(_JsonLinesFormatter())
+        output_handlers.append(json_handler)
+
+    if _log_listener is not None:
+        _log_listener.stop()
+    for handler in list(_logger.handlers):
+        _logger.removeHandler(handler)
+    # Fila sem limite: registrar nunca bloqueia quem chama, mesmo com o disco lento
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.addFilter(_CategoryFilter(default_level, category_levels, sample_rates))
+    _logger.addHandler(queue_handler)
+
+    _log_listener = QueueListener(log_queue, *output_handlers, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(shutdown_logging)
     return _logger
 
+
+def shutdown_logging():
+    """Grava os registros ainda na fila e encerra a thread de log (também chamada ao sair do processo)."""
+    global _log_listener
+    if _log_listener is None:
+        return
+    _log_listener.stop()
+    for handler in _log_listener.handlers:
+        handler.close()
+    _log_listener = None
+
 # --- Verificação de Pillow (PIL) ---
-try:
-    from PIL import Image, ImageTk
-    HAS_PIL = True
-except ImportError:
-    HAS_PIL = False
-    # O logger pode não estar pronto aqui se houver erro antes da sua inicialização
-    # print("AVISO: Biblioteca Pillow (PIL) não está instalada. Funcionalidade de imagens será limitada.")
+# Apenas verifica se o pacote existe; a importação real do PIL é adiada até o primeiro uso
+# para não pesar na abertura da janela de login.
+HAS_PIL = importlib.util.find_spec("PIL") is not None
+
+# --- Verificação de NumPy (opcional) ---
+# Usado apenas pela análise de produtividade (analytics.py); sem ele a análise fica indisponível.
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
 
 
 class Config:
@@ -137,22 +259,37 @@ class Config:
             sys.exit(f"Erro fatal ao configurar diretórios: {e}")
 
 # --- Inicializa o Logger ---
-# É importante que o logger seja configurado após a definição de LOG_DIR
-# e que setup_dirs seja chamado antes para garantir que LOG_DIR exista.
-# No entanto, setup_dirs usa o logger. Para evitar problemas de ordem,
-# passamos DATA_DIR para setup_logging.
-logger = setup_logging(Config.DATA_DIR, Config.APP_NAME_SAFE)
-
-# --- Chama a Configuração de Diretórios ---
-# Isso deve ser feito após a definição da classe Config e do logger.
-try:
-    Config.setup_dirs()
-except Exception as e:
-    # Esta mensagem aparecerá no console se setup_dirs falhar criticamente antes do logger estar fully up.
-    print(f"Falha crítica na inicialização dos diretórios em config.py: {e}")
-    # O sys.exit já está dentro de setup_dirs em caso de falha lá.
+# O logger existe desde a importação, mas os handlers (arquivo/console) e a criação
+# dos diretórios só acontecem em `init_app()`, chamada pelo ponto de entrada.
+# Assim importar `config` continua barato e sem efeitos colaterais em disco.
+logger = logging.getLogger(Config.APP_NAME_SAFE)
+
+_app_initialized = False
+
+def init_app():
+    """Configura logging e diretórios de dados. Pode ser chamada mais de uma vez."""
+    global _app_initialized
+    if _app_initialized:
+        return
+    if multiprocessing.current_process().name != 'MainProcess':
+        # Processo do pool de relatórios ('spawn' reimporta o módulo principal): não abre outro
+        # RotatingFileHandler no mesmo arquivo de log, o que gera disputa na rotação (Windows)
+        return
+    _app_initialized = True
+
+    setup_logging(Config.DATA_DIR, Config.APP_NAME_SAFE)
+
+    # --- Chama a Configuração de Diretórios ---
+    try:
+        Config.setup_dirs()
+    except Exception as e:
+        # Esta mensagem aparecerá no console se setup_dirs falhar criticamente antes do logger estar fully up.
+        print(f"Falha crítica na inicialização dos diretórios em config.py: {e}")
+        # O sys.exit já está dentro de setup_dirs em caso de falha lá.
 
-if not HAS_PIL: # Agora o logger existe
-    logger.warning("Biblioteca Pillow (PIL) não está instalada. `pip install Pillow`. Funcionalidade de imagens (como logo e ícones) será limitada ou ausente.")
+    if not HAS_PIL:
+        logger.warning("Biblioteca Pillow (PIL) não está instalada. `pip install Pillow`. Funcionalidade de imagens (como logo e ícones) será limitada ou ausente.")
+    if not HAS_NUMPY:
+        logger.info("Biblioteca NumPy não está instalada (`pip install numpy`). A análise de produtividade ficará indisponível.")
 
-logger.info(f"{Config.APP_NAME} v{Config.VERSION} - Configurações carregadas.")
\ No newline at end of file
+    logger.info(f"{Config.APP_NAME} v{Config.VERSION} - Configurações carregadas.")
@@ -0,0 +1,96 @@
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from models import Task, parse_local_datetime
+
+DATE_FIELDS = ('due_at', 'created_at') # Datas que posicionam as tarefas no calendário
+
+IndexEntry = Tuple[datetime, str] # (data, task_id)
+
+
+class DateIndex:
+    """Lista ordenada de (data, task_id) de um campo de data: um intervalo sai com dois bisects, em O(log N + k)."""
+    BULK_FRACTION = 8 # Lotes maiores que 1/8 do índice são reordenados de uma vez em vez de inseridos um a um
+
+    def __init__(self, field_name: str):
+        self.field_name = field_name
+        self._entries: List[IndexEntry] = []
+        self._entry_by_id: Dict[str, IndexEntry] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _entry_for(self, task: Task) -> Optional[IndexEntry]:
+        # Mesma conversão de fuso que Task.is_overdue: a tarefa cai no dia e na hora em que vence
+        task_date = parse_local_datetime(getattr(task, self.field_name))
+        return (task_date, task.task_id) if task_date is not None else None
+
+    def reset(self, tasks: Iterable[Task]):
+        self._entry_by_id = {}
+        for task in tasks:
+            entry = self._entry_for(task)
+            if entry is not None:
+                self._entry_by_id[task.task_id] = entry
+        self._entries = sorted(self._entry_by_id.values())
+
+    def update(self, tasks: Iterable[Task]):
+        tasks = list(tasks)
+        if len(tasks) * self.BULK_FRACTION > len(self._entries):
+            # Ex.: importação em lote: insort um a um seria quadrático
+            for task in tasks:
+                entry = self._entry_for(task)
+                if entry is None:
+                    self._entry_by_id.pop(task.task_id, None)
+                else:
+                    self._entry_by_id[task.task_id] = entry
+            self._entries = sorted(self._entry_by_id.values())
+            return
+        for task in tasks:
+            new_entry = self._entry_for(task)
+            old_entry = self._entry_by_id.get(task.task_id)
+            if old_entry == new_entry:
+                continue
+            if old_entry is not None:
+                del self._entries[bisect_left(self._entries, old_entry)]
+                del self._entry_by_id[task.task_id]
+            if new_entry is not None:
+                insort(self._entries, new_entry)
+                self._entry_by_id[task.task_id] = new_entry
+
+    def forget(self, task_ids: Iterable[str]):
+        for task_id in task_ids:
+            old_entry = self._entry_by_id.pop(task_id, None)
+            if old_entry is not None:
+                del self._entries[bisect_left(self._entries, old_entry)]
+
+    def range(self, start: datetime, end: datetime) -> List[IndexEntry]:
+        """Entradas com start <= data < end, em ordem de data."""
+        # '' é menor que qualquer task_id: as chaves de busca caem antes de todas as entradas da mesma data
+        return self._entries[bisect_left(self._entries, (start, "")):bisect_left(self._entries, (end, ""))]
+
+
+class TaskDateIndex:
+    """Um DateIndex por campo de DATE_FIELDS, alimentado com as mesmas mudanças do repositório que o TaskFilter."""
+
+    def __init__(self, tasks: Iterable[Task] = ()):
+        self.indexes: Dict[str, DateIndex] = {field_name: DateIndex(field_name) for field_name in DATE_FIELDS}
+        self.reset(tasks)
+
+    def reset(self, tasks: Iterable[Task]):
+        tasks = list(tasks)
+        for index in self.indexes.values():
+            index.reset(tasks)
+
+    def update(self, tasks: Iterable[Task]):
+        tasks = list(tasks)
+        for index in self.indexes.values():
+            index.update(tasks)
+
+    def forget(self, task_ids: Iterable[str]):
+        task_ids = list(task_ids)
+        for index in self.indexes.values():
+            index.forget(task_ids)
+
+    def range(self, field_name: str, start: datetime, end: datetime) -> List[IndexEntry]:
+        return self.indexes[field_name].range(start, end)
@@ -0,0 +1,227 @@
+import csv
+import json
+import os
+import re
+import threading
+import zipfile
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from config import logger
+from report_jobs import ReportCancelledError
+from task_filter import STATUS_ALL, STATUS_COMPLETED, STATUS_PENDING
+
+# Colunas exportadas: (chave no dicionário da tarefa, cabeçalho)
+EXPORT_COLUMNS: List[Tuple[str, str]] = [
+    ('task_id', 'ID'),
+    ('description', 'Descrição'),
+    ('priority', 'Prioridade'),
+    ('category', 'Categoria'),
+    ('user', 'Usuário'),
+    ('created_at', 'Criada em'),
+    ('due_at', 'Vence em'),
+    ('is_completed', 'Concluída'),
+    ('completed_at', 'Concluída em'),
+    ('completed_by', 'Concluída por'),
+]
+
+
+class ExportFilter:
+    """Filtro de status e período compartilhado pelo relatório PDF e pelas exportações.
+
+    O período é aplicado sobre `completed_at` em relatórios de concluídas e sobre
+    `created_at` nos demais. As datas ISO são comparadas como texto, sem conversão por linha.
+    """
+
+    def __init__(self, status: str = STATUS_ALL, date_from: Optional[date] = None, date_to: Optional[date] = None):
+        self.status = status
+        self.date_from = date_from
+        self.date_to = date_to
+        self._from_text = date_from.isoformat() if date_from else None
+        self._until_text = (date_to + timedelta(days=1)).isoformat() if date_to else None # Limite exclusivo
+
+    @property
+    def date_field(self) -> str:
+        return 'completed_at' if self.status == STATUS_COMPLETED else 'created_at'
+
+    def matches(self, task_dict: Dict) -> bool:
+        if self.status == STATUS_PENDING and task_dict.get('is_completed'):
+            return False
+        if self.status == STATUS_COMPLETED and not task_dict.get('is_completed'):
+            return False
+        if self._from_text is None and self._until_text is None:
+            return True
+        date_text = task_dict.get(self.date_field)
+        if not date_text:
+            return False
+        if self._from_text is not None and date_text < self._from_text:
+            return False
+        if self._until_text is not None and date_text >= self._until_text:
+            return False
+        return True
+
+    def apply(self, tasks_data: Iterable[Dict]) -> Iterator[Dict]:
+        return (task_dict for task_dict in tasks_data if self.matches(task_dict))
+
+    def describe(self) -> str:
+        """Descrição curta do filtro, usada em mensagens e no título do relatório."""
+        parts = [{STATUS_PENDING: "pendentes", STATUS_COMPLETED: "concluídas"}.get(self.status, "todas")]
+        if self.date_from:
+            parts.append(f"de {self.date_from.strftime('%d/%m/%Y')}")
+        if self.date_to:
+            parts.append(f"até {self.date_to.strftime('%d/%m/%Y')}")
+        return " ".join(parts)
+
+
+class TaskExporter:
+    """Exporta tarefas para CSV, JSON Lines e XLSX.
+
+    Os escritores consomem um iterável de dicionários linha a linha (memória constante) e
+    gravam num arquivo temporário que só substitui o destino ao final.
+    """
+    FORMATS = {
+        'csv': ("CSV (separado por ponto e vírgula)", ".csv"),
+        'jsonl': ("JSON Lines", ".jsonl"),
+        'xlsx': ("Planilha Excel (XLSX)", ".xlsx"),
+    }
+    CSV_DELIMITER = ';' # Padrão do Excel em português
+    XLSX_MAX_ROWS = 1_048_576 # Limite de linhas de uma planilha (inclui o cabeçalho)
+    XLSX_FLUSH_ROWS = 5000
+
+    _INVALID_XML_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+    PROGRESS_EVERY_ROWS = 1000
+
+    @staticmethod
+    def export(tasks_data: Iterable[Dict], file_path: Path, export_format: str,
+               progress_callback: Optional[Callable[[int, int], None]] = None,
+               cancel_event: Optional[threading.Event] = None) -> int:
+        """Exporta no formato indicado ('csv', 'jsonl' ou 'xlsx'). Retorna o número de tarefas gravadas.
+
+        `progress_callback(linhas, 0)` é chamado a cada PROGRESS_EVERY_ROWS linhas; com `cancel_event`
+        sinalizado a exportação para com ReportCancelledError e o arquivo de destino não é alterado.
+        """
+        writers: Dict[str, Callable[[Iterable[Dict], Path], int]] = {
+            'csv': TaskExporter._write_csv,
+            'jsonl': TaskExporter._write_jsonl,
+            'xlsx': TaskExporter._write_xlsx,
+        }
+        if export_format not in writers:
+            raise ValueError(f"Formato de exportação desconhecido: '{export_format}'.")
+        file_path = Path(file_path)
+        temp_path = file_path.with_name(file_path.name + ".tmp")
+        try:
+            tracked_rows = TaskExporter._track(tasks_data, progress_callback, cancel_event)
+            row_count = writers[export_format](tracked_rows, temp_path)
+            os.replace(temp_path, file_path)
+        except Exception:
+            temp_path.unlink(missing_ok=True)
+            raise
+        logger.info(f"Exportação {export_format.upper()} concluída: {row_count} tarefas em {file_path}")
+        return row_count
+
+    @staticmethod
+    def _track(tasks_data: Iterable[Dict], progress_callback, cancel_event) -> Iterator[Dict]:
+        if progress_callback is None and cancel_event is None:
+            yield from tasks_data
+            return
+        for row_index, task_dict in enumerate(tasks_data):
+            if row_index % TaskExporter.PROGRESS_EVERY_ROWS == 0:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise ReportCancelledError("Exportação cancelada.")
+                if progress_callback:
+                    progress_callback(row_index, 0)
+            yield task_dict
+
+    @staticmethod
+    def _write_csv(tasks_data: Iterable[Dict], file_path: Path) -> int:
+        keys = [key for key, _ in EXPORT_COLUMNS]
+        row_count = 0
+        # utf-8-sig: o BOM faz o Excel reconhecer a codificação e os acentos
+        with open(file_path, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.writer(f, delimiter=TaskExporter.CSV_DELIMITER)
+            writer.writerow([header for _, header in EXPORT_COLUMNS])
+            for task_dict in tasks_data:
+                writer.writerow([task_dict.get(key) for key in keys]) # None é gravado como campo vazio
+                row_count += 1
+        return row_count
+
+    @staticmethod
+    def _write_jsonl(tasks_data: Iterable[Dict], file_path: Path) -> int:
+        keys = [key for key, _ in EXPORT_COLUMNS]
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+        row_count = 0
+        with open(file_path, 'w', encoding='utf-8', newline='\n') as f:
+            for task_dict in tasks_data:
+                f.write(encoder.encode({key: task_dict.get(key) for key in keys}))
+                f.write('\n')
+                row_count += 1
+        return row_count
+
+    @staticmethod
+    def _xlsx_cell(value) -> str:
+        if value is None or value == '':
+            return '<c/>'
+        if isinstance(value, bool):
+            return f'<c t="b"><v>{int(value)}</v></c>'
+        if isinstance(value, (int, float)):
+            return f'<c><v>{value}</v></c>'
+        text = escape(TaskExporter._INVALID_XML_CHARS.sub('', str(value)))
+        return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+    @staticmethod
+    def _write_xlsx(tasks_data: Iterable[Dict], file_path: Path) -> int:
+        """Grava um XLSX mínimo (uma planilha, textos inline) direto no zip, sem biblioteca externa."""
+        keys = [key for key, _ in EXPORT_COLUMNS]
+        cell = TaskExporter._xlsx_cell
+        row_count = 0
+        with zipfile.ZipFile(file_path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=1) as package:
+            for part_name, part_content in _XLSX_STATIC_PARTS.items():
+                package.writestr(part_name, part_content)
+            with package.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as sheet:
+                sheet.write(_XLSX_SHEET_START.encode('utf-8'))
+                header_cells = "".join(cell(header) for _, header in EXPORT_COLUMNS)
+                pending_rows = [f'<row>{header_cells}</row>']
+                for task_dict in tasks_data:
+                    if row_count + 1 >= TaskExporter.XLSX_MAX_ROWS:
+                        raise ValueError(f"O XLSX comporta no máximo {TaskExporter.XLSX_MAX_ROWS - 1} tarefas; use CSV ou JSON Lines.")
+                    pending_rows.append('<row>' + "".join([cell(task_dict.get(key)) for key in keys]) + '</row>')
+                    row_count += 1
+                    if len(pending_rows) >= TaskExporter.XLSX_FLUSH_ROWS:
+                        sheet.write("".join(pending_rows).encode('utf-8'))
+                        pending_rows.clear()
+                pending_rows.append(_XLSX_SHEET_END)
+                sheet.write("".join(pending_rows).encode('utf-8'))
+        return row_count
+
+
+_XLSX_SHEET_START = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                     '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>')
+_XLSX_SHEET_END = '</sheetData></worksheet>'
+_XLSX_STATIC_PARTS = {
+    '[Content_Types].xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'),
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>'),
+    'xl/workbook.xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Tarefas" sheetId="1" r:id="rId1"/></sheets></workbook>'),
+    'xl/_rels/workbook.xml.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'),
+}
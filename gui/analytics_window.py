@@ -0,0 +1,162 @@
+# gui/analytics_window.py
+import asyncio
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+from analytics import GroupStats, ProductivityAnalytics, ProductivitySummary, TaskColumns
+from config import logger
+from utils import PDFGenerator
+
+
+class AnalyticsWindow(tk.Toplevel):
+    """Painel de resumo da análise de produtividade, com geração do relatório PDF.
+
+    O cálculo roda fora da thread do Tk (pela ponte assíncrona); o PDF vai para a fila de relatórios.
+    """
+
+    def __init__(self, parent_main_window):
+        super().__init__(parent_main_window.root)
+        self.parent_main_window = parent_main_window
+        self.title("Análise de Produtividade")
+        self.geometry("760x520")
+        self.minsize(620, 400)
+        self.transient(parent_main_window.root)
+        self.summary: ProductivitySummary | None = None
+
+        self.setup_ui()
+        self.refresh_summary()
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
+
+    def setup_ui(self):
+        main_frame = ttk.Frame(self, padding=10)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        self.overview_label = ttk.Label(main_frame, text="Calculando...", justify=tk.LEFT)
+        self.overview_label.pack(fill=tk.X, pady=(0, 8))
+
+        notebook = ttk.Notebook(main_frame)
+        notebook.pack(fill=tk.BOTH, expand=True)
+        self.weekly_tree = self._create_tree(notebook, "Concluídas por Semana", ('user',), {'user': ("Usuário", 140)})
+        stats_columns = {'group': ("Grupo", 200), 'count': ("Tarefas", 80), 'median': ("Mediana", 90),
+                         'p90': ("P90", 90), 'max': ("Máximo", 90)}
+        self.lead_time_tree = self._create_tree(notebook, "Tempo de Conclusão", tuple(stats_columns), stats_columns)
+        self.backlog_tree = self._create_tree(notebook, "Idade das Pendentes", tuple(stats_columns), stats_columns)
+
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X, pady=(10, 0))
+        self.refresh_button = ttk.Button(button_frame, text="Atualizar", command=self.refresh_summary)
+        self.refresh_button.pack(side=tk.LEFT, padx=5)
+        self.pdf_button = ttk.Button(button_frame, text="Gerar PDF", command=self.generate_pdf, state=tk.DISABLED)
+        self.pdf_button.pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Fechar", command=self.destroy).pack(side=tk.RIGHT, padx=5)
+
+    @staticmethod
+    def _create_tree(notebook: ttk.Notebook, tab_title: str, column_ids: tuple, headings: dict) -> ttk.Treeview:
+        tab_frame = ttk.Frame(notebook, padding=5)
+        notebook.add(tab_frame, text=tab_title)
+        tree = ttk.Treeview(tab_frame, columns=column_ids, show='headings')
+        for column_id in column_ids:
+            heading_text, width = headings[column_id]
+            tree.heading(column_id, text=heading_text)
+            tree.column(column_id, width=width, anchor=tk.W if column_id in ('user', 'group') else tk.CENTER)
+        scrollbar = ttk.Scrollbar(tab_frame, orient=tk.VERTICAL, command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        return tree
+
+    # --- Cálculo ---
+    def refresh_summary(self):
+        self.refresh_button.config(state=tk.DISABLED)
+        self.pdf_button.config(state=tk.DISABLED)
+        self.overview_label.config(text="Calculando...")
+        # Só as referências são copiadas na thread do Tk; as colunas são montadas na thread de trabalho
+        tasks_snapshot = list(self.parent_main_window.repository)
+        self.parent_main_window.bridge.submit(
+            asyncio.to_thread(self._summarize, tasks_snapshot),
+            on_success=self._show_summary, on_error=self._on_summary_error
+        )
+
+    @staticmethod
+    def _summarize(tasks_snapshot: list) -> ProductivitySummary:
+        return ProductivityAnalytics.summarize(TaskColumns.from_tasks(tasks_snapshot))
+
+    def _on_summary_error(self, error: BaseException):
+        logger.error(f"Erro ao calcular a análise de produtividade: {error}", exc_info=error)
+        if not self.winfo_exists():
+            return
+        self.refresh_button.config(state=tk.NORMAL)
+        self.overview_label.config(text="Não foi possível calcular a análise.")
+        messagebox.showerror("Erro na Análise", f"Falha ao calcular a análise de produtividade:\n{error}", parent=self)
+
+    def _show_summary(self, summary: ProductivitySummary):
+        if not self.winfo_exists():
+            return
+        self.summary = summary
+        format_days = ProductivityAnalytics.format_days
+        lead_time_median = format_days(summary.lead_time.median_days) if summary.lead_time else "-"
+        backlog_median = format_days(summary.backlog_age.median_days) if summary.backlog_age else "-"
+        self.overview_label.config(text=(
+            f"{summary.total_tasks} tarefas | {summary.completed_count} concluídas | {summary.pending_count} pendentes\n"
+            f"Tempo de conclusão (mediana): {lead_time_median} | Idade das pendentes (mediana): {backlog_median}\n"
+            f"Calculado em {summary.elapsed_s * 1000:.0f} ms ({summary.generated_at.strftime('%d/%m/%Y %H:%M')})"
+        ))
+
+        week_columns = ('user',) + tuple(f"w{index}" for index in range(len(summary.week_starts))) + ('total',)
+        self.weekly_tree.configure(columns=week_columns)
+        self.weekly_tree.heading('user', text="Usuário")
+        self.weekly_tree.column('user', width=140, anchor=tk.W)
+        for index, week_start in enumerate(summary.week_starts):
+            self.weekly_tree.heading(f"w{index}", text=week_start.strftime('%d/%m'))
+            self.weekly_tree.column(f"w{index}", width=55, anchor=tk.CENTER)
+        self.weekly_tree.heading('total', text="Total")
+        self.weekly_tree.column('total', width=60, anchor=tk.CENTER)
+        self.weekly_tree.delete(*self.weekly_tree.get_children())
+        for user, counts in summary.weekly_by_user:
+            self.weekly_tree.insert('', tk.END, values=(user, *counts, sum(counts)))
+
+        priority_label = self.parent_main_window.get_priority_label
+        self._fill_stats_tree(self.lead_time_tree, [
+            *((f"Prioridade {priority_label(stats.key)}", stats) for stats in summary.lead_time_by_priority),
+            ("Todas as concluídas", summary.lead_time),
+        ])
+        self._fill_stats_tree(self.backlog_tree, [
+            *((f"Prioridade {priority_label(stats.key)}", stats) for stats in summary.backlog_age_by_priority),
+            *((f"Categoria {stats.key}", stats) for stats in summary.backlog_age_by_category),
+            ("Todas as pendentes", summary.backlog_age),
+        ])
+
+        self.refresh_button.config(state=tk.NORMAL)
+        self.pdf_button.config(state=tk.NORMAL)
+
+    @staticmethod
+    def _fill_stats_tree(tree: ttk.Treeview, labeled_stats: list[tuple[str, GroupStats | None]]):
+        format_days = ProductivityAnalytics.format_days
+        tree.delete(*tree.get_children())
+        for label, stats in labeled_stats:
+            if stats is None:
+                continue
+            tree.insert('', tk.END, values=(label, stats.count, format_days(stats.median_days),
+                                            format_days(stats.p90_days), format_days(stats.max_days)))
+
+    # --- Relatório ---
+    def generate_pdf(self):
+        if self.summary is None:
+            return
+        summary = self.summary
+
+        def _on_report_error(error):
+            logger.error(f"Falha ao gerar o relatório de análise: {error}", exc_info=error)
+            messagebox.showerror("Erro no Relatório", f"Falha ao gerar o relatório de análise:\n{error}",
+                                 parent=self.parent_main_window.root)
+
+        self.parent_main_window._submit_report_job(
+            key=('analytics', summary.generated_at),
+            label="Relatório PDF: análise de produtividade",
+            work=lambda job: PDFGenerator.generate_analytics_report(summary),
+            on_success=self.parent_main_window._offer_to_open_report, on_error=_on_report_error
+        )
+
+    def destroy(self):
+        self.parent_main_window.analytics_window = None
+        super().destroy()
@@ -0,0 +1,117 @@
+# gui/async_bridge.py
+import asyncio
+import concurrent.futures
+import os
+import queue
+import sys
+import threading
+import tkinter as tk
+from typing import Any, Awaitable, Callable, Optional
+
+from config import logger
+
+
+class AsyncBridge:
+    """Roda um loop asyncio numa thread ao lado do mainloop do Tk.
+
+    `submit()` agenda uma corrotina no loop; o resultado (ou erro) volta para a thread
+    do Tk por uma fila drenada com `root.after`, então os callbacks podem mexer em
+    widgets e abrir messageboxes com segurança.
+    """
+    POLL_INTERVAL_MS = 30
+    SHUTDOWN_TIMEOUT_S = 10
+
+    def __init__(self, root: tk.Misc):
+        self.root = root
+        self.loop = asyncio.new_event_loop()
+        self._callbacks: queue.SimpleQueue = queue.SimpleQueue()
+        self._pending: set[concurrent.futures.Future] = set()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run_loop, name="AsyncBridge", daemon=True)
+        self._thread.start()
+        self._poll_after_id: Optional[str] = self.root.after(self.POLL_INTERVAL_MS, self._drain_callbacks)
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+        self.loop.close()
+
+    def submit(self, coro: Awaitable,
+               on_success: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[BaseException], None]] = None) -> concurrent.futures.Future:
+        """Agenda `coro` no loop asyncio. Os callbacks são chamados na thread do Tk."""
+        if self._closed:
+            raise RuntimeError("AsyncBridge já foi encerrada.")
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        self._pending.add(future)
+
+        def _on_done(done_future: concurrent.futures.Future):
+            self._callbacks.put((done_future, on_success, on_error))
+        future.add_done_callback(_on_done)
+        return future
+
+    def call_soon_in_tk(self, callback: Callable, *args):
+        """Pede que `callback(*args)` rode na thread do Tk (ex.: progresso vindo de uma corrotina)."""
+        self._callbacks.put((None, lambda _: callback(*args), None))
+
+    def _drain_callbacks(self):
+        while True:
+            try:
+                future, on_success, on_error = self._callbacks.get_nowait()
+            except queue.Empty:
+                break
+            if future is not None:
+                self._pending.discard(future)
+            self._dispatch(future, on_success, on_error)
+        if not self._closed:
+            self._poll_after_id = self.root.after(self.POLL_INTERVAL_MS, self._drain_callbacks)
+
+    @staticmethod
+    def _dispatch(future: Optional[concurrent.futures.Future], on_success, on_error):
+        try:
+            if future is None:
+                on_success(None)
+                return
+            if future.cancelled():
+                return
+            error = future.exception()
+            if error is not None:
+                if on_error:
+                    on_error(error)
+                else:
+                    logger.error(f"Erro não tratado em operação assíncrona: {error}", exc_info=error)
+            elif on_success:
+                on_success(future.result())
+        except Exception as e:
+            logger.error(f"Erro em callback de operação assíncrona: {e}", exc_info=True)
+
+    def shutdown(self):
+        """Aguarda as operações pendentes (ex.: gravações) e encerra o loop."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._poll_after_id is not None:
+            try:
+                self.root.after_cancel(self._poll_after_id)
+            except tk.TclError:
+                pass
+        pending = [future for future in self._pending if not future.done()]
+        if pending:
+            logger.info(f"Aguardando {len(pending)} operação(ões) de E/S pendente(s) antes de encerrar.")
+            _, not_done = concurrent.futures.wait(pending, timeout=self.SHUTDOWN_TIMEOUT_S)
+            if not_done:
+                logger.warning(f"{len(not_done)} operação(ões) de E/S não terminaram a tempo do encerramento.")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=self.SHUTDOWN_TIMEOUT_S)
+
+
+async def open_with_default_app(file_path: str):
+    """Abre um arquivo (ex.: o PDF gerado) com o aplicativo padrão do sistema sem bloquear o Tk."""
+    if sys.platform == "win32":
+        await asyncio.to_thread(os.startfile, file_path)
+        return
+    opener = "open" if sys.platform == "darwin" else "xdg-open"
+    process = await asyncio.create_subprocess_exec(opener, file_path)
+    return_code = await process.wait()
+    if return_code != 0:
+        raise OSError(f"'{opener}' terminou com código {return_code} ao abrir {file_path}")
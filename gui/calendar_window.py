@@ -0,0 +1,271 @@
+# gui/calendar_window.py
+import heapq
+import tkinter as tk
+from datetime import date, datetime, timedelta
+from tkinter import ttk
+
+from date_index import IndexEntry
+from metrics import Metrics
+from models import Task
+from repository import EVENT_RESET
+
+VIEW_DAY = "dia"
+VIEW_WEEK = "semana"
+VIEW_MONTH = "mes"
+WEEKDAY_NAMES = ("Segunda", "Terça", "Quarta", "Quinta", "Sexta", "Sábado", "Domingo")
+MONTH_NAMES = ("Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho",
+               "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro")
+FIELD_LABELS = {'due_at': "Vence", 'created_at': "Criada"}
+
+
+class CalendarWindow(tk.Toplevel):
+    """Calendário de dia, semana e mês com as tarefas posicionadas pelo vencimento e/ou pela criação.
+
+    Cada tela consulta só o intervalo visível no TaskDateIndex da janela principal (dois bisects
+    por campo, O(log N + k)): trocar de mês custa o mesmo com um ano ou dez anos de histórico.
+    """
+    MONTH_CELL_LINES = 4 # Tarefas listadas por dia na visão de mês; o resto vira "+N mais"
+    REFRESH_DELAY_MS = 150 # Agrupa as mudanças seguidas do repositório num único redesenho
+    DUE_COLOR = '#000000'
+    OVERDUE_COLOR = '#b00000'
+    CREATED_COLOR = '#1f5fa8'
+    COMPLETED_COLOR = '#888888'
+
+    def __init__(self, parent_main_window):
+        super().__init__(parent_main_window.root)
+        self.parent_main_window = parent_main_window
+        self.repository = parent_main_window.repository
+        self.date_index = parent_main_window.ensure_date_index()
+        self.title("Calendário")
+        self.geometry("960x640")
+        self.minsize(700, 480)
+        self.transient(parent_main_window.root)
+
+        self.view_var = tk.StringVar(value=VIEW_MONTH)
+        self.show_due_var = tk.BooleanVar(value=True)
+        self.show_created_var = tk.BooleanVar(value=False)
+        self.title_var = tk.StringVar()
+        self.anchor_date = date.today()
+        self._refresh_after_id: str | None = None
+        self._view_frames: dict[str, ttk.Frame] = {}
+        self._listbox_task_ids: dict[tk.Listbox, list[str | None]] = {}
+
+        self.setup_ui()
+        self._unsubscribe = self.repository.subscribe(self._on_repository_changed)
+        self.bind("<Left>", lambda event: self.navigate(-1))
+        self.bind("<Right>", lambda event: self.navigate(1))
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.render()
+
+    # --- Montagem ---
+    def setup_ui(self):
+        toolbar = ttk.Frame(self, padding=(10, 10, 10, 5))
+        toolbar.pack(fill=tk.X)
+        ttk.Button(toolbar, text="◀", width=3, command=lambda: self.navigate(-1)).pack(side=tk.LEFT)
+        ttk.Button(toolbar, text="Hoje", command=self.go_to_today).pack(side=tk.LEFT, padx=5)
+        ttk.Button(toolbar, text="▶", width=3, command=lambda: self.navigate(1)).pack(side=tk.LEFT)
+        ttk.Label(toolbar, textvariable=self.title_var, font=('TkDefaultFont', 11, 'bold')).pack(side=tk.LEFT, padx=15)
+        for label, value in (("Mês", VIEW_MONTH), ("Semana", VIEW_WEEK), ("Dia", VIEW_DAY)):
+            ttk.Radiobutton(toolbar, text=label, variable=self.view_var, value=value, command=self.render).pack(side=tk.RIGHT, padx=3)
+        ttk.Checkbutton(toolbar, text="Criação", variable=self.show_created_var, command=self.render).pack(side=tk.RIGHT, padx=(3, 15))
+        ttk.Checkbutton(toolbar, text="Vencimento", variable=self.show_due_var, command=self.render).pack(side=tk.RIGHT, padx=3)
+        self.body_frame = ttk.Frame(self, padding=(10, 0, 10, 10))
+        self.body_frame.pack(fill=tk.BOTH, expand=True)
+
+    def _new_listbox(self, parent: tk.Misc, height: int) -> tk.Listbox:
+        listbox = tk.Listbox(parent, height=height, borderwidth=0, highlightthickness=0, activestyle='none', exportselection=False)
+        listbox.bind("<Double-1>", lambda event: self._open_selected(listbox))
+        self._listbox_task_ids[listbox] = []
+        return listbox
+
+    def _build_month_view(self) -> ttk.Frame:
+        frame = ttk.Frame(self.body_frame)
+        for column, weekday_name in enumerate(WEEKDAY_NAMES):
+            ttk.Label(frame, text=weekday_name[:3], anchor=tk.CENTER).grid(row=0, column=column, sticky=tk.EW)
+            frame.columnconfigure(column, weight=1, uniform='dias')
+        self._month_cells: list[tuple[ttk.Label, tk.Listbox]] = []
+        for cell_index in range(42):
+            row, column = divmod(cell_index, 7)
+            cell = ttk.Frame(frame, relief=tk.SOLID, borderwidth=1)
+            cell.grid(row=row + 1, column=column, sticky=tk.NSEW)
+            day_label = ttk.Label(cell, anchor=tk.E, padding=(0, 0, 4, 0), cursor='hand2')
+            day_label.pack(fill=tk.X)
+            day_label.bind("<Button-1>", lambda event, index=cell_index: self._open_day(self._month_grid_start + timedelta(days=index)))
+            listbox = self._new_listbox(cell, height=self.MONTH_CELL_LINES + 1)
+            listbox.pack(fill=tk.BOTH, expand=True)
+            self._month_cells.append((day_label, listbox))
+        for row in range(1, 7):
+            frame.rowconfigure(row, weight=1, uniform='semanas')
+        return frame
+
+    def _build_week_view(self) -> ttk.Frame:
+        frame = ttk.Frame(self.body_frame)
+        self._week_columns: list[tuple[ttk.Label, tk.Listbox]] = []
+        for column in range(7):
+            column_frame = ttk.Frame(frame, relief=tk.SOLID, borderwidth=1)
+            column_frame.grid(row=0, column=column, sticky=tk.NSEW)
+            day_label = ttk.Label(column_frame, anchor=tk.CENTER, cursor='hand2')
+            day_label.pack(fill=tk.X)
+            day_label.bind("<Button-1>", lambda event, index=column: self._open_day(self._week_start + timedelta(days=index)))
+            listbox = self._new_listbox(column_frame, height=20)
+            listbox.pack(fill=tk.BOTH, expand=True)
+            self._week_columns.append((day_label, listbox))
+            frame.columnconfigure(column, weight=1, uniform='dias')
+        frame.rowconfigure(0, weight=1)
+        return frame
+
+    def _build_day_view(self) -> ttk.Frame:
+        frame = ttk.Frame(self.body_frame)
+        self.day_list = ttk.Treeview(frame, columns=('time', 'kind', 'id', 'description', 'status'), show='headings', selectmode='browse')
+        for column_id, heading, width, stretch in (('time', "Hora", 60, tk.NO), ('kind', "Data", 70, tk.NO), ('id', "ID", 70, tk.NO),
+                                                  ('description', "Descrição", 450, tk.YES), ('status', "Situação", 100, tk.NO)):
+            self.day_list.heading(column_id, text=heading)
+            self.day_list.column(column_id, width=width, stretch=stretch)
+        self.day_list.tag_configure('overdue', foreground=self.OVERDUE_COLOR)
+        self.day_list.tag_configure('created', foreground=self.CREATED_COLOR)
+        self.day_list.tag_configure('completed', foreground=self.COMPLETED_COLOR)
+        self.day_list.bind("<Double-1>", lambda event: self._open_day_selection())
+        day_scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=self.day_list.yview)
+        self.day_list.configure(yscrollcommand=day_scrollbar.set)
+        day_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.day_list.pack(fill=tk.BOTH, expand=True)
+        return frame
+
+    def _show_view_frame(self, view: str):
+        builders = {VIEW_MONTH: self._build_month_view, VIEW_WEEK: self._build_week_view, VIEW_DAY: self._build_day_view}
+        if view not in self._view_frames:
+            self._view_frames[view] = builders[view]() # Cada visão é montada uma vez e reaproveitada
+        for other_view, frame in self._view_frames.items():
+            if other_view != view:
+                frame.pack_forget()
+        self._view_frames[view].pack(fill=tk.BOTH, expand=True)
+
+    # --- Navegação ---
+    def navigate(self, step: int):
+        view = self.view_var.get()
+        if view == VIEW_DAY:
+            self.anchor_date += timedelta(days=step)
+        elif view == VIEW_WEEK:
+            self.anchor_date += timedelta(weeks=step)
+        else:
+            month_index = self.anchor_date.year * 12 + self.anchor_date.month - 1 + step
+            self.anchor_date = date(month_index // 12, month_index % 12 + 1, 1)
+        self.render()
+
+    def go_to_today(self):
+        self.anchor_date = date.today()
+        self.render()
+
+    def _open_day(self, day: date):
+        self.anchor_date = day
+        self.view_var.set(VIEW_DAY)
+        self.render()
+
+    def _open_selected(self, listbox: tk.Listbox):
+        selection = listbox.curselection()
+        if selection:
+            task_id = self._listbox_task_ids[listbox][selection[0]]
+            if task_id is not None:
+                self.parent_main_window.show_task(task_id)
+
+    def _open_day_selection(self):
+        selection = self.day_list.selection()
+        if selection:
+            self.parent_main_window.show_task(self.day_list.set(selection[0], 'id'))
+
+    # --- Consulta e desenho ---
+    def _entries_by_day(self, start: date, end: date) -> dict[date, list[tuple[IndexEntry, str, Task]]]:
+        """Tarefas do intervalo [start, end) agrupadas por dia, em ordem de horário."""
+        range_start, range_end = datetime.combine(start, datetime.min.time()), datetime.combine(end, datetime.min.time())
+        fields = [field_name for field_name, enabled in (('due_at', self.show_due_var.get()),
+                                                         ('created_at', self.show_created_var.get())) if enabled]
+        # Cada campo já vem ordenado do índice: basta intercalar
+        streams = [[(entry, field_name) for entry in self.date_index.range(field_name, range_start, range_end)]
+                   for field_name in fields]
+        entries_by_day: dict[date, list[tuple[IndexEntry, str, Task]]] = {}
+        for entry, field_name in heapq.merge(*streams, key=lambda item: item[0]):
+            task = self.repository.get(entry[1])
+            if task is not None:
+                entries_by_day.setdefault(entry[0].date(), []).append((entry, field_name, task))
+        return entries_by_day
+
+    def _entry_color(self, field_name: str, task: Task) -> str:
+        if task.is_completed:
+            return self.COMPLETED_COLOR
+        if field_name == 'created_at':
+            return self.CREATED_COLOR
+        return self.OVERDUE_COLOR if task.is_overdue() else self.DUE_COLOR
+
+    def _fill_listbox(self, listbox: tk.Listbox, entries: list[tuple[IndexEntry, str, Task]], max_lines: int | None = None):
+        listbox.delete(0, tk.END)
+        task_ids: list[str | None] = []
+        shown_entries = entries if max_lines is None or len(entries) <= max_lines else entries[:max_lines]
+        for (entry_date, task_id), field_name, task in shown_entries:
+            listbox.insert(tk.END, f"{entry_date:%H:%M} {task.description}")
+            listbox.itemconfigure(tk.END, foreground=self._entry_color(field_name, task))
+            task_ids.append(task_id)
+        if len(shown_entries) < len(entries):
+            listbox.insert(tk.END, f"+{len(entries) - len(shown_entries)} mais")
+            listbox.itemconfigure(tk.END, foreground=self.COMPLETED_COLOR)
+            task_ids.append(None)
+        self._listbox_task_ids[listbox] = task_ids
+
+    @Metrics.timed("gui.calendario")
+    def render(self):
+        self._refresh_after_id = None
+        view = self.view_var.get()
+        self._show_view_frame(view)
+        if view == VIEW_MONTH:
+            self._render_month()
+        elif view == VIEW_WEEK:
+            self._render_week()
+        else:
+            self._render_day()
+
+    def _render_month(self):
+        first_day = self.anchor_date.replace(day=1)
+        self._month_grid_start = first_day - timedelta(days=first_day.weekday())
+        self.title_var.set(f"{MONTH_NAMES[first_day.month - 1]} de {first_day.year}")
+        entries_by_day = self._entries_by_day(self._month_grid_start, self._month_grid_start + timedelta(days=42))
+        today = date.today()
+        for cell_index, (day_label, listbox) in enumerate(self._month_cells):
+            day = self._month_grid_start + timedelta(days=cell_index)
+            day_label.configure(text=str(day.day), foreground='black' if day.month == first_day.month else 'gray',
+                                font=('TkDefaultFont', 9, 'bold') if day == today else ('TkDefaultFont', 9))
+            self._fill_listbox(listbox, entries_by_day.get(day, []), self.MONTH_CELL_LINES)
+
+    def _render_week(self):
+        self._week_start = self.anchor_date - timedelta(days=self.anchor_date.weekday())
+        week_end = self._week_start + timedelta(days=6)
+        self.title_var.set(f"{self._week_start:%d/%m} a {week_end:%d/%m/%Y}")
+        entries_by_day = self._entries_by_day(self._week_start, week_end + timedelta(days=1))
+        for column, (day_label, listbox) in enumerate(self._week_columns):
+            day = self._week_start + timedelta(days=column)
+            day_label.configure(text=f"{WEEKDAY_NAMES[column][:3]} {day:%d/%m}")
+            self._fill_listbox(listbox, entries_by_day.get(day, []))
+
+    def _render_day(self):
+        day = self.anchor_date
+        self.title_var.set(f"{WEEKDAY_NAMES[day.weekday()]}, {day:%d/%m/%Y}")
+        self.day_list.delete(*self.day_list.get_children())
+        for (entry_date, task_id), field_name, task in self._entries_by_day(day, day + timedelta(days=1)).get(day, []):
+            if task.is_completed:
+                tag, status = 'completed', "Concluída"
+            elif field_name == 'due_at' and task.is_overdue():
+                tag, status = 'overdue', "Vencida"
+            else:
+                tag, status = ('created' if field_name == 'created_at' else ''), "Pendente"
+            self.day_list.insert('', tk.END, values=(f"{entry_date:%H:%M}", FIELD_LABELS[field_name], task_id, task.description, status),
+                                 tags=(tag,) if tag else ())
+
+    # --- Atualização e fechamento ---
+    def _on_repository_changed(self, event: str, tasks: list[Task]):
+        # O índice de datas já foi atualizado pela janela principal, que assina o repositório antes
+        if self._refresh_after_id is None:
+            self._refresh_after_id = self.after(0 if event == EVENT_RESET else self.REFRESH_DELAY_MS, self.render)
+
+    def _on_close(self):
+        self._unsubscribe()
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+        self.destroy()
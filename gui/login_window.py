@@ -2,22 +2,22 @@ import tkinter as tk
 from tkinter import messagebox, ttk
 import os # Necessário para os.path.exists, mas Config já usa pathlib
 
+from asset_cache import AssetCache
 from config import Config, logger, HAS_PIL
-if HAS_PIL:
-    from PIL import Image, ImageTk
-
 from services import UserService
-from .main_window import MainWindow # Importação relativa para MainWindow
+from repository import TaskPrefetcher
+from startup import startup_timer
+# PIL e MainWindow são importados sob demanda para a janela de login abrir mais rápido
 
 class LoginWindow:
     def __init__(self):
+        # Lê e indexa as tarefas em segundo plano enquanto o usuário digita a senha
+        self.task_prefetcher = TaskPrefetcher()
+        self.task_prefetcher.start()
+
         self.root = tk.Tk()
         
-        if Config.ICON_PATH.exists():
-            try:
-                self.root.iconbitmap(str(Config.ICON_PATH))
-            except Exception as e:
-                logger.warning(f"Não foi possível carregar o ícone da aplicação ({Config.ICON_PATH}): {str(e)}")
+        AssetCache.apply_window_icon(self.root)
         
         self.root.title(f"{Config.APP_NAME} - Login")
         
@@ -32,23 +32,23 @@ class LoginWindow:
         self.root.resizable(False, False)
 
         self.setup_ui()
+        self.root.after_idle(self._on_first_idle)
         self.root.mainloop()
+        self.task_prefetcher.discard() # Login abandonado (ou já concluído): nada mais a adotar
+
+    def _on_first_idle(self):
+        startup_timer.mark('janela_login')
+        startup_timer.report('login')
 
     def setup_ui(self):
         main_frame = ttk.Frame(self.root, padding="20")
         main_frame.pack(fill=tk.BOTH, expand=True)
 
         if Config.LOGO_PATH.exists() and HAS_PIL:
-            try:
-                image = Image.open(Config.LOGO_PATH)
-                # Redimensionar mantendo a proporção, se possível, ou usar um tamanho fixo como antes
-                # Exemplo: image.thumbnail((200, 60)) # thumbnail modifica a imagem in-place
-                image = image.resize((200, 60), Image.Resampling.LANCZOS)
-                self.logo_img = ImageTk.PhotoImage(image, master=self.root)
+            self.logo_img = AssetCache.photo_image(Config.LOGO_PATH, self.root, size=(200, 60))
+            if self.logo_img is not None:
                 logo_label = ttk.Label(main_frame, image=self.logo_img)
                 logo_label.pack(pady=(0, 10))
-            except Exception as e:
-                logger.warning(f"Não foi possível carregar a logo ({Config.LOGO_PATH}): {str(e)}")
         else:
             logger.info(f"Logo não encontrada em {Config.LOGO_PATH} ou PIL não disponível.")
 
@@ -116,5 +116,8 @@ class LoginWindow:
             return
 
         logger.info(f"Usuário {username} logado com sucesso.")
+        startup_timer.mark('login_confirmado')
         self.root.destroy() # Fecha a janela de login
-        MainWindow(username, users[username]['level']) # Abre a janela principal
\ No newline at end of file
+        with startup_timer.measure_import("gui.main_window"):
+            from .main_window import MainWindow
+        MainWindow(username, users[username]['level'], prefetched_repository=self.task_prefetcher.take()) # Abre a janela principal
\ No newline at end of file
@@ -1,37 +1,66 @@
 # gui/main_window.py
 import tkinter as tk
 from tkinter import messagebox, ttk
-from datetime import datetime # Já deve estar aqui, mas confirme
-import os
-import sys
-import webbrowser 
-import threading 
-import subprocess 
-import shutil 
+from datetime import datetime, timedelta
+import asyncio
 from pathlib import Path 
-import uuid 
 
-from config import Config, logger, HAS_PIL, ASSETS_DIR # ASSETS_DIR está importado
+from asset_cache import AssetCache
+from config import Config, logger, HAS_NUMPY, HAS_PIL, ASSETS_DIR # ASSETS_DIR está importado
+from date_index import TaskDateIndex
 from models import Task 
 from services import TaskService, UserService 
-from utils import Tooltip, PDFGenerator 
-from .user_manager_window import UserManagerWindow
-# A importação de RestoreBackupWindow será feita dentro do método para evitar ciclos
+from api_client import task_backend
+from repository import TaskRepository, EVENT_RESET, EVENT_REMOVED
+from task_filter import TaskFilter, TaskFilterCriteria, STATUS_ALL, STATUS_PENDING, STATUS_COMPLETED
+from startup import startup_timer
+from utils import Tooltip, PDFGenerator # utils só importa o fpdf quando um relatório é gerado
+from exporters import ExportFilter, TaskExporter
+from importer import TaskImporter, ImportSummary
+from sync_engine import ReplicaTaskService
+from metrics import Metrics
+from profiling import Profiler
+from report_jobs import ReportJob, ReportJobManager, JOB_DONE, JOB_FAILED
+from .async_bridge import AsyncBridge, open_with_default_app
+from .reminders import ReminderScheduler, ReminderWindow
+from .report_dialog import ReportDialog, REPORT_FORMAT_PDF
+from .stall_watchdog import StallWatchdog
+from .task_list_view import TaskListView
+# UserManagerWindow, RestoreBackupWindow, shutil e webbrowser são importados
+# dentro dos métodos que os usam, para não atrasar a abertura da janela principal
 
 class MainWindow:
-    def __init__(self, username: str, user_level: str):
+    FILTER_DEBOUNCE_MS = 200 # Espera após a última tecla antes de aplicar o filtro
+    FILTER_ANY = "(Todos)"
+    MENU_ICON_SIZE = (16, 16)
+    METRICS_FLUSH_MS = 60_000 # Intervalo de gravação do arquivo de métricas em Config.LOG_DIR
+
+    def __init__(self, username: str, user_level: str, prefetched_repository: TaskRepository | None = None):
         self.username = username
         self.user_level = user_level.lower() 
-        self.tasks: list[Task] = []  
-        self.icon_cache: dict[str, tk.PhotoImage] = {}  
+        self.repository = prefetched_repository or TaskRepository()
+        self.task_filter = TaskFilter()
+        self.date_index: TaskDateIndex | None = None # Montado na primeira abertura do calendário
+        # Arquivos locais, o servidor de api_server.py (AGENDA_API_URL) ou a réplica local sincronizada (AGENDA_SHARED_DIR)
+        self.task_service = task_backend()
+        self._filter_after_id: str | None = None
+        # Enquanto uma carga está em andamento o repositório vai ser substituído: alterações feitas nele se perderiam
+        self._tasks_loading = False
 
         self.root = tk.Tk()
+        # Toda E/S (carregar, salvar, backups, abrir relatórios) passa pelo loop asyncio da ponte
+        self.bridge = AsyncBridge(self.root)
+        self.stall_watchdog = StallWatchdog(self.root) # Registra no log os travamentos da thread do Tk
+        self.report_jobs = ReportJobManager() # Relatórios e exportações rodam numa fila com pool limitado
+        self.report_queue_window = None
+        self.analytics_window = None
+        self.performance_window = None
+        self.calendar_window = None
+        self.reminder_window: ReminderWindow | None = None
+        self.profiling_var: tk.BooleanVar | None = None
+        Profiler.set_data_sizes_provider(self._profile_data_sizes)
         
-        if Config.ICON_PATH.exists():
-            try:
-                self.root.iconbitmap(str(Config.ICON_PATH))
-            except Exception as e:
-                logger.warning(f"Não foi possível carregar o ícone da aplicação ({Config.ICON_PATH}): {e}")
+        AssetCache.apply_window_icon(self.root)
         
         self.root.title(f"{Config.APP_NAME} - Usuário: {username} ({user_level.capitalize()})")
         
@@ -39,14 +68,45 @@ class MainWindow:
         self.root.minsize(800, 600) 
 
         self.setup_ui()
-        self.load_tasks_from_service()
-        self.update_task_lists_display()
+        # Um único timer do Tk para o próximo lembrete/vencimento, atualizado pelas mudanças do repositório
+        self.reminder_scheduler = ReminderScheduler(self.root, self._on_reminders_due, self._on_tasks_overdue)
+        self.repository.subscribe(self._on_repository_changed)
+        if prefetched_repository is not None:
+            # Tarefas já lidas e indexadas durante o login: apenas popula as listas
+            logger.info(f"Adotando {len(self.repository)} tarefas pré-carregadas durante o login.")
+            self._on_repository_changed(EVENT_RESET, [])
+        else:
+            self.load_tasks_from_service()
         
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
+        self.root.after_idle(self._on_first_idle)
         self.root.mainloop() 
 
+    def _on_first_idle(self):
+        startup_timer.mark('janela_principal')
+        startup_timer.report('principal')
+        self.stall_watchdog.start() # Só depois da montagem da janela, que não é travamento
+        self.root.after(self.METRICS_FLUSH_MS, self._flush_metrics)
+        if isinstance(self.task_service, ReplicaTaskService):
+            self.task_service.subscribe(self._on_remote_changes)
+            self.task_service.sync_engine.start()
+
+    def _flush_metrics(self):
+        self.bridge.submit(asyncio.to_thread(Metrics.write_metrics_file))
+        self.root.after(self.METRICS_FLUSH_MS, self._flush_metrics)
+
     def _on_closing(self):
         logger.info(f"Aplicação encerrada pelo usuário {self.username} através do fechamento da janela principal.")
+        self._shutdown()
+
+    def _shutdown(self):
+        self.stall_watchdog.stop()
+        self.reminder_scheduler.stop()
+        self.report_jobs.shutdown() # Cancela os relatórios pendentes
+        self.bridge.shutdown() # Espera as gravações pendentes terminarem
+        if isinstance(self.task_service, ReplicaTaskService):
+            self.task_service.sync_engine.stop() # Último envio das alterações locais para a pasta compartilhada
+        Metrics.write_metrics_file()
         self.root.destroy() 
 
     def _load_icon(self, icon_path: Path | None) -> tk.PhotoImage | None: 
@@ -54,15 +114,7 @@ class MainWindow:
             if icon_path: 
                 logger.warning(f"Arquivo de ícone não encontrado ou caminho inválido: {icon_path}")
             return None
-        
-        path_str = str(icon_path)
-        if path_str not in self.icon_cache:
-            try:
-                self.icon_cache[path_str] = tk.PhotoImage(file=path_str, master=self.root)
-            except tk.TclError as e:
-                logger.error(f"Erro ao carregar PhotoImage para {icon_path}: {e}")
-                return None
-        return self.icon_cache[path_str]
+        return AssetCache.photo_image(icon_path, self.root, size=self.MENU_ICON_SIZE)
 
     def center_main_window(self, width: int = 1000, height: int = 700):
         self.root.update_idletasks() 
@@ -105,7 +157,12 @@ class MainWindow:
         task_menu.add_command(label="Editar Tarefa Selecionada", command=self.edit_selected_task, image=edit_task_icon, compound=tk.LEFT, accelerator="F2")
         self.root.bind_all("<F2>", lambda event: self.edit_selected_task()) 
         task_menu.add_separator()
-        task_menu.add_command(label="Gerar Relatório de Tarefas...", command=self.generate_report_ui, image=report_icon_menu, compound=tk.LEFT)
+        task_menu.add_command(label="Gerar Relatório / Exportar...", command=self.generate_report_ui, image=report_icon_menu, compound=tk.LEFT)
+        task_menu.add_command(label="Fila de Relatórios...", command=self.open_report_queue_window)
+        task_menu.add_command(label="Análise de Produtividade...", command=self.open_analytics_window)
+        task_menu.add_command(label="Calendário...", command=self.open_calendar_window)
+        task_menu.add_separator()
+        task_menu.add_command(label="Importar Tarefas (CSV/JSON Lines)...", command=self.import_tasks_ui)
         menubar.add_cascade(label="Tarefas", menu=task_menu)
 
         if self.user_level == 'admin':
@@ -117,6 +174,8 @@ class MainWindow:
             tools_menu.add_command(label="Gerenciar Usuários...", command=self.open_user_manager_ui, image=user_icon, compound=tk.LEFT)
             tools_menu.add_command(label="Backup de Dados...", command=self.create_backup_ui) 
             tools_menu.add_command(label="Restaurar Backup...", command=self.open_restore_backup_dialog, image=restore_icon, compound=tk.LEFT)
+            tools_menu.add_separator()
+            tools_menu.add_command(label="Desempenho...", command=self.open_performance_window)
             menubar.add_cascade(label="Ferramentas", menu=tools_menu)
 
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -125,12 +184,96 @@ class MainWindow:
 
         help_menu.add_command(label=f"Sobre o {Config.APP_NAME}", command=self.show_about_dialog, image=about_icon, compound=tk.LEFT)
         help_menu.add_command(label="Documentação Online", command=self.open_documentation_link, image=help_doc_icon, compound=tk.LEFT)
+        help_menu.add_separator()
+        # Marcado já na abertura quando a sessão inteira está sendo perfilada (AGENDA_PROFILE/--profile)
+        self.profiling_var = tk.BooleanVar(master=self.root, value=Profiler.is_active())
+        help_menu.add_checkbutton(label="Perfilar Desempenho (diagnóstico)", variable=self.profiling_var, command=self.toggle_profiling)
         menubar.add_cascade(label="Ajuda", menu=help_menu)
 
         self.root.config(menu=menubar) 
 
+    def setup_filter_bar(self):
+        filter_frame = ttk.Frame(self.root, padding=(10, 8, 10, 0))
+        filter_frame.pack(fill=tk.X)
+
+        ttk.Label(filter_frame, text="Filtrar:").pack(side=tk.LEFT)
+        self.filter_text_var = tk.StringVar()
+        filter_entry = ttk.Entry(filter_frame, textvariable=self.filter_text_var, width=28)
+        filter_entry.pack(side=tk.LEFT, padx=(5, 10))
+        Tooltip(filter_entry, "Busca por ID, descrição, categoria ou usuário (Ctrl+F)")
+        self.root.bind_all("<Control-f>", lambda event: filter_entry.focus_set())
+        filter_entry.bind("<Escape>", lambda event: self.clear_filter())
+
+        self.filter_category_var = tk.StringVar(value=self.FILTER_ANY)
+        self.filter_user_var = tk.StringVar(value=self.FILTER_ANY)
+        self.filter_priority_var = tk.StringVar(value=self.FILTER_ANY)
+        self.filter_status_var = tk.StringVar(value=self.FILTER_ANY)
+
+        ttk.Label(filter_frame, text="Categoria:").pack(side=tk.LEFT)
+        category_combo = ttk.Combobox(filter_frame, textvariable=self.filter_category_var, width=14, state='readonly')
+        category_combo.configure(postcommand=lambda: category_combo.configure(values=self._filter_choices('category')))
+        category_combo.pack(side=tk.LEFT, padx=(5, 10))
+
+        ttk.Label(filter_frame, text="Usuário:").pack(side=tk.LEFT)
+        user_combo = ttk.Combobox(filter_frame, textvariable=self.filter_user_var, width=12, state='readonly')
+        user_combo.configure(postcommand=lambda: user_combo.configure(values=self._filter_choices('user')))
+        user_combo.pack(side=tk.LEFT, padx=(5, 10))
+
+        ttk.Label(filter_frame, text="Prioridade:").pack(side=tk.LEFT)
+        ttk.Combobox(filter_frame, textvariable=self.filter_priority_var, width=8, state='readonly',
+                     values=[self.FILTER_ANY] + [self.get_priority_label(p) for p in (1, 2, 3)]).pack(side=tk.LEFT, padx=(5, 10))
+
+        ttk.Label(filter_frame, text="Status:").pack(side=tk.LEFT)
+        ttk.Combobox(filter_frame, textvariable=self.filter_status_var, width=11, state='readonly',
+                     values=[self.FILTER_ANY, "Pendentes", "Concluídas"]).pack(side=tk.LEFT, padx=(5, 10))
+
+        ttk.Button(filter_frame, text="Limpar", command=self.clear_filter).pack(side=tk.LEFT)
+
+        for filter_var in (self.filter_text_var, self.filter_category_var, self.filter_user_var,
+                           self.filter_priority_var, self.filter_status_var):
+            filter_var.trace_add('write', lambda *args: self._schedule_filter())
+
+    def _filter_choices(self, attribute: str) -> list[str]:
+        distinct_values = {getattr(task, attribute) for task in self.repository if getattr(task, attribute)}
+        return [self.FILTER_ANY] + sorted(distinct_values, key=str.casefold)
+
+    def _current_filter_criteria(self) -> TaskFilterCriteria:
+        def selected(var: tk.StringVar) -> str | None:
+            value = var.get()
+            return None if value == self.FILTER_ANY else value
+        priority_label = selected(self.filter_priority_var)
+        priority = next((p for p in (1, 2, 3) if self.get_priority_label(p) == priority_label), None)
+        status = {"Pendentes": STATUS_PENDING, "Concluídas": STATUS_COMPLETED}.get(self.filter_status_var.get(), STATUS_ALL)
+        return TaskFilterCriteria(
+            text=self.filter_text_var.get(),
+            category=selected(self.filter_category_var),
+            user=selected(self.filter_user_var),
+            priority=priority,
+            status=status
+        )
+
+    def _schedule_filter(self):
+        # Debounce: reinicia a contagem a cada alteração e só filtra quando o usuário para de digitar
+        if self._filter_after_id is not None:
+            self.root.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.root.after(self.FILTER_DEBOUNCE_MS, self._apply_filter)
+
+    def _apply_filter(self):
+        self._filter_after_id = None
+        visible_ids = self.task_filter.apply(self._current_filter_criteria())
+        self.pending_view.set_filter(visible_ids)
+        self.completed_view.set_filter(visible_ids)
+        self.update_task_lists_display()
+
+    def clear_filter(self):
+        self.filter_text_var.set("")
+        for filter_var in (self.filter_category_var, self.filter_user_var,
+                           self.filter_priority_var, self.filter_status_var):
+            filter_var.set(self.FILTER_ANY)
+
     def setup_ui(self):
         self.setup_menu() 
+        self.setup_filter_bar()
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
@@ -138,8 +281,9 @@ class MainWindow:
         self.notebook.add(self.pending_frame, text=" Tarefas Pendentes ") 
         self.pending_list = ttk.Treeview(
             self.pending_frame,
-            columns=('id', 'description', 'priority', 'category', 'created_by', 'created_at'), 
-            show='headings' 
+            columns=('id', 'description', 'priority', 'category', 'created_by', 'created_at', 'due_at'), 
+            show='headings',
+            selectmode='extended' # Seleção múltipla (Ctrl/Shift) para ações em lote
         )
         self.pending_list.heading('id', text='ID')
         self.pending_list.heading('description', text='Descrição')
@@ -147,16 +291,36 @@ class MainWindow:
         self.pending_list.heading('category', text='Categoria')
         self.pending_list.heading('created_by', text='Criado por') 
         self.pending_list.heading('created_at', text='Criada em')
+        self.pending_list.heading('due_at', text='Vence em')
         self.pending_list.column('id', width=80, anchor=tk.W, stretch=tk.NO) 
         self.pending_list.column('description', width=330, stretch=tk.YES) 
         self.pending_list.column('priority', width=100, anchor=tk.CENTER, stretch=tk.NO)
         self.pending_list.column('category', width=120, anchor=tk.W, stretch=tk.NO)
         self.pending_list.column('created_by', width=100, anchor=tk.W, stretch=tk.NO) 
         self.pending_list.column('created_at', width=140, anchor=tk.CENTER, stretch=tk.NO)
+        self.pending_list.column('due_at', width=140, anchor=tk.CENTER, stretch=tk.NO)
         self.pending_list.tag_configure('priority_1', background='#e6ffe6')  
         self.pending_list.tag_configure('priority_2', background='#fff2cc')  
         self.pending_list.tag_configure('priority_3', background='#ffcccc')  
-        self.pending_list.bind("<Double-1>", lambda event: self.edit_selected_task()) 
+        self.pending_list.tag_configure('overdue', foreground='#b00000') # Só o texto: o fundo continua indicando a prioridade
+        self.pending_list.bind("<Double-1>", lambda event: self.edit_selected_task())
+        self.pending_list.bind("<Button-3>", lambda event: self._show_task_context_menu(event, self.pending_list))
+        self.pending_list.bind("<Control-a>", lambda event: self._select_all_in_current_list())
+        self.pending_list.bind("<Delete>", lambda event: self.delete_selected_task())
+        self.pending_view = TaskListView(
+            self.pending_list,
+            sort_key=lambda t: (-t.priority, self._parse_iso_datetime(t.created_at)),
+            row_values=lambda t: (
+                t.task_id,
+                t.description,
+                self.get_priority_label(t.priority),
+                t.category,
+                t.user,
+                self.format_display_datetime(t.created_at),
+                self.format_display_datetime(t.due_at) if t.due_at else ""
+            ),
+            row_tags=lambda t: (f'priority_{t.priority}', 'overdue') if t.is_overdue() else (f'priority_{t.priority}',)
+        )
         pending_scrollbar_y = ttk.Scrollbar(self.pending_frame, orient="vertical", command=self.pending_list.yview)
         pending_scrollbar_x = ttk.Scrollbar(self.pending_frame, orient="horizontal", command=self.pending_list.xview)
         self.pending_list.configure(yscrollcommand=pending_scrollbar_y.set, xscrollcommand=pending_scrollbar_x.set)
@@ -177,18 +341,20 @@ class MainWindow:
         Tooltip(btn_edit, "Editar tarefa selecionada (F2)")
         btn_complete = ttk.Button(pending_button_frame, text="Concluir", image=icon_btn_complete, compound=tk.LEFT, command=self.complete_selected_task)
         btn_complete.pack(side=tk.LEFT, padx=5)
-        Tooltip(btn_complete, "Marcar tarefa selecionada como concluída (Ctrl+Enter)")
+        Tooltip(btn_complete, "Marcar tarefas selecionadas como concluídas (Ctrl+Enter)")
         self.root.bind_all("<Control-Return>", lambda event: self.complete_selected_task()) 
         btn_delete = ttk.Button(pending_button_frame, text="Remover", image=icon_btn_delete, compound=tk.LEFT, command=self.delete_selected_task)
         btn_delete.pack(side=tk.LEFT, padx=5)
-        Tooltip(btn_delete, "Remover tarefa selecionada (Delete)")
+        Tooltip(btn_delete, "Remover tarefas selecionadas (Delete)")
+
         
         self.completed_frame = ttk.Frame(self.notebook, padding=10)
         self.notebook.add(self.completed_frame, text=" Tarefas Concluídas ")
         self.completed_list = ttk.Treeview(
             self.completed_frame,
             columns=('id', 'description', 'category', 'created_by', 'completed_by_user', 'completed_at'), 
-            show='headings'
+            show='headings',
+            selectmode='extended'
         )
         self.completed_list.heading('id', text='ID')
         self.completed_list.heading('description', text='Descrição')
@@ -202,6 +368,21 @@ class MainWindow:
         self.completed_list.column('created_by', width=100, anchor=tk.W, stretch=tk.NO) 
         self.completed_list.column('completed_by_user', width=100, anchor=tk.W, stretch=tk.NO) 
         self.completed_list.column('completed_at', width=140, anchor=tk.CENTER, stretch=tk.NO)
+        self.completed_view = TaskListView(
+            self.completed_list,
+            sort_key=self._completed_sort_key,
+            row_values=lambda t: (
+                t.task_id,
+                t.description,
+                t.category,
+                t.user,
+                t.completed_by or "N/A",
+                self.format_display_datetime(t.completed_at)
+            )
+        )
+        self.completed_list.bind("<Button-3>", lambda event: self._show_task_context_menu(event, self.completed_list))
+        self.completed_list.bind("<Control-a>", lambda event: self._select_all_in_current_list())
+        self.completed_list.bind("<Delete>", lambda event: self.delete_selected_task())
         completed_scrollbar_y = ttk.Scrollbar(self.completed_frame, orient="vertical", command=self.completed_list.yview)
         completed_scrollbar_x = ttk.Scrollbar(self.completed_frame, orient="horizontal", command=self.completed_list.xview)
         self.completed_list.configure(yscrollcommand=completed_scrollbar_y.set, xscrollcommand=completed_scrollbar_x.set)
@@ -217,7 +398,7 @@ class MainWindow:
             command=self.reopen_selected_task, state=tk.DISABLED if self.user_level != 'admin' else tk.NORMAL 
         )
         btn_reopen.pack(side=tk.LEFT, padx=5)
-        Tooltip(btn_reopen, "Reabrir tarefa concluída (Apenas Administradores)")
+        Tooltip(btn_reopen, "Reabrir tarefas concluídas selecionadas (Apenas Administradores)")
         btn_report_completed = ttk.Button(completed_button_frame, text="Gerar Relatório", image=icon_btn_report_tab, compound=tk.LEFT, command=self.generate_report_ui)
         btn_report_completed.pack(side=tk.LEFT, padx=5)
         Tooltip(btn_report_completed, "Gerar relatório em PDF das tarefas concluídas")
@@ -226,25 +407,85 @@ class MainWindow:
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
         self.update_status_bar("Pronto.") 
 
-    def load_tasks_from_service(self):
-        try:
-            tasks_data = TaskService.load_tasks() 
-            self.tasks = [Task.from_dict(task_dict) for task_dict in tasks_data]
-            logger.info(f"Total de {len(self.tasks)} tarefas carregadas do serviço.")
-        except Exception as e:
-            logger.error(f"Erro crítico ao carregar tarefas do serviço: {e}", exc_info=True)
-            messagebox.showerror("Erro Crítico", "Não foi possível carregar as tarefas. Verifique os logs.", parent=self.root)
-            self.tasks = [] 
+    def load_tasks_from_service(self, on_loaded=None):
+        """Carrega as tarefas de forma assíncrona; `on_loaded()` é chamado na thread do Tk ao terminar.
+
+        As alterações ficam bloqueadas (`_tasks_ready`) até a carga terminar com sucesso.
+        """
+        def _on_success(tasks_data):
+            self._tasks_loading = False
+            self.repository.reset(Task.from_dict(task_dict) for task_dict in tasks_data)
+            logger.info(f"Total de {len(self.repository)} tarefas carregadas do serviço.")
+            if on_loaded:
+                on_loaded()
+        def _on_error(error):
+            logger.error(f"Erro crítico ao carregar tarefas do serviço: {error}", exc_info=error)
+            # Continua bloqueado: salvar a lista vazia apagaria as tarefas do arquivo
+            messagebox.showerror("Erro Crítico", "Não foi possível carregar as tarefas. Verifique os logs e tente Atualizar (F5).", parent=self.root)
+            self.repository.reset([]) 
+        self._tasks_loading = True
+        self.update_status_bar("Carregando tarefas...")
+        self.bridge.submit(self.task_service.load_tasks_async(), on_success=_on_success, on_error=_on_error)
+
+    def _tasks_ready(self) -> bool:
+        """False (com aviso na barra de status) enquanto as tarefas são carregadas."""
+        if self._tasks_loading:
+            self.update_status_bar("Aguarde: as tarefas ainda estão sendo carregadas.")
+            return False
+        return True
 
     def save_tasks_to_service(self):
-        try:
-            tasks_data = [task.to_dict() for task in self.tasks]
-            TaskService.save_tasks(tasks_data)
-            logger.info("Tarefas salvas com sucesso no serviço.")
-        except Exception as e:
-            logger.error(f"Erro crítico ao salvar tarefas no serviço: {e}", exc_info=True)
+        # O instantâneo é tirado aqui, na thread do Tk; a gravação roda em segundo plano, em ordem
+        tasks_data = self.repository.to_dicts()
+        def _on_error(error):
+            logger.error(f"Erro crítico ao salvar tarefas no serviço: {error}", exc_info=error)
             messagebox.showerror("Erro Crítico", "Não foi possível salvar as tarefas. Verifique os logs.", parent=self.root)
+        self.bridge.submit(self.task_service.save_tasks_async(tasks_data),
+                           on_success=lambda _: logger.info("Tarefas salvas com sucesso no serviço."),
+                           on_error=_on_error)
     
+    def _on_remote_changes(self, changed: list[dict], removed_ids: list[str]):
+        # Chamado na thread de sincronização
+        self.bridge.call_soon_in_tk(self._apply_remote_changes, changed, removed_ids)
+
+    def _apply_remote_changes(self, changed: list[dict], removed_ids: list[str]):
+        self.repository.put_many(Task.from_dict(task_dict) for task_dict in changed)
+        self.repository.remove_many([task_id for task_id in removed_ids if task_id in self.repository])
+        # A confirmação entra na fila das gravações: as pedidas antes dela ainda têm o estado antigo
+        self.bridge.submit(self.task_service.acknowledge_async([task_dict['task_id'] for task_dict in changed] + removed_ids))
+        logger.info(f"Sincronização: {len(changed)} tarefa(s) atualizada(s) e {len(removed_ids)} removida(s) por outros computadores.")
+
+    def _on_tasks_overdue(self, task_ids: list[str]):
+        # Redesenha as linhas para aplicar a etiqueta 'overdue'
+        for task_id in task_ids:
+            task = self.repository.get(task_id)
+            if task is not None and task_id in self.pending_view:
+                self.pending_view.upsert(task)
+
+    def _on_reminders_due(self, task_ids: list[str]):
+        tasks = [task for task in (self.repository.get(task_id) for task_id in task_ids)
+                 if task is not None and not task.is_completed and task.user == self.username]
+        if not tasks:
+            return
+        if self.reminder_window is None or not self.reminder_window.winfo_exists():
+            self.reminder_window = ReminderWindow(self, on_snooze=self._snooze_reminders, on_dismiss=self._dismiss_reminders)
+        self.reminder_window.add_tasks(tasks)
+        logger.info(f"{len(tasks)} lembrete(s) exibido(s) para {self.username}.")
+
+    def _set_remind_at(self, task_ids: list[str], remind_at: str | None):
+        if not self._tasks_ready():
+            return
+        task_ids = [task_id for task_id in task_ids if task_id in self.repository]
+        if task_ids:
+            self.repository.update_many(task_ids, remind_at=remind_at)
+            self.save_tasks_to_service()
+
+    def _snooze_reminders(self, task_ids: list[str]):
+        self._set_remind_at(task_ids, (datetime.now() + timedelta(minutes=ReminderWindow.SNOOZE_MINUTES)).isoformat(timespec='seconds'))
+
+    def _dismiss_reminders(self, task_ids: list[str]):
+        self._set_remind_at(task_ids, None)
+
     def get_priority_label(self, priority_value: int) -> str:
         return {1: "Baixa", 2: "Média", 3: "Alta"}.get(priority_value, "N/A")
 
@@ -256,54 +497,62 @@ class MainWindow:
             logger.warning(f"Data/hora em formato ISO inválido para exibição: {iso_datetime_str}")
             return iso_datetime_str[:16] 
 
-    def update_task_lists_display(self):
-        for item in self.pending_list.get_children(): self.pending_list.delete(item)
-        for item in self.completed_list.get_children(): self.completed_list.delete(item)
+    @staticmethod
+    def _parse_iso_datetime(iso_datetime_str: str | None) -> datetime:
+        if not iso_datetime_str:
+            return datetime.min
+        try:
+            return datetime.fromisoformat(iso_datetime_str).replace(tzinfo=None)
+        except ValueError:
+            return datetime.min
 
-        pending_display_tasks = []
-        completed_display_tasks = []
-        
-        for task in self.tasks: 
-            if not task.is_completed:
-                pending_display_tasks.append(task)
-            else:
-                completed_display_tasks.append(task)
-        
-        pending_display_tasks.sort(key=lambda t: (-t.priority, datetime.fromisoformat(t.created_at)))
-
-        for task_obj in pending_display_tasks:
-            display_id = task_obj.task_id
-            self.pending_list.insert(
-                '', 'end',
-                iid=task_obj.task_id, 
-                values=(
-                    display_id, 
-                    task_obj.description,
-                    self.get_priority_label(task_obj.priority),
-                    task_obj.category,
-                    task_obj.user, 
-                    self.format_display_datetime(task_obj.created_at)
-                ),
-                tags=(f'priority_{task_obj.priority}',) 
-            )
-        
-        completed_display_tasks.sort(key=lambda t: datetime.fromisoformat(t.completed_at) if t.completed_at else datetime.min, reverse=True)
-
-        for task_obj in completed_display_tasks:
-            display_id = task_obj.task_id
-            self.completed_list.insert('', 'end', 
-                iid=task_obj.task_id,
-                values=(
-                    display_id,
-                    task_obj.description,
-                    task_obj.category,
-                    task_obj.user, 
-                    task_obj.completed_by or "N/A", 
-                    self.format_display_datetime(task_obj.completed_at)
-                )
-            )
-        
-        self.update_status_bar(f"Pendentes: {len(pending_display_tasks)} | Concluídas: {len(completed_display_tasks)} | Total: {len(self.tasks)}")
+    @classmethod
+    def _completed_sort_key(cls, task: Task) -> tuple:
+        # Mais recentes primeiro; tarefas sem data de conclusão vão para o fim
+        completed_dt = cls._parse_iso_datetime(task.completed_at)
+        if completed_dt == datetime.min:
+            return (1, 0.0)
+        return (0, -(completed_dt - datetime.min).total_seconds())
+
+    @Metrics.timed("gui.atualizar_listas")
+    def _on_repository_changed(self, event: str, tasks: list[Task]):
+        """Aplica nas Treeviews apenas as tarefas afetadas pela mudança."""
+        if event == EVENT_RESET:
+            self.reminder_scheduler.reset(self.repository)
+            self.task_filter.reset(self.repository)
+            if self.date_index is not None:
+                self.date_index.reset(self.repository)
+            visible_ids = self.task_filter.visible_ids
+            self.pending_view.reset(self.repository.pending(), visible_ids)
+            self.completed_view.reset(self.repository.completed(), visible_ids)
+        elif event == EVENT_REMOVED:
+            self.reminder_scheduler.forget(task.task_id for task in tasks)
+            self.task_filter.forget(task.task_id for task in tasks)
+            if self.date_index is not None:
+                self.date_index.forget(task.task_id for task in tasks)
+            for task in tasks:
+                self.pending_view.remove(task.task_id)
+                self.completed_view.remove(task.task_id)
+        else:
+            self.reminder_scheduler.update(tasks)
+            # O filtro é atualizado antes das views, que consultam o conjunto de IDs visíveis
+            self.task_filter.update(tasks)
+            if self.date_index is not None:
+                self.date_index.update(tasks)
+            for task in tasks:
+                target_view, other_view = ((self.completed_view, self.pending_view) if task.is_completed
+                                           else (self.pending_view, self.completed_view))
+                other_view.remove(task.task_id)
+                target_view.upsert(task)
+        self.update_task_lists_display()
+
+    @Metrics.timed("gui.atualizar_contadores")
+    def update_task_lists_display(self):
+        counts_message = f"Pendentes: {self.repository.pending_count} | Concluídas: {self.repository.completed_count} | Total: {len(self.repository)}"
+        visible_ids = self.task_filter.visible_ids
+        if visible_ids is not None:
+            counts_message = f"Filtro: {len(visible_ids)} de {len(self.repository)} | " + counts_message
+        self.update_status_bar(counts_message)
 
     def update_status_bar(self, message: str):
         full_message = f"{message} | Usuário: {self.username} ({self.user_level.capitalize()})"
@@ -311,9 +560,9 @@ class MainWindow:
 
     def refresh_tasks_ui(self):
         logger.info("Atualizando interface de tarefas a partir do comando do usuário...")
-        self.load_tasks_from_service()
-        self.update_task_lists_display()
-        messagebox.showinfo("Atualizado", "Lista de tarefas foi atualizada com sucesso.", parent=self.root)
+        self.load_tasks_from_service(
+            on_loaded=lambda: messagebox.showinfo("Atualizado", "Lista de tarefas foi atualizada com sucesso.", parent=self.root)
+        )
 
     def _center_dialog_on_main(self, dialog_window: tk.Toplevel, width: int, height: int):
         self.root.update_idletasks()
@@ -329,12 +578,14 @@ class MainWindow:
         dialog_window.grab_set() 
 
     def open_new_task_dialog(self):
+        if not self._tasks_ready():
+            return
         dialog = tk.Toplevel(self.root)
         dialog.title("Nova Tarefa")
-        self._center_dialog_on_main(dialog, width=500, height=380)
+        self._center_dialog_on_main(dialog, width=500, height=450)
         main_dialog_frame = ttk.Frame(dialog, padding=15)
         main_dialog_frame.pack(fill=tk.BOTH, expand=True)
-        ttk.Label(main_dialog_frame, text="Descrição (máx 500 caracteres):").pack(anchor=tk.W, pady=(0,2))
+        ttk.Label(main_dialog_frame, text=f"Descrição (máx {TaskService.MAX_DESCRIPTION_LENGTH} caracteres):").pack(anchor=tk.W, pady=(0,2))
         desc_text_frame = ttk.Frame(main_dialog_frame)
         desc_text_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         description_text_widget = tk.Text(desc_text_frame, height=8, width=50, wrap=tk.WORD, relief=tk.SOLID, borderwidth=1)
@@ -354,6 +605,7 @@ class MainWindow:
         ttk.Label(options_frame, text="Categoria:").grid(row=1, column=0, sticky=tk.W, padx=(0,5))
         category_entry_widget = ttk.Entry(options_frame, width=30)
         category_entry_widget.grid(row=1, column=1, sticky=tk.EW, pady=(0,5))
+        due_entry_widget, remind_entry_widget = self._add_schedule_fields(options_frame, first_row=2)
         options_frame.columnconfigure(1, weight=1) 
         action_button_frame = ttk.Frame(main_dialog_frame)
         action_button_frame.pack(fill=tk.X, pady=(15,0))
@@ -361,39 +613,74 @@ class MainWindow:
             description = description_text_widget.get("1.0", tk.END).strip()
             category = category_entry_widget.get().strip()
             priority = priority_var.get()
-            if not description:
-                messagebox.showerror("Erro", "A descrição da tarefa é obrigatória.", parent=dialog)
+            validation_error = TaskService.validate_task_fields(description, category, priority)
+            if validation_error:
+                messagebox.showerror("Erro", validation_error, parent=dialog)
                 return
-            if len(description) > 500:
-                messagebox.showerror("Erro", "A descrição não pode exceder 500 caracteres.", parent=dialog)
+            try:
+                due_at = TaskService.parse_datetime_input(due_entry_widget.get())
+                remind_at = TaskService.parse_datetime_input(remind_entry_widget.get())
+            except ValueError as e:
+                messagebox.showerror("Erro", str(e), parent=dialog)
                 return
-            if len(category) > 50:
-                 messagebox.showerror("Erro", "A categoria não pode exceder 50 caracteres.", parent=dialog)
-                 return
-            new_task_id_str = TaskService.get_next_task_id()
-            new_task_obj = Task(task_id=new_task_id_str, description=description, 
-                                user=self.username, priority=priority, category=category)
-            self.tasks.append(new_task_obj)
-            self.save_tasks_to_service()
-            self.update_task_lists_display()
-            logger.info(f"Nova tarefa '{new_task_obj.task_id}' criada por {self.username}.")
-            dialog.destroy()
-        ttk.Button(action_button_frame, text="Salvar Tarefa", command=save_action).pack(side=tk.LEFT, padx=10)
+            def _on_id_reserved(reserved_id: int):
+                if not dialog.winfo_exists():
+                    return # Diálogo cancelado enquanto o ID era reservado
+                if not self._tasks_ready():
+                    save_button.config(state=tk.NORMAL) # Uma recarga começou nesse meio tempo: o usuário tenta de novo
+                    return
+                # O repositório cobre tarefas ainda não gravadas (ex.: logo após uma importação); o backend, as de outros clientes
+                new_task_id_str = str(max(reserved_id, self.repository.highest_numeric_id() + 1))
+                new_task_obj = Task(task_id=new_task_id_str, description=description, 
+                                    user=self.username, priority=priority, category=category,
+                                    due_at=due_at, remind_at=remind_at)
+                self.repository.add(new_task_obj)
+                self.save_tasks_to_service()
+                logger.info(f"Nova tarefa '{new_task_obj.task_id}' criada por {self.username}.")
+                dialog.destroy()
+            def _on_reserve_error(error):
+                logger.error(f"Erro ao reservar o ID da nova tarefa: {error}", exc_info=error)
+                if dialog.winfo_exists():
+                    save_button.config(state=tk.NORMAL)
+                    messagebox.showerror("Erro", f"Não foi possível criar a tarefa:\n{error}", parent=dialog)
+            # A reserva lê o tasks.json ou consulta o servidor: fora da thread do Tk
+            save_button.config(state=tk.DISABLED)
+            self.bridge.submit(asyncio.to_thread(self.task_service.reserve_task_ids, 1),
+                               on_success=_on_id_reserved, on_error=_on_reserve_error)
+        save_button = ttk.Button(action_button_frame, text="Salvar Tarefa", command=save_action)
+        save_button.pack(side=tk.LEFT, padx=10)
         ttk.Button(action_button_frame, text="Cancelar", command=dialog.destroy).pack(side=tk.RIGHT, padx=10)
         description_text_widget.focus_set() 
         dialog.wait_window() 
     
+    def _add_schedule_fields(self, options_frame: ttk.Frame, first_row: int, task: Task | None = None) -> tuple[ttk.Entry, ttk.Entry]:
+        """Campos opcionais de vencimento e lembrete (DD/MM/AAAA HH:MM) dos diálogos de tarefa."""
+        entries = []
+        for row_offset, (label, value) in enumerate((("Vencimento:", task.due_at if task else None),
+                                                     ("Lembrete:", task.remind_at if task else None))):
+            ttk.Label(options_frame, text=label).grid(row=first_row + row_offset, column=0, sticky=tk.W, padx=(0,5))
+            entry_widget = ttk.Entry(options_frame, width=30)
+            if value:
+                entry_widget.insert(0, self.format_display_datetime(value))
+            entry_widget.grid(row=first_row + row_offset, column=1, sticky=tk.EW, pady=(0,5))
+            entries.append(entry_widget)
+        ttk.Label(options_frame, text="Datas opcionais, no formato DD/MM/AAAA HH:MM.", foreground='gray').grid(
+            row=first_row + 2, column=1, sticky=tk.W)
+        return entries[0], entries[1]
+
     def _get_selected_task_from_treeview(self, treeview: ttk.Treeview) -> Task | None:
         selected_items = treeview.selection() 
         if not selected_items:
             return None
         task_id_from_selection = selected_items[0] 
-        selected_task_obj = next((task for task in self.tasks if task.task_id == task_id_from_selection), None)
+        selected_task_obj = self.repository.get(task_id_from_selection)
         if not selected_task_obj: 
-            logger.warning(f"Task com ID '{task_id_from_selection}' selecionado na Treeview, mas não encontrado na lista self.tasks.")
+            logger.warning(f"Task com ID '{task_id_from_selection}' selecionado na Treeview, mas não encontrado no repositório.")
         return selected_task_obj
 
     def edit_selected_task(self):
+        if not self._tasks_ready():
+            return
         current_tab_index = self.notebook.index(self.notebook.select())
         task_to_edit: Task | None = None
         if current_tab_index == 0: 
@@ -409,10 +696,10 @@ class MainWindow:
             return
         dialog = tk.Toplevel(self.root)
         dialog.title(f"Editar Tarefa: {task_to_edit.task_id}") 
-        self._center_dialog_on_main(dialog, width=500, height=380)
+        self._center_dialog_on_main(dialog, width=500, height=450)
         main_dialog_frame = ttk.Frame(dialog, padding=15)
         main_dialog_frame.pack(fill=tk.BOTH, expand=True)
-        ttk.Label(main_dialog_frame, text="Descrição (máx 500 caracteres):").pack(anchor=tk.W, pady=(0,2))
+        ttk.Label(main_dialog_frame, text=f"Descrição (máx {TaskService.MAX_DESCRIPTION_LENGTH} caracteres):").pack(anchor=tk.W, pady=(0,2))
         desc_text_frame = ttk.Frame(main_dialog_frame)
         desc_text_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         description_text_widget = tk.Text(desc_text_frame, height=8, width=50, wrap=tk.WORD, relief=tk.SOLID, borderwidth=1)
@@ -434,6 +721,7 @@ class MainWindow:
         category_entry_widget = ttk.Entry(options_frame, width=30)
         category_entry_widget.insert(0, task_to_edit.category) 
         category_entry_widget.grid(row=1, column=1, sticky=tk.EW, pady=(0,5))
+        due_entry_widget, remind_entry_widget = self._add_schedule_fields(options_frame, first_row=2, task=task_to_edit)
         options_frame.columnconfigure(1, weight=1)
         action_button_frame = ttk.Frame(main_dialog_frame)
         action_button_frame.pack(fill=tk.X, pady=(15,0))
@@ -441,20 +729,20 @@ class MainWindow:
             new_description = description_text_widget.get("1.0", tk.END).strip()
             new_category = category_entry_widget.get().strip()
             new_priority = priority_var.get()
-            if not new_description:
-                messagebox.showerror("Erro", "A descrição não pode estar vazia.", parent=dialog)
+            validation_error = TaskService.validate_task_fields(new_description, new_category, new_priority)
+            if validation_error:
+                messagebox.showerror("Erro", validation_error, parent=dialog)
                 return
-            if len(new_description) > 500:
-                messagebox.showerror("Erro", "A descrição não pode ultrapassar 500 caracteres.", parent=dialog)
+            try:
+                new_due_at = TaskService.parse_datetime_input(due_entry_widget.get())
+                new_remind_at = TaskService.parse_datetime_input(remind_entry_widget.get())
+            except ValueError as e:
+                messagebox.showerror("Erro", str(e), parent=dialog)
                 return
-            if len(new_category) > 50:
-                 messagebox.showerror("Erro", "A categoria não pode ultrapassar 50 caracteres.", parent=dialog)
-                 return
-            task_to_edit.description = new_description
-            task_to_edit.priority = new_priority
-            task_to_edit.category = new_category
+            self.repository.update(task_to_edit.task_id, description=new_description,
+                                   priority=new_priority, category=new_category,
+                                   due_at=new_due_at, remind_at=new_remind_at)
             self.save_tasks_to_service()
-            self.update_task_lists_display()
             logger.info(f"Tarefa '{task_to_edit.task_id}' editada por {self.username}.")
             dialog.destroy()
         ttk.Button(action_button_frame, text="Salvar Alterações", command=save_changes_action).pack(side=tk.LEFT, padx=10)
@@ -462,86 +750,378 @@ class MainWindow:
         description_text_widget.focus_set()
         dialog.wait_window()
 
+    def _get_selected_tasks_from_treeview(self, treeview: ttk.Treeview) -> list[Task]:
+        """Retorna todas as tarefas selecionadas (seleção múltipla), na ordem exibida."""
+        selected_tasks = []
+        for task_id in treeview.selection():
+            task = self.repository.get(task_id)
+            if task is None:
+                logger.warning(f"Task com ID '{task_id}' selecionado na Treeview, mas não encontrado no repositório.")
+                continue
+            selected_tasks.append(task)
+        return selected_tasks
+
+    def _current_treeview(self) -> ttk.Treeview:
+        current_tab_index = self.notebook.index(self.notebook.select())
+        return self.pending_list if current_tab_index == 0 else self.completed_list
+
+    def _split_by_permission(self, tasks: list[Task]) -> tuple[list[Task], list[Task]]:
+        """Separa, numa única passada, as tarefas que o usuário pode alterar das demais."""
+        if self.user_level == 'admin':
+            return tasks, []
+        allowed, denied = [], []
+        for task in tasks:
+            (allowed if task.user == self.username else denied).append(task)
+        return allowed, denied
+
+    @staticmethod
+    def _describe_selection(tasks: list[Task]) -> str:
+        if len(tasks) == 1:
+            return f"a tarefa:\n\n'{tasks[0].description[:80]}...'"
+        return f"as {len(tasks)} tarefas selecionadas"
+
     def complete_selected_task(self):
-        task_to_complete = self._get_selected_task_from_treeview(self.pending_list) 
-        if not task_to_complete:
-            messagebox.showwarning("Aviso", "Selecione uma tarefa pendente para concluir.", parent=self.root)
+        if not self._tasks_ready():
             return
-        task_to_complete.is_completed = True
-        task_to_complete.completed_at = datetime.now().isoformat()
-        task_to_complete.completed_by = self.username 
+        tasks_to_complete = self._get_selected_tasks_from_treeview(self.pending_list) 
+        if not tasks_to_complete:
+            messagebox.showwarning("Aviso", "Selecione uma ou mais tarefas pendentes para concluir.", parent=self.root)
+            return
+        completed = self.repository.complete_many([task.task_id for task in tasks_to_complete], self.username)
         self.save_tasks_to_service()
-        self.update_task_lists_display()
-        logger.info(f"Tarefa '{task_to_complete.task_id}' marcada como concluída por {self.username}.")
+        logger.info(f"{len(completed)} tarefa(s) marcada(s) como concluída(s) por {self.username}: {', '.join(t.task_id for t in completed)}.")
 
     def delete_selected_task(self):
-        current_tab_index = self.notebook.index(self.notebook.select())
-        treeview_to_use = self.pending_list if current_tab_index == 0 else self.completed_list
-        task_to_delete = self._get_selected_task_from_treeview(treeview_to_use) 
-        if not task_to_delete:
-            messagebox.showwarning("Aviso", "Selecione uma tarefa para remover.", parent=self.root)
+        if not self._tasks_ready():
+            return
+        selected_tasks = self._get_selected_tasks_from_treeview(self._current_treeview()) 
+        if not selected_tasks:
+            messagebox.showwarning("Aviso", "Selecione uma ou mais tarefas para remover.", parent=self.root)
             return
-        if task_to_delete.user != self.username and self.user_level != 'admin':
+        tasks_to_delete, denied = self._split_by_permission(selected_tasks)
+        if not tasks_to_delete:
             messagebox.showwarning("Permissão Negada", "Você só pode remover tarefas que você criou, a menos que seja um administrador.", parent=self.root)
             return
-        confirm_msg = f"Tem certeza que deseja remover permanentemente a tarefa:\n\n'{task_to_delete.description[:80]}...'?"
+        confirm_msg = f"Tem certeza que deseja remover permanentemente {self._describe_selection(tasks_to_delete)}?"
+        if denied:
+            confirm_msg += f"\n\n{len(denied)} tarefa(s) criada(s) por outros usuários serão ignoradas."
         if messagebox.askyesno("Confirmar Remoção", confirm_msg, icon='warning', parent=self.root):
-            self.tasks.remove(task_to_delete) 
+            removed = self.repository.remove_many([task.task_id for task in tasks_to_delete]) 
             self.save_tasks_to_service()
-            self.update_task_lists_display()
-            logger.info(f"Tarefa '{task_to_delete.task_id}' removida permanentemente por {self.username}.")
+            logger.info(f"{len(removed)} tarefa(s) removida(s) permanentemente por {self.username}: {', '.join(t.task_id for t in removed)}.")
 
     def reopen_selected_task(self):
+        if not self._tasks_ready():
+            return
         if self.user_level != 'admin':
             messagebox.showerror("Permissão Negada", "Apenas administradores podem reabrir tarefas.", parent=self.root)
             return
-        task_to_reopen = self._get_selected_task_from_treeview(self.completed_list) 
-        if not task_to_reopen:
-            messagebox.showwarning("Aviso", "Selecione uma tarefa concluída para reabrir.", parent=self.root)
+        tasks_to_reopen = self._get_selected_tasks_from_treeview(self.completed_list) 
+        if not tasks_to_reopen:
+            messagebox.showwarning("Aviso", "Selecione uma ou mais tarefas concluídas para reabrir.", parent=self.root)
             return
-        confirm_msg = f"Deseja reabrir a tarefa:\n\n'{task_to_reopen.description[:80]}...'?"
+        confirm_msg = f"Deseja reabrir {self._describe_selection(tasks_to_reopen)}?"
         if messagebox.askyesno("Confirmar Reabertura", confirm_msg, parent=self.root):
-            task_to_reopen.is_completed = False
-            task_to_reopen.completed_at = None
-            task_to_reopen.completed_by = None 
+            reopened = self.repository.reopen_many([task.task_id for task in tasks_to_reopen])
             self.save_tasks_to_service()
-            self.update_task_lists_display()
-            logger.info(f"Tarefa '{task_to_reopen.task_id}' reaberta por {self.username}.")
+            logger.info(f"{len(reopened)} tarefa(s) reaberta(s) por {self.username}: {', '.join(t.task_id for t in reopened)}.")
+
+    def set_priority_of_selected_tasks(self, priority: int):
+        if not self._tasks_ready():
+            return
+        selected_tasks = self._get_selected_tasks_from_treeview(self.pending_list)
+        if not selected_tasks:
+            messagebox.showwarning("Aviso", "Selecione uma ou mais tarefas pendentes.", parent=self.root)
+            return
+        tasks_to_update, denied = self._split_by_permission(selected_tasks)
+        if not tasks_to_update:
+            messagebox.showwarning("Permissão Negada", "Você só pode alterar tarefas que você criou, a menos que seja um administrador.", parent=self.root)
+            return
+        updated = self.repository.update_many([task.task_id for task in tasks_to_update], priority=priority)
+        self.save_tasks_to_service()
+        logger.info(f"Prioridade de {len(updated)} tarefa(s) alterada para '{self.get_priority_label(priority)}' por {self.username}.")
+        if denied:
+            messagebox.showinfo("Alteração Parcial", f"{len(denied)} tarefa(s) criada(s) por outros usuários não foram alteradas.", parent=self.root)
+
+    def set_category_of_selected_tasks(self):
+        if not self._tasks_ready():
+            return
+        selected_tasks = self._get_selected_tasks_from_treeview(self._current_treeview())
+        if not selected_tasks:
+            messagebox.showwarning("Aviso", "Selecione uma ou mais tarefas.", parent=self.root)
+            return
+        tasks_to_update, denied = self._split_by_permission(selected_tasks)
+        if not tasks_to_update:
+            messagebox.showwarning("Permissão Negada", "Você só pode alterar tarefas que você criou, a menos que seja um administrador.", parent=self.root)
+            return
+        from tkinter import simpledialog
+        new_category = simpledialog.askstring(
+            "Alterar Categoria", f"Nova categoria para {len(tasks_to_update)} tarefa(s) (máx 50 caracteres):",
+            initialvalue=tasks_to_update[0].category, parent=self.root
+        )
+        if new_category is None:
+            return
+        new_category = new_category.strip()
+        if len(new_category) > 50:
+            messagebox.showerror("Erro", "A categoria não pode exceder 50 caracteres.", parent=self.root)
+            return
+        updated = self.repository.update_many([task.task_id for task in tasks_to_update], category=new_category)
+        self.save_tasks_to_service()
+        logger.info(f"Categoria de {len(updated)} tarefa(s) alterada para '{new_category}' por {self.username}.")
+        if denied:
+            messagebox.showinfo("Alteração Parcial", f"{len(denied)} tarefa(s) criada(s) por outros usuários não foram alteradas.", parent=self.root)
+
+    def _select_all_in_current_list(self):
+        treeview = self._current_treeview()
+        treeview.selection_set(treeview.get_children())
+
+    def _show_task_context_menu(self, event, treeview: ttk.Treeview):
+        row_id = treeview.identify_row(event.y)
+        if row_id and row_id not in treeview.selection():
+            treeview.selection_set(row_id)
+        menu = tk.Menu(self.root, tearoff=0)
+        if treeview is self.pending_list:
+            menu.add_command(label="Concluir Selecionadas", command=self.complete_selected_task)
+            priority_menu = tk.Menu(menu, tearoff=0)
+            for priority_value in (1, 2, 3):
+                priority_menu.add_command(label=self.get_priority_label(priority_value),
+                                          command=lambda p=priority_value: self.set_priority_of_selected_tasks(p))
+            menu.add_cascade(label="Alterar Prioridade", menu=priority_menu)
+        elif self.user_level == 'admin':
+            menu.add_command(label="Reabrir Selecionadas", command=self.reopen_selected_task)
+        menu.add_command(label="Alterar Categoria...", command=self.set_category_of_selected_tasks)
+        menu.add_separator()
+        menu.add_command(label="Remover Selecionadas", command=self.delete_selected_task)
+        try:
+            menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            menu.grab_release()
 
     def generate_report_ui(self):
         current_tab_index = self.notebook.index(self.notebook.select())
-        is_completed_report = (current_tab_index == 1) 
-        report_type_label = "concluídas" if is_completed_report else "pendentes"
-        tasks_for_report_obj = [task for task in self.tasks if task.is_completed == is_completed_report]
-        if not tasks_for_report_obj:
-            messagebox.showinfo("Relatório Vazio", f"Não há tarefas {report_type_label} para incluir no relatório.", parent=self.root)
-            return
-        tasks_for_report_dict = [task.to_dict() for task in tasks_for_report_obj]
-        def _generate_and_open_report():
-            try:
-                self.update_status_bar(f"Gerando relatório de tarefas {report_type_label}...")
-                report_path_str = PDFGenerator.generate_task_report(tasks_for_report_dict, "completed" if is_completed_report else "pending")
-                self.update_status_bar(f"Relatório salvo em {report_path_str}.")
-                if messagebox.askyesno("Relatório Gerado", f"Relatório salvo em:\n{report_path_str}\n\nDeseja abri-lo agora?", parent=self.root):
-                    try:
-                        if sys.platform == "win32": os.startfile(report_path_str) 
-                        elif sys.platform == "darwin": subprocess.call(["open", report_path_str])
-                        else: subprocess.call(["xdg-open", report_path_str])
-                    except Exception as e_open:
-                        logger.error(f"Erro ao tentar abrir o PDF {report_path_str}: {e_open}", exc_info=True)
-                        messagebox.showwarning("Erro ao Abrir", "Não foi possível abrir o PDF automaticamente. Por favor, navegue até o local.", parent=self.root)
-            except RuntimeError as e_gen: 
-                logger.error(f"Falha ao gerar relatório PDF: {e_gen}", exc_info=True)
-                messagebox.showerror("Erro no Relatório", f"Falha ao gerar o relatório:\n{e_gen}", parent=self.root)
-            except Exception as e_thread: 
-                 logger.error(f"Erro inesperado na thread de geração de relatório: {e_thread}", exc_info=True)
-                 messagebox.showerror("Erro Inesperado", "Ocorreu um erro ao gerar o relatório.", parent=self.root)
-            finally:
-                self.update_task_lists_display() 
-        threading.Thread(target=_generate_and_open_report, daemon=True).start()
+        default_status = STATUS_COMPLETED if current_tab_index == 1 else STATUS_PENDING
+        ReportDialog(self, default_status, on_confirm=self._run_report)
+
+    def _report_source(self, export_filter: ExportFilter):
+        """Tarefas do relatório como dicionários gerados sob demanda, já filtradas por status e período."""
+        if export_filter.status == STATUS_PENDING:
+            tasks_snapshot = self.repository.pending()
+        elif export_filter.status == STATUS_COMPLETED:
+            tasks_snapshot = self.repository.completed()
+        else:
+            tasks_snapshot = list(self.repository)
+        # Só as referências são copiadas aqui; cada tarefa é convertida ao ser consumida pelo escritor
+        return export_filter.apply(task.to_dict() for task in tasks_snapshot)
+
+    def _run_report(self, export_filter: ExportFilter, export_format: str):
+        filter_label = export_filter.describe()
+        if export_format == REPORT_FORMAT_PDF:
+            self._run_pdf_report(export_filter, filter_label)
+            return
+
+        from tkinter import filedialog
+        format_label, extension = TaskExporter.FORMATS[export_format]
+        Config.REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+        file_path_str = filedialog.asksaveasfilename(
+            parent=self.root, title=f"Exportar Tarefas - {format_label}",
+            initialdir=str(Config.REPORTS_DIR), defaultextension=extension,
+            initialfile=f"tarefas_{export_filter.status}_{datetime.now().strftime('%Y%m%d_%H%M%S')}{extension}",
+            filetypes=[(format_label, f"*{extension}"), ("Todos os arquivos", "*.*")]
+        )
+        if not file_path_str:
+            return
+
+        def _on_exported(row_count: int):
+            self.update_status_bar(f"{row_count} tarefa(s) exportada(s) para {file_path_str}.")
+            messagebox.showinfo("Exportação Concluída", f"{row_count} tarefa(s) {filter_label} exportada(s) para:\n{file_path_str}", parent=self.root)
+
+        def _on_export_error(error):
+            logger.error(f"Falha ao exportar tarefas ({export_format}): {error}", exc_info=error)
+            messagebox.showerror("Erro na Exportação", f"Falha ao exportar as tarefas:\n{error}", parent=self.root)
+            self.update_task_lists_display()
+
+        tasks_source = self._report_source(export_filter)
+        self._submit_report_job(
+            key=(export_format, export_filter.status, export_filter.date_from, export_filter.date_to, file_path_str),
+            label=f"Exportação {format_label}: tarefas {filter_label}",
+            work=lambda job: TaskExporter.export(tasks_source, Path(file_path_str), export_format,
+                                                 progress_callback=job.report_progress, cancel_event=job.cancel_event),
+            on_success=_on_exported, on_error=_on_export_error
+        )
+
+    def _run_pdf_report(self, export_filter: ExportFilter, filter_label: str):
+        report_type = {STATUS_PENDING: "pending", STATUS_COMPLETED: "completed"}.get(export_filter.status, "all")
+        tasks_source = self._report_source(export_filter)
+
+        def _generate(job: ReportJob) -> str | None:
+            tasks_for_report_dict = list(tasks_source)
+            if not tasks_for_report_dict:
+                return None
+            job.report_progress(0, 0, total_rows=len(tasks_for_report_dict))
+            return PDFGenerator.generate_task_report(tasks_for_report_dict, report_type,
+                                                     progress_callback=job.report_progress, cancel_event=job.cancel_event)
+
+        def _on_report_generated(report_path_str: str | None):
+            if report_path_str is None:
+                self.update_task_lists_display()
+                messagebox.showinfo("Relatório Vazio", f"Não há tarefas {filter_label} para incluir no relatório.", parent=self.root)
+                return
+            self._offer_to_open_report(report_path_str)
+
+        def _on_report_error(error):
+            if isinstance(error, RuntimeError):
+                logger.error(f"Falha ao gerar relatório PDF: {error}", exc_info=error)
+                messagebox.showerror("Erro no Relatório", f"Falha ao gerar o relatório:\n{error}", parent=self.root)
+            else:
+                logger.error(f"Erro inesperado na geração de relatório: {error}", exc_info=error)
+                messagebox.showerror("Erro Inesperado", "Ocorreu um erro ao gerar o relatório.", parent=self.root)
+            self.update_task_lists_display()
+
+        self._submit_report_job(
+            key=(REPORT_FORMAT_PDF, export_filter.status, export_filter.date_from, export_filter.date_to),
+            label=f"Relatório PDF: tarefas {filter_label}",
+            work=_generate, on_success=_on_report_generated, on_error=_on_report_error
+        )
+
+    def _offer_to_open_report(self, report_path_str: str):
+        self.update_status_bar(f"Relatório salvo em {report_path_str}.")
+        if messagebox.askyesno("Relatório Gerado", f"Relatório salvo em:\n{report_path_str}\n\nDeseja abri-lo agora?", parent=self.root):
+            def _on_open_error(e_open):
+                logger.error(f"Erro ao tentar abrir o PDF {report_path_str}: {e_open}", exc_info=e_open)
+                messagebox.showwarning("Erro ao Abrir", "Não foi possível abrir o PDF automaticamente. Por favor, navegue até o local.", parent=self.root)
+            self.bridge.submit(open_with_default_app(report_path_str), on_error=_on_open_error)
+
+    def _submit_report_job(self, key, label: str, work, on_success, on_error):
+        """Enfileira um relatório/exportação; o resultado volta para a thread do Tk via ponte assíncrona."""
+        def _on_finished(job: ReportJob):
+            self.bridge.call_soon_in_tk(self._on_report_job_finished, job, on_success, on_error)
+
+        job, created = self.report_jobs.submit(key, label, work, on_finished=_on_finished)
+        if not created:
+            messagebox.showinfo("Relatório já na Fila",
+                                f"Um pedido igual já está na fila de relatórios (#{job.job_id}: {job.status_label}).", parent=self.root)
+            return
+        self.update_status_bar(f"{label} - na fila de relatórios (#{job.job_id}).")
+
+    def _on_report_job_finished(self, job: ReportJob, on_success, on_error):
+        if job.status == JOB_DONE:
+            on_success(job.result)
+        elif job.status == JOB_FAILED:
+            on_error(job.error)
+        else:
+            self.update_status_bar(f"{job.label} - cancelado.")
+
+    def import_tasks_ui(self):
+        if not self._tasks_ready():
+            return
+        from tkinter import filedialog
+        file_path_str = filedialog.askopenfilename(
+            parent=self.root, title="Importar Tarefas",
+            filetypes=[("CSV ou JSON Lines", "*.csv *.jsonl *.ndjson *.json"), ("Todos os arquivos", "*.*")])
+        if not file_path_str:
+            return
+        file_path = Path(file_path_str)
+        try:
+            TaskImporter.detect_format(file_path)
+        except ValueError as e:
+            messagebox.showerror("Importar Tarefas", str(e), parent=self.root)
+            return
+        # Só administradores importam tarefas de outros usuários; para os demais a coluna de usuário é ignorada
+        allow_other_users = self.user_level == 'admin'
+        highest_local_id = self.repository.highest_numeric_id()
+
+        def _show_progress(rows_read: int, total_rows: int):
+            self.bridge.call_soon_in_tk(self.update_status_bar, f"Importando {file_path.name}: {rows_read} de ~{total_rows} linhas...")
+
+        def _import() -> tuple[ImportSummary, Path | None]:
+            estimated_rows = TaskImporter.count_lines(file_path)
+            # Um único bloco de IDs; o máximo local cobre tarefas ainda não gravadas
+            first_task_id = max(self.task_service.reserve_task_ids(estimated_rows), highest_local_id + 1)
+            summary = TaskImporter.run(
+                file_path, self.username, first_task_id,
+                commit_batch=lambda batch: self.bridge.call_soon_in_tk(self._commit_imported_batch, batch),
+                allow_other_users=allow_other_users, estimated_rows=estimated_rows, progress_callback=_show_progress)
+            error_report_path = None
+            if summary.errors:
+                error_report_path = TaskImporter.write_error_report(
+                    summary.errors, Config.REPORTS_DIR / f"importacao_erros_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
+            return summary, error_report_path
+
+        def _on_imported(result: tuple[ImportSummary, Path | None]):
+            summary, error_report_path = result
+            message = f"{summary.imported} tarefa(s) importada(s) de {file_path.name} em {summary.elapsed_s:.1f}s."
+            if error_report_path is None:
+                messagebox.showinfo("Importar Tarefas", message, parent=self.root)
+                return
+            messagebox.showwarning("Importar Tarefas", f"{message}\n\n{len(summary.errors)} linha(s) rejeitada(s). "
+                                   f"Detalhes em:\n{error_report_path}", parent=self.root)
+
+        def _on_import_error(error):
+            logger.error(f"Falha ao importar tarefas de {file_path}: {error}", exc_info=error)
+            messagebox.showerror("Importar Tarefas", f"A importação foi interrompida:\n{error}\n\n"
+                                 "As tarefas dos lotes anteriores já foram gravadas.", parent=self.root)
+            self.update_task_lists_display()
+
+        self.update_status_bar(f"Importando {file_path.name}...")
+        self.bridge.submit(asyncio.to_thread(_import), on_success=_on_imported, on_error=_on_import_error)
+
+    def _commit_imported_batch(self, batch: list[dict]):
+        self.repository.add_many(Task.from_dict(task_dict) for task_dict in batch)
+        self.save_tasks_to_service()
+
+    def open_report_queue_window(self):
+        if self.report_queue_window is not None and self.report_queue_window.winfo_exists():
+            self.report_queue_window.lift()
+            return
+        from .report_queue_window import ReportQueueWindow
+        self.report_queue_window = ReportQueueWindow(self)
+
+    def open_analytics_window(self):
+        if not HAS_NUMPY:
+            messagebox.showerror("Recurso Indisponível",
+                                 "A análise de produtividade requer a biblioteca NumPy.\nInstale com: pip install numpy", parent=self.root)
+            return
+        if self.analytics_window is not None and self.analytics_window.winfo_exists():
+            self.analytics_window.lift()
+            return
+        from .analytics_window import AnalyticsWindow # Só importa o NumPy quando a análise é aberta
+        self.analytics_window = AnalyticsWindow(self)
+
+    def ensure_date_index(self) -> TaskDateIndex:
+        if self.date_index is None:
+            with Metrics.timer("gui.indice_datas.montar"):
+                self.date_index = TaskDateIndex(self.repository)
+        return self.date_index
+
+    def open_calendar_window(self):
+        if self.calendar_window is not None and self.calendar_window.winfo_exists():
+            self.calendar_window.lift()
+            return
+        from .calendar_window import CalendarWindow
+        self.calendar_window = CalendarWindow(self)
+
+    def show_task(self, task_id: str):
+        """Seleciona a tarefa na aba dela (usado pelo calendário), limpando o filtro se ele a esconde."""
+        task = self.repository.get(task_id)
+        if task is None:
+            return
+        visible_ids = self.task_filter.visible_ids
+        if visible_ids is not None and task_id not in visible_ids:
+            self.clear_filter()
+            if self._filter_after_id is not None:
+                self.root.after_cancel(self._filter_after_id)
+            self._apply_filter() # Sem esperar o debounce: a tarefa precisa estar na lista para ser selecionada
+        frame, treeview = ((self.completed_frame, self.completed_list) if task.is_completed
+                           else (self.pending_frame, self.pending_list))
+        self.notebook.select(frame)
+        if treeview.exists(task_id):
+            treeview.selection_set(task_id)
+            treeview.see(task_id)
+        self.root.lift()
 
     def open_user_manager_ui(self):
         if self.user_level == 'admin':
+            from .user_manager_window import UserManagerWindow
             UserManagerWindow(self) 
         else:
             messagebox.showerror("Acesso Negado", "Você não tem permissão para gerenciar usuários.", parent=self.root)
@@ -553,6 +1133,40 @@ class MainWindow:
         else:
             messagebox.showerror("Acesso Negado", "Apenas administradores podem restaurar backups.", parent=self.root)
 
+    def open_performance_window(self):
+        if self.user_level != 'admin':
+            messagebox.showerror("Acesso Negado", "Apenas administradores podem ver os dados de desempenho.", parent=self.root)
+            return
+        if self.performance_window is not None and self.performance_window.winfo_exists():
+            self.performance_window.lift()
+            return
+        from .performance_window import PerformanceWindow
+        self.performance_window = PerformanceWindow(self)
+
+    def _profile_data_sizes(self) -> dict[str, int]:
+        return {'tarefas': len(self.repository), 'tarefas_pendentes': self.repository.pending_count,
+                'tarefas_concluidas': self.repository.completed_count}
+
+    def toggle_profiling(self):
+        """Liga/desliga o perfilamento: o usuário liga, repete a operação lenta e desliga para gravar o perfil."""
+        if self.profiling_var.get():
+            if Profiler.start(f"operacao_{self.username}"):
+                self.update_status_bar("Perfilamento ativo: repita a operação lenta e desmarque a opção no menu Ajuda.")
+            return
+        capture = Profiler.stop() # Precisa rodar na thread do Tk, onde o cProfile foi ligado
+        if capture is None:
+            return
+        self.update_status_bar("Gravando o perfil de desempenho...")
+
+        def _on_written(summary_path: Path | None):
+            if summary_path is None:
+                messagebox.showerror("Perfilamento", "Não foi possível gravar o perfil. Verifique o log.", parent=self.root)
+                return
+            self.update_status_bar("Perfil de desempenho gravado.")
+            messagebox.showinfo("Perfilamento", f"Perfil gravado em:\n{summary_path.parent}\n\n"
+                                "Envie os arquivos 'perfil_*' ao suporte para análise.", parent=self.root)
+        self.bridge.submit(asyncio.to_thread(Profiler.write_capture, capture), on_success=_on_written)
+
     def request_app_restart(self, message_to_show: str):
         logger.info(f"Solicitação de reinício da aplicação: {message_to_show}")
         for widget in self.root.winfo_children():
@@ -563,43 +1177,52 @@ class MainWindow:
                     pass 
         
         if messagebox.askokcancel("Reinício Necessário", message_to_show + "\n\nA aplicação será fechada. Por favor, abra-a novamente.", parent=self.root):
-            self.root.destroy()
+            self._shutdown()
         else: 
-            self.root.destroy()
+            self._shutdown()
 
 
     def create_backup_ui(self):
         if self.user_level != 'admin':
             messagebox.showerror("Acesso Negado", "Apenas administradores podem criar backups.", parent=self.root)
             return
-        try:
-            Config.BACKUP_DIR.mkdir(parents=True, exist_ok=True) 
-            backup_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            backup_success_messages = []
-            if Config.USERS_FILE.exists():
-                users_backup_path = Config.BACKUP_DIR / f"users_backup_{backup_timestamp}.json"
-                shutil.copy2(Config.USERS_FILE, users_backup_path) 
-                logger.info(f"Backup de usuários criado em: {users_backup_path}")
-                backup_success_messages.append(f"Usuários: {users_backup_path.name}")
-            else:
-                logger.warning(f"Arquivo de usuários {Config.USERS_FILE} não encontrado para backup.")
-                backup_success_messages.append("Usuários: Arquivo original não encontrado.")
-            if Config.TASKS_FILE.exists():
-                tasks_backup_path = Config.BACKUP_DIR / f"tasks_backup_{backup_timestamp}.json"
-                shutil.copy2(Config.TASKS_FILE, tasks_backup_path)
-                logger.info(f"Backup de tarefas criado em: {tasks_backup_path}")
-                backup_success_messages.append(f"Tarefas: {tasks_backup_path.name}")
-            else:
-                logger.warning(f"Arquivo de tarefas {Config.TASKS_FILE} não encontrado para backup.")
-                backup_success_messages.append("Tarefas: Arquivo original não encontrado.")
+        def _on_backup_done(backup_success_messages: list[str]):
             if backup_success_messages:
                  final_message = f"Backup dos dados realizado com sucesso em:\n{Config.BACKUP_DIR}\n\nArquivos gerados:\n" + "\n".join(backup_success_messages)
                  messagebox.showinfo("Backup Concluído", final_message, parent=self.root)
             else: 
                  messagebox.showwarning("Backup", "Nenhum arquivo de dados encontrado para fazer backup.", parent=self.root)
-        except Exception as e:
-            logger.error(f"Erro ao criar backup: {e}", exc_info=True)
-            messagebox.showerror("Erro de Backup", f"Falha ao criar backup:\n{e}", parent=self.root)
+        def _on_backup_error(error):
+            logger.error(f"Erro ao criar backup: {error}", exc_info=error)
+            messagebox.showerror("Erro de Backup", f"Falha ao criar backup:\n{error}", parent=self.root)
+        self.bridge.submit(asyncio.to_thread(self._copy_data_files_to_backup),
+                           on_success=_on_backup_done, on_error=_on_backup_error)
+
+    @staticmethod
+    @Metrics.timed("backup.criar")
+    def _copy_data_files_to_backup() -> list[str]:
+        """Copia users.json e tasks.json para a pasta de backups (roda fora da thread do Tk)."""
+        import shutil
+        Config.BACKUP_DIR.mkdir(parents=True, exist_ok=True) 
+        backup_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        backup_success_messages = []
+        if Config.USERS_FILE.exists():
+            users_backup_path = Config.BACKUP_DIR / f"users_backup_{backup_timestamp}.json"
+            shutil.copy2(Config.USERS_FILE, users_backup_path) 
+            logger.info(f"Backup de usuários criado em: {users_backup_path}")
+            backup_success_messages.append(f"Usuários: {users_backup_path.name}")
+        else:
+            logger.warning(f"Arquivo de usuários {Config.USERS_FILE} não encontrado para backup.")
+            backup_success_messages.append("Usuários: Arquivo original não encontrado.")
+        if Config.TASKS_FILE.exists():
+            tasks_backup_path = Config.BACKUP_DIR / f"tasks_backup_{backup_timestamp}.json"
+            shutil.copy2(Config.TASKS_FILE, tasks_backup_path)
+            logger.info(f"Backup de tarefas criado em: {tasks_backup_path}")
+            backup_success_messages.append(f"Tarefas: {tasks_backup_path.name}")
+        else:
+            logger.warning(f"Arquivo de tarefas {Config.TASKS_FILE} não encontrado para backup.")
+            backup_success_messages.append("Tarefas: Arquivo original não encontrado.")
+        return backup_success_messages
 
     def show_about_dialog(self):
         # Usa os atributos da classe Config para as informações do autor
@@ -627,6 +1250,7 @@ Desenvolvido por: {author_name_to_display}
         messagebox.showinfo(f"Sobre o {Config.APP_NAME}", about_text, parent=self.root)
 
     def open_documentation_link(self):
+        import webbrowser
         try:
             doc_url = "https://www.example.com/agendacomppro/docs" 
             webbrowser.open_new_tab(doc_url)
@@ -0,0 +1,98 @@
+# gui/performance_window.py
+import asyncio
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+from metrics import Metrics
+
+
+class PerformanceWindow(tk.Toplevel):
+    """Mostra os tempos (p50/p95/máx) e contadores coletados em `Metrics` (apenas administradores)."""
+    REFRESH_MS = 1000
+    TIMER_COLUMNS = [('name', "Operação", 200, tk.W), ('count', "Execuções", 80, tk.CENTER),
+                     ('errors', "Erros", 60, tk.CENTER), ('p50_ms', "p50 (ms)", 80, tk.E),
+                     ('p95_ms', "p95 (ms)", 80, tk.E), ('max_ms', "Máx (ms)", 80, tk.E),
+                     ('last_ms', "Última (ms)", 90, tk.E)]
+
+    def __init__(self, parent_main_window):
+        super().__init__(parent_main_window.root)
+        self.parent_main_window = parent_main_window
+        self.title("Desempenho")
+        self.geometry("720x420")
+        self.minsize(560, 300)
+        self.transient(parent_main_window.root)
+        self._refresh_after_id: str | None = None
+
+        self.setup_ui()
+        self.refresh()
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
+
+    def setup_ui(self):
+        main_frame = ttk.Frame(self, padding=10)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        timers_frame = ttk.LabelFrame(main_frame, text=f"Tempos (últimas {Metrics.WINDOW_SIZE} execuções de cada operação)", padding=5)
+        timers_frame.pack(fill=tk.BOTH, expand=True)
+        self.timer_list = ttk.Treeview(timers_frame, columns=[column[0] for column in self.TIMER_COLUMNS], show='headings')
+        for column_id, heading_text, width, anchor in self.TIMER_COLUMNS:
+            self.timer_list.heading(column_id, text=heading_text)
+            self.timer_list.column(column_id, width=width, anchor=anchor, stretch=column_id == 'name')
+        self.timer_list.pack(fill=tk.BOTH, expand=True)
+
+        counters_frame = ttk.LabelFrame(main_frame, text="Contadores", padding=5)
+        counters_frame.pack(fill=tk.X, pady=(10, 0))
+        self.counter_list = ttk.Treeview(counters_frame, columns=('name', 'value'), show='headings', height=3)
+        self.counter_list.heading('name', text="Contador")
+        self.counter_list.heading('value', text="Valor")
+        self.counter_list.column('name', width=300, anchor=tk.W)
+        self.counter_list.column('value', width=100, anchor=tk.E, stretch=tk.NO)
+        self.counter_list.pack(fill=tk.X)
+
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X, pady=(10, 0))
+        ttk.Button(button_frame, text="Salvar Arquivo de Métricas", command=self.save_metrics_file).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Zerar", command=self.reset_metrics).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Fechar", command=self.destroy).pack(side=tk.RIGHT, padx=5)
+
+    def refresh(self):
+        snapshot = Metrics.snapshot()
+        self._fill(self.timer_list, [
+            (name, stats['count'], stats['errors'], f"{stats['p50_ms']:.1f}", f"{stats['p95_ms']:.1f}",
+             f"{stats['max_ms']:.1f}", f"{stats['last_ms']:.1f}")
+            for name, stats in snapshot['timers'].items()
+        ])
+        self._fill(self.counter_list, list(snapshot['counters'].items()))
+        self._refresh_after_id = self.after(self.REFRESH_MS, self.refresh)
+
+    @staticmethod
+    def _fill(tree: ttk.Treeview, rows: list[tuple]):
+        # Linhas identificadas pelo nome: atualiza no lugar e preserva a seleção/rolagem
+        for row in rows:
+            if tree.exists(row[0]):
+                tree.item(row[0], values=row)
+            else:
+                tree.insert('', tk.END, iid=row[0], values=row)
+        current_names = {row[0] for row in rows}
+        stale_items = [item_id for item_id in tree.get_children() if item_id not in current_names]
+        if stale_items:
+            tree.delete(*stale_items)
+
+    def save_metrics_file(self):
+        def _on_saved(metrics_path):
+            parent_window = self if self.winfo_exists() else self.parent_main_window.root
+            if metrics_path is None:
+                messagebox.showerror("Métricas", "Não foi possível gravar o arquivo de métricas. Verifique o log.", parent=parent_window)
+                return
+            messagebox.showinfo("Métricas", f"Métricas gravadas em:\n{metrics_path}", parent=parent_window)
+        self.parent_main_window.bridge.submit(asyncio.to_thread(Metrics.write_metrics_file), on_success=_on_saved)
+
+    def reset_metrics(self):
+        if messagebox.askyesno("Zerar Métricas", "Descartar todas as medições coletadas até agora?", parent=self):
+            Metrics.reset()
+
+    def destroy(self):
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
+        self.parent_main_window.performance_window = None
+        super().destroy()
@@ -0,0 +1,183 @@
+# gui/reminders.py
+import heapq
+import itertools
+import time
+import tkinter as tk
+from datetime import datetime
+from tkinter import ttk
+from typing import Callable, Iterable
+
+from config import logger
+from models import Task
+
+KIND_REMINDER = "lembrete"
+KIND_DUE = "vencimento"
+
+
+class ReminderScheduler:
+    """Lembretes e vencimentos das tarefas pendentes num heap mínimo, com um único `root.after` armado para o próximo.
+
+    As mudanças no repositório chegam incrementalmente (`update`/`forget`): uma entrada nova vai
+    para o heap e a antiga fica obsoleta, descartada quando chega ao topo (o dicionário
+    `_scheduled` diz qual horário vale para cada tarefa). Ao disparar, os lembretes vão para
+    `on_reminders` e os vencimentos para `on_overdue`, ambos com a lista de IDs.
+    """
+    MAX_TIMER_MS = 60 * 60 * 1000 # Esperas longas são feitas em etapas (o relógio pode mudar, o PC pode hibernar)
+
+    def __init__(self, root: tk.Misc, on_reminders: Callable[[list[str]], None], on_overdue: Callable[[list[str]], None]):
+        self.root = root
+        self.on_reminders = on_reminders
+        self.on_overdue = on_overdue
+        self._heap: list[tuple[float, int, str, str]] = [] # (instante, sequência, tipo, task_id)
+        self._sequence = itertools.count()
+        self._scheduled: dict[tuple[str, str], float] = {} # (task_id, tipo) -> instante vigente
+        self._fired: dict[tuple[str, str], float] = {} # Já disparados nesta sessão: não repetem numa edição qualquer
+        self._after_id: str | None = None
+        self._armed_for: float | None = None
+
+    @staticmethod
+    def _timestamp(iso_datetime_str: str | None) -> float | None:
+        if not iso_datetime_str:
+            return None
+        try:
+            return datetime.fromisoformat(iso_datetime_str).timestamp()
+        except ValueError:
+            logger.warning(f"Data de lembrete/vencimento inválida ignorada: {iso_datetime_str}")
+            return None
+
+    def _schedule(self, task: Task):
+        for kind, value in ((KIND_REMINDER, task.remind_at), (KIND_DUE, task.due_at)):
+            key = (task.task_id, kind)
+            when = None if task.is_completed else self._timestamp(value)
+            if when is None:
+                self._scheduled.pop(key, None)
+                continue
+            if self._scheduled.get(key) == when or self._fired.get(key) == when:
+                continue
+            self._scheduled[key] = when
+            heapq.heappush(self._heap, (when, next(self._sequence), kind, task.task_id))
+
+    def reset(self, tasks: Iterable[Task]):
+        self._heap.clear()
+        self._scheduled.clear()
+        for task in tasks:
+            self._schedule(task)
+        self._rearm()
+
+    def update(self, tasks: Iterable[Task]):
+        for task in tasks:
+            self._schedule(task)
+        if len(self._heap) > 2 * len(self._scheduled) + 64:
+            # Muitas entradas obsoletas (edições seguidas): reconstrói só com as vigentes
+            self._heap = [entry for entry in self._heap if self._scheduled.get((entry[3], entry[2])) == entry[0]]
+            heapq.heapify(self._heap)
+        self._rearm()
+
+    def forget(self, task_ids: Iterable[str]):
+        for task_id in task_ids:
+            for kind in (KIND_REMINDER, KIND_DUE):
+                self._scheduled.pop((task_id, kind), None)
+        self._rearm()
+
+    def stop(self):
+        self._cancel_timer()
+        self._heap.clear()
+        self._scheduled.clear()
+
+    def _is_current(self, entry: tuple[float, int, str, str]) -> bool:
+        return self._scheduled.get((entry[3], entry[2])) == entry[0]
+
+    def _cancel_timer(self):
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass # Janela já destruída
+        self._after_id, self._armed_for = None, None
+
+    def _rearm(self):
+        while self._heap and not self._is_current(self._heap[0]):
+            heapq.heappop(self._heap)
+        if not self._heap:
+            self._cancel_timer()
+            return
+        next_when = self._heap[0][0]
+        if self._after_id is not None and self._armed_for == next_when:
+            return
+        self._cancel_timer()
+        delay_ms = max(0, min(int((next_when - time.time()) * 1000), self.MAX_TIMER_MS))
+        self._after_id = self.root.after(delay_ms, self._on_timer)
+        self._armed_for = next_when
+
+    def _on_timer(self):
+        self._after_id, self._armed_for = None, None
+        now = time.time()
+        due_ids: dict[str, list[str]] = {KIND_REMINDER: [], KIND_DUE: []}
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            if not self._is_current(entry):
+                continue
+            when, _, kind, task_id = entry
+            del self._scheduled[(task_id, kind)]
+            self._fired[(task_id, kind)] = when
+            due_ids[kind].append(task_id)
+        try:
+            if due_ids[KIND_DUE]:
+                self.on_overdue(due_ids[KIND_DUE])
+            if due_ids[KIND_REMINDER]:
+                self.on_reminders(due_ids[KIND_REMINDER])
+        finally:
+            self._rearm()
+
+
+class ReminderWindow(tk.Toplevel):
+    """Janela (não modal) com os lembretes disparados; permite adiar ou dispensar todos de uma vez."""
+    SNOOZE_MINUTES = 10
+
+    def __init__(self, parent_main_window, on_snooze: Callable[[list[str]], None], on_dismiss: Callable[[list[str]], None]):
+        super().__init__(parent_main_window.root)
+        self.parent_main_window = parent_main_window
+        self.on_snooze = on_snooze
+        self.on_dismiss = on_dismiss
+        self.title("Lembretes")
+        self.geometry("520x260")
+        self.minsize(400, 180)
+        self.transient(parent_main_window.root)
+        self.attributes('-topmost', True)
+
+        main_frame = ttk.Frame(self, padding=10)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        self.reminder_list = ttk.Treeview(main_frame, columns=('id', 'description', 'due_at'), show='headings', selectmode='none')
+        self.reminder_list.heading('id', text='ID')
+        self.reminder_list.heading('description', text='Descrição')
+        self.reminder_list.heading('due_at', text='Vence em')
+        self.reminder_list.column('id', width=60, anchor=tk.W, stretch=tk.NO)
+        self.reminder_list.column('description', width=300, stretch=tk.YES)
+        self.reminder_list.column('due_at', width=120, anchor=tk.CENTER, stretch=tk.NO)
+        self.reminder_list.pack(fill=tk.BOTH, expand=True)
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X, pady=(10, 0))
+        ttk.Button(button_frame, text=f"Adiar {self.SNOOZE_MINUTES} min", command=self._snooze).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Dispensar", command=self._dismiss).pack(side=tk.RIGHT, padx=5)
+        # Fechar sem escolher mantém os lembretes: eles voltam na próxima vez que a agenda abrir
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
+
+    def add_tasks(self, tasks: list[Task]):
+        for task in tasks:
+            values = (task.task_id, task.description, self.parent_main_window.format_display_datetime(task.due_at))
+            if self.reminder_list.exists(task.task_id):
+                self.reminder_list.item(task.task_id, values=values)
+            else:
+                self.reminder_list.insert('', tk.END, iid=task.task_id, values=values)
+        self.bell()
+
+    def _task_ids(self) -> list[str]:
+        return list(self.reminder_list.get_children())
+
+    def _snooze(self):
+        self.on_snooze(self._task_ids())
+        self.destroy()
+
+    def _dismiss(self):
+        self.on_dismiss(self._task_ids())
+        self.destroy()
@@ -0,0 +1,85 @@
+# gui/report_dialog.py
+import tkinter as tk
+from tkinter import ttk, messagebox
+from datetime import date, datetime
+from typing import Callable
+
+from exporters import ExportFilter, TaskExporter
+from task_filter import STATUS_ALL, STATUS_COMPLETED, STATUS_PENDING
+
+REPORT_FORMAT_PDF = 'pdf'
+
+
+class ReportDialog(tk.Toplevel):
+    """Diálogo de relatório/exportação: status, período e formato (PDF, CSV, JSON Lines ou XLSX)."""
+    STATUS_OPTIONS = [("Pendentes", STATUS_PENDING), ("Concluídas", STATUS_COMPLETED), ("Todas", STATUS_ALL)]
+    DATE_FORMAT = '%d/%m/%Y'
+
+    def __init__(self, parent_main_window, default_status: str,
+                 on_confirm: Callable[[ExportFilter, str], None]):
+        super().__init__(parent_main_window.root)
+        self.parent_main_window = parent_main_window
+        self.on_confirm = on_confirm
+        self.title("Relatório / Exportação de Tarefas")
+
+        self.status_var = tk.StringVar(value=default_status)
+        self.format_var = tk.StringVar(value=REPORT_FORMAT_PDF)
+        self.date_from_var = tk.StringVar()
+        self.date_to_var = tk.StringVar()
+
+        self.setup_ui()
+        parent_main_window._center_dialog_on_main(self, width=420, height=330)
+
+    def setup_ui(self):
+        main_frame = ttk.Frame(self, padding=15)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        status_frame = ttk.LabelFrame(main_frame, text="Tarefas", padding=8)
+        status_frame.pack(fill=tk.X)
+        for label, value in self.STATUS_OPTIONS:
+            ttk.Radiobutton(status_frame, text=label, variable=self.status_var, value=value).pack(side=tk.LEFT, padx=(0, 10))
+
+        period_frame = ttk.LabelFrame(main_frame, text="Período (dd/mm/aaaa, opcional)", padding=8)
+        period_frame.pack(fill=tk.X, pady=(10, 0))
+        ttk.Label(period_frame, text="De:").grid(row=0, column=0, sticky=tk.W)
+        ttk.Entry(period_frame, textvariable=self.date_from_var, width=12).grid(row=0, column=1, sticky=tk.W, padx=(5, 15))
+        ttk.Label(period_frame, text="Até:").grid(row=0, column=2, sticky=tk.W)
+        ttk.Entry(period_frame, textvariable=self.date_to_var, width=12).grid(row=0, column=3, sticky=tk.W, padx=5)
+        ttk.Label(period_frame, text="Concluídas: data de conclusão. Demais: data de criação.",
+                  foreground="gray").grid(row=1, column=0, columnspan=4, sticky=tk.W, pady=(5, 0))
+
+        format_frame = ttk.LabelFrame(main_frame, text="Formato", padding=8)
+        format_frame.pack(fill=tk.X, pady=(10, 0))
+        ttk.Radiobutton(format_frame, text="Relatório PDF", variable=self.format_var,
+                        value=REPORT_FORMAT_PDF).pack(anchor=tk.W)
+        for export_format, (label, _) in TaskExporter.FORMATS.items():
+            ttk.Radiobutton(format_frame, text=label, variable=self.format_var, value=export_format).pack(anchor=tk.W)
+
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X, pady=(15, 0))
+        ttk.Button(button_frame, text="Gerar", command=self.on_generate_clicked).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cancelar", command=self.destroy).pack(side=tk.RIGHT, padx=5)
+
+    def _parse_date(self, text: str, field_label: str) -> date | None:
+        text = text.strip()
+        if not text:
+            return None
+        try:
+            return datetime.strptime(text, self.DATE_FORMAT).date()
+        except ValueError:
+            raise ValueError(f"Data '{field_label}' inválida: '{text}'. Use o formato dd/mm/aaaa.")
+
+    def on_generate_clicked(self):
+        try:
+            date_from = self._parse_date(self.date_from_var.get(), "De")
+            date_to = self._parse_date(self.date_to_var.get(), "Até")
+        except ValueError as e:
+            messagebox.showerror("Período Inválido", str(e), parent=self)
+            return
+        if date_from and date_to and date_from > date_to:
+            messagebox.showerror("Período Inválido", "A data inicial não pode ser posterior à data final.", parent=self)
+            return
+        export_filter = ExportFilter(self.status_var.get(), date_from, date_to)
+        export_format = self.format_var.get()
+        self.destroy()
+        self.on_confirm(export_filter, export_format)
@@ -0,0 +1,80 @@
+# gui/report_queue_window.py
+import tkinter as tk
+from tkinter import ttk
+
+from report_jobs import ReportJob
+
+
+class ReportQueueWindow(tk.Toplevel):
+    """Mostra a fila de relatórios/exportações com estado e progresso, e permite cancelar jobs."""
+
+    def __init__(self, parent_main_window):
+        super().__init__(parent_main_window.root)
+        self.parent_main_window = parent_main_window
+        self.job_manager = parent_main_window.report_jobs
+        self.title("Fila de Relatórios")
+        self.geometry("620x300")
+        self.minsize(480, 200)
+        self.transient(parent_main_window.root)
+
+        self.setup_ui()
+        for job in self.job_manager.jobs():
+            self._refresh_job(job)
+        # O gerenciador notifica a partir das threads dos jobs; a atualização da tela roda na thread do Tk
+        self._unsubscribe = self.job_manager.subscribe(
+            lambda job: parent_main_window.bridge.call_soon_in_tk(self._refresh_job, job)
+        )
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
+
+    def setup_ui(self):
+        main_frame = ttk.Frame(self, padding=10)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        list_frame = ttk.Frame(main_frame)
+        list_frame.pack(fill=tk.BOTH, expand=True)
+        self.job_list = ttk.Treeview(list_frame, columns=('id', 'label', 'status', 'progress'), show='headings', selectmode='browse')
+        self.job_list.heading('id', text='#')
+        self.job_list.heading('label', text='Relatório')
+        self.job_list.heading('status', text='Situação')
+        self.job_list.heading('progress', text='Progresso')
+        self.job_list.column('id', width=40, anchor=tk.CENTER, stretch=tk.NO)
+        self.job_list.column('label', width=260, anchor=tk.W)
+        self.job_list.column('status', width=100, anchor=tk.CENTER, stretch=tk.NO)
+        self.job_list.column('progress', width=180, anchor=tk.W)
+        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.job_list.yview)
+        self.job_list.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.job_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X, pady=(10, 0))
+        ttk.Button(button_frame, text="Cancelar Selecionado", command=self.cancel_selected_job).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Fechar", command=self.destroy).pack(side=tk.RIGHT, padx=5)
+
+    def _refresh_job(self, job: ReportJob):
+        if not self.winfo_exists():
+            return
+        item_id = str(job.job_id)
+        status_text = job.status_label
+        if job.is_active and job.cancel_event.is_set():
+            status_text = "Cancelando..."
+        values = (job.job_id, job.label, status_text, job.describe_progress())
+        if self.job_list.exists(item_id):
+            self.job_list.item(item_id, values=values)
+        else:
+            self.job_list.insert('', 0, iid=item_id, values=values) # Mais recentes no topo
+
+    def cancel_selected_job(self):
+        selected_items = self.job_list.selection()
+        if not selected_items:
+            return
+        job_id = int(selected_items[0])
+        if self.job_manager.cancel(job_id):
+            for job in self.job_manager.jobs():
+                if job.job_id == job_id:
+                    self._refresh_job(job)
+
+    def destroy(self):
+        self._unsubscribe()
+        self.parent_main_window.report_queue_window = None
+        super().destroy()
@@ -1,4 +1,5 @@
 # gui/restore_backup_window.py
+import asyncio
 import tkinter as tk
 from tkinter import ttk, messagebox
 import os
@@ -8,7 +9,9 @@ from pathlib import Path
 import shutil 
 
 # Importação corrigida para incluir ASSETS_DIR
+from asset_cache import AssetCache
 from config import Config, logger, ASSETS_DIR 
+from metrics import Metrics
 
 class RestoreBackupWindow(tk.Toplevel):
     def __init__(self, parent_main_window):
@@ -19,18 +22,8 @@ class RestoreBackupWindow(tk.Toplevel):
 
         self.title("Restaurar Backup")
         
-        # Linha corrigida para usar ASSETS_DIR do módulo
-        restore_icon_path = ASSETS_DIR / "restore.ico" 
-        if restore_icon_path.exists():
-             try: self.iconbitmap(str(restore_icon_path))
-             except Exception: 
-                 logger.warning(f"Falha ao carregar ícone de restauração: {restore_icon_path}, tentando ícone principal.")
-                 if Config.ICON_PATH.exists(): # ICON_PATH é um atributo de Config
-                     try: self.iconbitmap(str(Config.ICON_PATH))
-                     except Exception: logger.warning(f"Falha ao carregar ícone principal: {Config.ICON_PATH}")
-        elif Config.ICON_PATH.exists(): 
-            try: self.iconbitmap(str(Config.ICON_PATH))
-            except Exception: logger.warning(f"Falha ao carregar ícone principal: {Config.ICON_PATH}")
+        # Ícone de restauração, com o ícone principal como alternativa
+        AssetCache.apply_window_icon(self, ASSETS_DIR / "restore.ico")
             
         self.geometry("650x450") 
         self.minsize(550, 350)
@@ -166,18 +159,30 @@ class RestoreBackupWindow(tk.Toplevel):
         if messagebox.askyesno("Confirmar Restauração", confirm_msg, icon='warning', parent=self):
             logger.info(f"Usuário {self.parent_main_window.username} confirmou a restauração do backup: {self.selected_backup_timestamp}")
             
-            success, message = self._perform_actual_restore(self.selected_backup_timestamp)
-            
-            if success:
-                messagebox.showinfo("Sucesso", f"{message}\nA aplicação precisa ser reiniciada para que as alterações tenham efeito.", parent=self)
-                self.parent_main_window.request_app_restart(
-                    "Os dados foram restaurados com sucesso a partir do backup.\n"
-                    "Por favor, reinicie a aplicação."
-                )
+            # A cópia dos arquivos roda no loop asyncio da janela principal; o resultado volta na thread do Tk
+            self.restore_button.config(state=tk.DISABLED)
+            self.status_label.config(text="Restaurando backup...")
+            self.parent_main_window.bridge.submit(
+                asyncio.to_thread(self._perform_actual_restore, self.selected_backup_timestamp),
+                on_success=self._on_restore_finished
+            )
+
+    def _on_restore_finished(self, result: tuple[bool, str]):
+        success, message = result
+        if success:
+            messagebox.showinfo("Sucesso", f"{message}\nA aplicação precisa ser reiniciada para que as alterações tenham efeito.", parent=self)
+            self.parent_main_window.request_app_restart(
+                "Os dados foram restaurados com sucesso a partir do backup.\n"
+                "Por favor, reinicie a aplicação."
+            )
+            if self.winfo_exists():
                 self.destroy() 
-            else:
-                messagebox.showerror("Erro na Restauração", message, parent=self)
+        else:
+            self.restore_button.config(state=tk.NORMAL)
+            self.status_label.config(text="Falha na restauração.")
+            messagebox.showerror("Erro na Restauração", message, parent=self)
 
+    @Metrics.timed("backup.restaurar")
     def _perform_actual_restore(self, timestamp_to_restore: str) -> tuple[bool, str]:
         if timestamp_to_restore not in self.backup_sets:
             return False, "Conjunto de backup selecionado não encontrado."
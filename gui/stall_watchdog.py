@@ -0,0 +1,98 @@
+# gui/stall_watchdog.py
+import sys
+import threading
+import time
+import tkinter as tk
+import traceback
+
+from config import logger
+from metrics import Metrics
+
+
+class StallWatchdog:
+    """Detecta travamentos da thread do Tk (callbacks síncronos demorados no mainloop).
+
+    Um `root.after` dispara a cada TICK_MS; o atraso entre o horário esperado e o real é o
+    tempo em que o loop ficou preso. Uma thread auxiliar observa o último tique e, quando o
+    atraso passa do limite, copia a pilha Python da thread principal naquele instante: é ela
+    que mostra *o que* travou. O registro no log sai quando o loop volta, com a duração total;
+    se o travamento passar de HANG_LOG_MS, a pilha é registrada na hora (a interface pode não voltar).
+    """
+    TICK_MS = 100
+    STALL_THRESHOLD_MS = 250
+    HANG_LOG_MS = 5000
+
+    def __init__(self, root: tk.Misc, tick_ms: int | None = None, threshold_ms: int | None = None):
+        self.root = root
+        self.tick_ms = tick_ms or self.TICK_MS
+        self.threshold_ms = threshold_ms or self.STALL_THRESHOLD_MS
+        self.stall_count = 0
+        self.max_lag_ms = 0.0
+        self._main_thread_id = threading.get_ident() # Criado na thread do Tk
+        self._last_tick = time.perf_counter()
+        self._stall_stack: str | None = None
+        self._state_lock = threading.Lock() # Evita atribuir a pilha de um travamento já encerrado ao próximo
+        self._hang_logged = False
+        self._after_id: str | None = None
+        self._stop_event = threading.Event()
+        self._monitor_thread: threading.Thread | None = None
+
+    def start(self):
+        if self._monitor_thread is not None:
+            return
+        self._last_tick = time.perf_counter()
+        self._after_id = self.root.after(self.tick_ms, self._tick)
+        self._monitor_thread = threading.Thread(target=self._monitor, name="StallWatchdog", daemon=True)
+        self._monitor_thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass # Janela já destruída
+            self._after_id = None
+
+    def reset_stats(self):
+        self.stall_count = 0
+        self.max_lag_ms = 0.0
+
+    def _tick(self):
+        with self._state_lock:
+            now = time.perf_counter()
+            lag_ms = max(0.0, (now - self._last_tick) * 1000 - self.tick_ms)
+            stall_stack = self._stall_stack
+            self._stall_stack = None
+            self._hang_logged = False
+            self._last_tick = now
+        self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+        Metrics.record("gui.atraso_loop", lag_ms / 1000)
+        if lag_ms >= self.threshold_ms:
+            self.stall_count += 1
+            Metrics.increment("gui.travamentos")
+            logger.warning(f"Interface travada por {lag_ms:.0f} ms (limite {self.threshold_ms} ms). "
+                           f"Pilha da thread principal durante o travamento:\n{stall_stack or '(não capturada)'}")
+        if not self._stop_event.is_set():
+            self._after_id = self.root.after(self.tick_ms, self._tick)
+
+    def _monitor(self):
+        check_interval_s = self.tick_ms / 2000
+        while not self._stop_event.wait(check_interval_s):
+            with self._state_lock:
+                lag_ms = (time.perf_counter() - self._last_tick) * 1000 - self.tick_ms
+                if lag_ms < self.threshold_ms:
+                    continue
+                if self._stall_stack is None:
+                    self._stall_stack = self._capture_main_stack()
+                log_hang = lag_ms >= self.HANG_LOG_MS and not self._hang_logged
+                self._hang_logged = self._hang_logged or log_hang
+            if log_hang:
+                logger.error(f"Interface sem resposta há {lag_ms / 1000:.1f}s. "
+                             f"Pilha atual da thread principal:\n{self._capture_main_stack()}")
+
+    def _capture_main_stack(self) -> str:
+        frame = sys._current_frames().get(self._main_thread_id)
+        if frame is None:
+            return "(thread principal não encontrada)"
+        return "".join(traceback.format_stack(frame)).rstrip()
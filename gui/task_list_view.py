@@ -0,0 +1,109 @@
+# gui/task_list_view.py
+from bisect import bisect_left, insort
+from typing import Any, Callable, Iterable, Optional
+
+from tkinter import ttk
+
+from models import Task
+
+
+class TaskListView:
+    """Mantém uma Treeview sincronizada com as tarefas de forma incremental.
+
+    Guarda as chaves de ordenação numa lista ordenada (bisect) para que inserir,
+    mover ou remover uma linha não exija reconstruir a lista inteira. Com um filtro
+    ativo, as linhas ocultas continuam existindo na Treeview, apenas desanexadas (detach).
+    """
+
+    def __init__(self, treeview: ttk.Treeview,
+                 sort_key: Callable[[Task], Any],
+                 row_values: Callable[[Task], tuple],
+                 row_tags: Callable[[Task], tuple] = lambda task: ()):
+        self.treeview = treeview
+        self._sort_key = sort_key
+        self._row_values = row_values
+        self._row_tags = row_tags
+        self._ordered_keys: list[tuple] = []        # (chave de ordenação, task_id) ordenados
+        self._key_by_id: dict[str, tuple] = {}
+        self._visible_ids: Optional[set[str]] = None   # None = sem filtro (todas visíveis)
+
+    def __len__(self) -> int:
+        return len(self._key_by_id)
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._key_by_id
+
+    def _entry_for(self, task: Task) -> tuple:
+        return (self._sort_key(task), task.task_id)
+
+    def _is_visible(self, task_id: str) -> bool:
+        return self._visible_ids is None or task_id in self._visible_ids
+
+    def _attached_position(self, entry_index: int) -> int:
+        """Converte a posição na lista ordenada completa para a posição entre as linhas anexadas."""
+        if self._visible_ids is None:
+            return entry_index
+        for previous_index in range(entry_index - 1, -1, -1):
+            previous_id = self._ordered_keys[previous_index][1]
+            if previous_id in self._visible_ids:
+                return self.treeview.index(previous_id) + 1
+        return 0
+
+    def reset(self, tasks: Iterable[Task], visible_ids: Optional[set[str]] = None):
+        self._visible_ids = visible_ids
+        self.treeview.delete(*self.treeview.get_children())
+        entries = sorted((self._entry_for(task), task) for task in tasks)
+        self._ordered_keys = [entry for entry, _ in entries]
+        self._key_by_id = {entry[1]: entry for entry in self._ordered_keys}
+        for _, task in entries:
+            self.treeview.insert('', 'end', iid=task.task_id,
+                                 values=self._row_values(task), tags=self._row_tags(task))
+        if self._visible_ids is not None:
+            self.treeview.set_children('', *[task_id for _, task_id in self._ordered_keys if task_id in self._visible_ids])
+
+    def set_filter(self, visible_ids: Optional[set[str]]):
+        """Mostra apenas as linhas cujos IDs estão em `visible_ids` (None mostra todas)."""
+        previous_ids = self._visible_ids
+        self._visible_ids = visible_ids
+        if visible_ids is previous_ids:
+            return
+        if visible_ids is None:
+            self.treeview.set_children('', *[task_id for _, task_id in self._ordered_keys])
+        elif previous_ids is not None and visible_ids <= previous_ids:
+            # Consulta mais específica: basta desanexar as linhas que saíram do resultado
+            hidden_ids = [task_id for task_id in previous_ids
+                          if task_id not in visible_ids and task_id in self._key_by_id]
+            if hidden_ids:
+                self.treeview.detach(*hidden_ids)
+        else:
+            self.treeview.set_children('', *[task_id for _, task_id in self._ordered_keys if task_id in visible_ids])
+
+    def upsert(self, task: Task):
+        """Insere a tarefa na posição ordenada, ou atualiza/move a linha existente."""
+        new_entry = self._entry_for(task)
+        old_entry = self._key_by_id.get(task.task_id)
+        if old_entry is not None and old_entry != new_entry:
+            del self._ordered_keys[bisect_left(self._ordered_keys, old_entry)]
+        if old_entry != new_entry:
+            insort(self._ordered_keys, new_entry)
+            self._key_by_id[task.task_id] = new_entry
+
+        if old_entry is None:
+            self.treeview.insert('', 'end', iid=task.task_id,
+                                 values=self._row_values(task), tags=self._row_tags(task))
+        else:
+            self.treeview.item(task.task_id, values=self._row_values(task), tags=self._row_tags(task))
+
+        # Desanexa antes de calcular a posição, para que o índice das demais linhas não inclua esta
+        self.treeview.detach(task.task_id)
+        if self._is_visible(task.task_id):
+            position = self._attached_position(bisect_left(self._ordered_keys, new_entry))
+            self.treeview.move(task.task_id, '', position)
+
+    def remove(self, task_id: str):
+        entry = self._key_by_id.pop(task_id, None)
+        if entry is None:
+            return
+        del self._ordered_keys[bisect_left(self._ordered_keys, entry)]
+        if self.treeview.exists(task_id):
+            self.treeview.delete(task_id)
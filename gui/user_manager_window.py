@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import messagebox, ttk
 
+from asset_cache import AssetCache
 from config import Config, logger 
 from services import UserService # Para interagir com os dados dos usuários
 # MainWindow não é importada aqui para evitar ciclos. A referência à janela pai é passada.
@@ -8,7 +9,7 @@ from services import UserService # Para interagir com os dados dos usuários
 class UserManagerWindow:
     def __init__(self, parent_main_window_instance): 
         self.parent_main_window = parent_main_window_instance # Referência à instância da MainWindow
-        self.users_data = UserService.load_users() # Carrega os usuários atuais
+        self.users_data = {} # Preenchido por refresh_user_list_display() (leitura assíncrona)
         
         self.window = tk.Toplevel(parent_main_window_instance.root) 
         self.window.title("Gerenciador de Usuários")
@@ -30,13 +31,7 @@ class UserManagerWindow:
         self.window.grab_set() # Torna esta janela modal
 
         # Tenta definir ícone para a janela (usa o de usuário ou o padrão da app)
-        user_icon_path = Config.ICON_USER
-        if user_icon_path and user_icon_path.exists():
-             try: self.window.iconbitmap(str(user_icon_path))
-             except Exception as e: logger.warning(f"Não foi possível carregar o ícone ({user_icon_path}): {e}")
-        elif Config.ICON_PATH.exists(): # Fallback para o ícone principal
-            try: self.window.iconbitmap(str(Config.ICON_PATH))
-            except Exception as e: logger.warning(f"Não foi possível carregar o ícone padrão ({Config.ICON_PATH}): {e}")
+        AssetCache.apply_window_icon(self.window, Config.ICON_USER)
 
         self.setup_ui_elements() # Renomeado para clareza
         self.refresh_user_list_display() # Renomeado
@@ -77,10 +72,19 @@ class UserManagerWindow:
         ttk.Button(button_actions_frame, text="Fechar", command=self.window.destroy).pack(side=tk.RIGHT, padx=5)
 
     def refresh_user_list_display(self):
+        # Recarrega do arquivo para garantir dados atualizados; a leitura roda no loop asyncio da janela principal
+        self.parent_main_window.bridge.submit(
+            UserService.load_users_async(),
+            on_success=self._populate_user_list,
+            on_error=lambda e: messagebox.showerror("Erro", f"Não foi possível carregar os usuários: {e}", parent=self.window)
+        )
+
+    def _populate_user_list(self, users_data: dict):
+        if not self.window.winfo_exists():
+            return
+        self.users_data = users_data
         for item in self.user_list_treeview.get_children():
             self.user_list_treeview.delete(item)
-        
-        self.users_data = UserService.load_users() # Recarrega para garantir dados atualizados
 
         for username, user_details_dict in sorted(self.users_data.items()):
             self.user_list_treeview.insert('', 'end', iid=username, values=( # Usa username como iid
@@ -89,6 +93,14 @@ class UserManagerWindow:
                 user_details_dict.get('email', '')
             ))
 
+    def _save_users(self, on_saved, on_error):
+        """Grava os usuários pelo gravador assíncrono; os callbacks rodam na thread do Tk."""
+        self.parent_main_window.bridge.submit(
+            UserService.save_users_async(dict(self.users_data)),
+            on_success=lambda _: on_saved(),
+            on_error=on_error
+        )
+
     def _center_child_dialog(self, child_dialog: tk.Toplevel, width: int, height: int):
         self.window.update_idletasks() # Garante que as dimensões da janela pai (UserManagerWindow) estejam corretas
         parent_x = self.window.winfo_x()
@@ -221,14 +233,19 @@ class UserManagerWindow:
                 }
                 log_message = f"Novo usuário '{username}' criado."
 
-            try:
-                UserService.save_users(self.users_data)
+            def on_saved():
                 self.refresh_user_list_display() # Atualiza a lista na janela UserManager
                 logger.info(f"{log_message} (Operador: {self.parent_main_window.username})")
-                dialog.destroy()
-            except Exception as e_save:
-                messagebox.showerror("Erro ao Salvar", f"Não foi possível salvar os dados do usuário: {e_save}", parent=dialog)
-                logger.error(f"Erro ao salvar dados do usuário {username}: {e_save}", exc_info=True)
+                if dialog.winfo_exists():
+                    dialog.destroy()
+
+            def on_save_error(e_save: BaseException):
+                logger.error(f"Erro ao salvar dados do usuário {username}: {e_save}", exc_info=e_save)
+                messagebox.showerror("Erro ao Salvar", f"Não foi possível salvar os dados do usuário: {e_save}",
+                                     parent=dialog if dialog.winfo_exists() else self.window)
+                self.refresh_user_list_display() # Descarta a alteração em memória que não foi gravada
+
+            self._save_users(on_saved, on_save_error)
 
         ttk.Button(action_button_frame, text="Salvar", command=on_save).pack(side=tk.LEFT, padx=10)
         ttk.Button(action_button_frame, text="Cancelar", command=dialog.destroy).pack(side=tk.RIGHT, padx=10)
@@ -281,14 +298,19 @@ class UserManagerWindow:
                 return
             
             self.users_data[username_to_change_pass]['password_hash'] = UserService.hash_password(new_password)
-            try:
-                UserService.save_users(self.users_data)
+            def on_saved():
                 logger.info(f"Senha do usuário '{username_to_change_pass}' alterada. (Operador: {self.parent_main_window.username})")
-                messagebox.showinfo("Sucesso", "Senha alterada com sucesso!", parent=dialog)
-                dialog.destroy()
-            except Exception as e_save:
-                messagebox.showerror("Erro ao Salvar", f"Não foi possível alterar a senha: {e_save}", parent=dialog)
-                logger.error(f"Erro ao alterar senha do usuário {username_to_change_pass}: {e_save}", exc_info=True)
+                if dialog.winfo_exists():
+                    messagebox.showinfo("Sucesso", "Senha alterada com sucesso!", parent=dialog)
+                    dialog.destroy()
+
+            def on_save_error(e_save: BaseException):
+                logger.error(f"Erro ao alterar senha do usuário {username_to_change_pass}: {e_save}", exc_info=e_save)
+                messagebox.showerror("Erro ao Salvar", f"Não foi possível alterar a senha: {e_save}",
+                                     parent=dialog if dialog.winfo_exists() else self.window)
+                self.refresh_user_list_display()
+
+            self._save_users(on_saved, on_save_error)
 
         ttk.Button(action_button_frame, text="Salvar Nova Senha", command=on_save_password).pack(side=tk.LEFT, padx=10)
         ttk.Button(action_button_frame, text="Cancelar", command=dialog.destroy).pack(side=tk.RIGHT, padx=10)
@@ -316,15 +338,19 @@ class UserManagerWindow:
                                 icon='warning', parent=self.window):
             try:
                 del self.users_data[username_to_delete] # Remove do dicionário em memória
-                UserService.save_users(self.users_data) # Salva as alterações no arquivo
-                self.refresh_user_list_display() # Atualiza a Treeview
-                logger.info(f"Usuário '{username_to_delete}' removido. (Operador: {self.parent_main_window.username})")
             except KeyError:
                  messagebox.showerror("Erro Interno", f"Usuário '{username_to_delete}' não encontrado para remoção (pode já ter sido removido).", parent=self.window)
                  logger.warning(f"Tentativa de remover usuário '{username_to_delete}' que não está no dicionário users_data.")
                  self.refresh_user_list_display() # Garante que a lista esteja consistente
-            except Exception as e_delete:
+                 return
+
+            def on_saved():
+                self.refresh_user_list_display() # Atualiza a Treeview
+                logger.info(f"Usuário '{username_to_delete}' removido. (Operador: {self.parent_main_window.username})")
+
+            def on_delete_error(e_delete: BaseException):
                  messagebox.showerror("Erro ao Remover", f"Não foi possível remover o usuário: {e_delete}", parent=self.window)
-                 logger.error(f"Erro ao remover o usuário {username_to_delete}: {e_delete}", exc_info=True)
-                 self.users_data = UserService.load_users() # Recarrega em caso de falha para manter consistência
-                 self.refresh_user_list_display()
\ No newline at end of file
+                 logger.error(f"Erro ao remover o usuário {username_to_delete}: {e_delete}", exc_info=e_delete)
+                 self.refresh_user_list_display() # Recarrega em caso de falha para manter consistência
+
+            self._save_users(on_saved, on_delete_error)
\ No newline at end of file
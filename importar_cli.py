@@ -0,0 +1,98 @@
+"""Importação de tarefas em lote, sem interface gráfica.
+
+Uso:
+    python importar_cli.py backlog.csv                   # tarefas sem coluna de usuário ficam com 'admin'
+    python importar_cli.py backlog.jsonl --usuario ana
+    python importar_cli.py backlog.csv --lote 50000 --relatorio-erros erros.csv
+
+Colunas reconhecidas (CSV com ',' ou ';', ou chaves de JSON Lines): descricao, categoria,
+prioridade (1-3 ou Baixa/Média/Alta), usuario, concluida, criada_em, concluida_em, concluida_por,
+vencimento e lembrete (DD/MM/AAAA HH:MM ou ISO).
+Com AGENDA_API_URL definido, as tarefas vão para o servidor (api_server.py) em vez do arquivo; com
+AGENDA_SHARED_DIR, vão para a réplica local e são enviadas à pasta compartilhada ao final.
+O código de saída é 0 se todas as linhas foram importadas e 1 se alguma foi rejeitada.
+"""
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from config import Config, init_app
+
+FILE_BATCH_SIZE = 50_000 # Com arquivos locais cada lote regrava o tasks.json inteiro: lotes maiores, menos regravações
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="importar_cli", description=f"Importa tarefas para o {Config.APP_NAME}.")
+    parser.add_argument("arquivo", type=Path, help="Arquivo .csv ou .jsonl com as tarefas.")
+    parser.add_argument("--usuario", default="admin", help="Usuário das linhas sem coluna de usuário (padrão: admin).")
+    parser.add_argument("--lote", type=int, default=None, metavar="N",
+                        help=f"Tarefas gravadas por lote (padrão: 10000 no servidor, {FILE_BATCH_SIZE} com arquivos locais).")
+    parser.add_argument("--relatorio-erros", type=Path, default=None, metavar="ARQUIVO",
+                        help="Onde gravar as linhas rejeitadas (padrão: pasta de relatórios).")
+    return parser.parse_args(argv)
+
+
+def run(argv: Optional[List[str]] = None) -> int:
+    args = _parse_args(argv)
+    init_app()
+    from api_client import RemoteTaskService, task_backend
+    from importer import TaskImporter
+    from services import TaskService
+    from sync_engine import ReplicaTaskService
+
+    try:
+        TaskImporter.detect_format(args.arquivo)
+        estimated_rows = TaskImporter.count_lines(args.arquivo)
+    except (ValueError, OSError) as e:
+        print(f"Não foi possível ler {args.arquivo}: {e}", file=sys.stderr)
+        return 2
+
+    task_service = task_backend()
+    batch_size = args.lote
+    if isinstance(task_service, RemoteTaskService):
+        def commit_batch(batch: List[Dict]):
+            # Os IDs já vêm de um bloco reservado no servidor; /batch grava o lote numa requisição
+            results = task_service.client.batch([{'op': 'add', 'task': task_dict} for task_dict in batch])
+            rejected = [result.get('error') for result in results if not result.get('ok')]
+            if rejected:
+                raise RuntimeError(f"O servidor recusou {len(rejected)} tarefa(s) do lote: {rejected[0]}")
+    elif isinstance(task_service, ReplicaTaskService):
+        batch_size = batch_size or FILE_BATCH_SIZE
+        def commit_batch(batch: List[Dict]):
+            # A réplica carimba as versões e enfileira as tarefas para envio
+            task_service.save_tasks(task_service.load_tasks() + batch)
+    else:
+        batch_size = batch_size or FILE_BATCH_SIZE
+        def commit_batch(batch: List[Dict]):
+            # Lote atômico: um ID repetido (outro processo gravou no meio) descarta o lote inteiro
+            TaskService.add_tasks(batch).raise_for_failures()
+    first_task_id = task_service.reserve_task_ids(estimated_rows)
+
+    def show_progress(rows_read: int, total_rows: int):
+        print(f"  {rows_read} de ~{total_rows} linha(s) lida(s)...", flush=True)
+
+    try:
+        summary = TaskImporter.run(args.arquivo, args.usuario, first_task_id, commit_batch,
+                                   batch_size=batch_size, estimated_rows=estimated_rows, progress_callback=show_progress)
+    except Exception as e:
+        print(f"Importação interrompida: {e}", file=sys.stderr)
+        return 2
+    if isinstance(task_service, ReplicaTaskService) and not task_service.sync_engine.sync_once():
+        print("Pasta compartilhada indisponível: as tarefas ficam na réplica local e são enviadas na próxima sincronização.")
+
+    print(f"{summary.imported} tarefa(s) importada(s) em {summary.elapsed_s:.1f}s; {len(summary.errors)} linha(s) rejeitada(s).")
+    if summary.errors:
+        for error in summary.errors[:20]:
+            print(f"  linha {error.line_number}: {error.message}")
+        if len(summary.errors) > 20:
+            print(f"  ... e mais {len(summary.errors) - 20}.")
+        report_path = args.relatorio_erros or Config.REPORTS_DIR / f"importacao_erros_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        print(f"Relatório de erros: {TaskImporter.write_error_report(summary.errors, report_path)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run())
@@ -0,0 +1,241 @@
+import csv
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from config import logger
+from models import parse_local_datetime
+from services import TaskService
+
+FORMAT_CSV = "csv"
+FORMAT_JSONL = "jsonl"
+SUPPORTED_SUFFIXES = {'.csv': FORMAT_CSV, '.txt': FORMAT_CSV, '.jsonl': FORMAT_JSONL, '.ndjson': FORMAT_JSONL, '.json': FORMAT_JSONL}
+
+# Nomes de coluna aceitos além dos nomes internos (cabeçalhos de planilha em português)
+FIELD_ALIASES = {
+    'descricao': 'description', 'descrição': 'description', 'tarefa': 'description',
+    'categoria': 'category', 'prioridade': 'priority',
+    'usuario': 'user', 'usuário': 'user', 'responsavel': 'user', 'responsável': 'user',
+    'concluida': 'is_completed', 'concluída': 'is_completed', 'status': 'is_completed',
+    'criada_em': 'created_at', 'criado_em': 'created_at',
+    'concluida_em': 'completed_at', 'concluída_em': 'completed_at',
+    'concluida_por': 'completed_by', 'concluída_por': 'completed_by',
+    'vencimento': 'due_at', 'prazo': 'due_at', 'vence_em': 'due_at',
+    'lembrete': 'remind_at', 'lembrar_em': 'remind_at',
+}
+PRIORITY_NAMES = {'baixa': 1, 'media': 2, 'média': 2, 'alta': 3}
+BR_DATE_FORMATS = ("%d/%m/%Y %H:%M:%S", "%d/%m/%Y %H:%M", "%d/%m/%Y")
+TRUE_VALUES = {'1', 'true', 'sim', 's', 'yes', 'y', 'x', 'concluida', 'concluída'}
+
+ProgressCallback = Callable[[int, int], None] # (linhas lidas, total estimado)
+
+
+@dataclass
+class ImportRowError:
+    line_number: int
+    message: str
+
+
+@dataclass
+class ImportSummary:
+    imported: int = 0
+    errors: List[ImportRowError] = field(default_factory=list)
+    elapsed_s: float = 0.0
+    cancelled: bool = False
+
+
+class TaskImporter:
+    """Importação em lote de tarefas a partir de CSV ou JSON Lines, lida em fluxo (sem carregar o arquivo inteiro).
+
+    Cada linha é validada com as mesmas regras do diálogo de nova tarefa
+    (TaskService.validate_task_fields); linhas inválidas entram no relatório de erros e não
+    interrompem a importação. Os IDs vêm de um bloco reservado uma única vez, e as tarefas
+    válidas são entregues a `commit_batch` em lotes de BATCH_SIZE.
+    """
+    BATCH_SIZE = 10_000
+
+    @staticmethod
+    def detect_format(file_path: Path) -> str:
+        file_format = SUPPORTED_SUFFIXES.get(file_path.suffix.lower())
+        if file_format is None:
+            raise ValueError(f"Formato não suportado: '{file_path.suffix}'. Use .csv ou .jsonl.")
+        return file_format
+
+    @staticmethod
+    def count_lines(file_path: Path) -> int:
+        """Limite superior do número de registros (cada registro ocupa ao menos uma linha)."""
+        line_count, last_chunk = 0, b""
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                line_count += chunk.count(b"\n")
+                last_chunk = chunk
+        return line_count + (1 if last_chunk and not last_chunk.endswith(b"\n") else 0)
+
+    @staticmethod
+    def iter_records(file_path: Path) -> Iterator[Tuple[int, Union[Dict, str]]]:
+        """Gera (número da linha, registro) — ou (número da linha, mensagem de erro) se a linha não pôde ser lida."""
+        with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
+            if TaskImporter.detect_format(file_path) == FORMAT_CSV:
+                sample = f.read(8192)
+                f.seek(0)
+                try:
+                    # Só o separador vem do Sniffer (planilhas em pt-BR costumam usar ';'); as regras de
+                    # aspas ficam as do Excel, que o Sniffer às vezes erra
+                    delimiter = csv.Sniffer().sniff(sample, delimiters=",;\t").delimiter
+                except csv.Error:
+                    delimiter = ","
+                reader = csv.DictReader(f, delimiter=delimiter)
+                for record in reader:
+                    yield reader.line_num, record
+                return
+            first_char = f.read(1)
+            f.seek(0)
+            if first_char == '[':
+                # Arquivo .json com uma lista: não dá para ler em fluxo, mas continua aceito
+                try:
+                    records = json.load(f)
+                except json.JSONDecodeError as e:
+                    yield e.lineno, f"JSON inválido: {e.msg}"
+                    return
+                for record_index, record in enumerate(records, start=1):
+                    yield record_index, record if isinstance(record, dict) else "O item não é um objeto JSON."
+                return
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield line_number, f"JSON inválido: {e.msg}"
+                    continue
+                yield line_number, record if isinstance(record, dict) else "A linha não é um objeto JSON."
+
+    @staticmethod
+    def _normalized(record: Dict) -> Dict:
+        normalized = {}
+        for key, value in record.items():
+            if key is None: # Colunas excedentes numa linha de CSV
+                continue
+            # "Criada em" (cabeçalho das exportações) vale o mesmo que criada_em
+            key = "_".join(str(key).lower().split())
+            normalized[FIELD_ALIASES.get(key, key)] = value.strip() if isinstance(value, str) else value
+        return normalized
+
+    @staticmethod
+    def _parse_priority(value) -> int:
+        if value in (None, ""):
+            return 1
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        text = str(value).strip().lower()
+        if text in PRIORITY_NAMES:
+            return PRIORITY_NAMES[text]
+        if text.isdigit():
+            return int(text)
+        raise ValueError(f"Prioridade inválida: '{value}' (use 1-3 ou Baixa/Média/Alta).")
+
+    @staticmethod
+    def _parse_datetime(value, field_label: str) -> Optional[str]:
+        if value in (None, ""):
+            return None
+        text = str(value).strip()
+        parsed = parse_local_datetime(text) # Ex.: '2026-10-20T18:00:00Z' é convertida para a hora local
+        if parsed is not None:
+            return parsed.isoformat()
+        for date_format in BR_DATE_FORMATS: # Datas como as planilhas em pt-BR exportam
+            try:
+                return datetime.strptime(text, date_format).isoformat()
+            except ValueError:
+                continue
+        raise ValueError(f"Data inválida em '{field_label}': '{value}' (use AAAA-MM-DD HH:MM ou DD/MM/AAAA HH:MM).")
+
+    @staticmethod
+    def build_task(record: Dict, task_id: str, default_user: str, allow_other_users: bool, now_iso: str) -> Dict:
+        """Converte um registro lido em dict de tarefa válido; levanta ValueError com a mensagem do problema."""
+        fields = TaskImporter._normalized(record)
+        description = str(fields.get('description') or "")
+        category = str(fields.get('category') or "")
+        priority = TaskImporter._parse_priority(fields.get('priority'))
+        validation_error = TaskService.validate_task_fields(description, category, priority)
+        if validation_error:
+            raise ValueError(validation_error)
+        user = str(fields.get('user') or "") if allow_other_users else ""
+        completed_value = fields.get('is_completed')
+        is_completed = completed_value is True or str(completed_value or "").strip().lower() in TRUE_VALUES
+        completed_at = TaskImporter._parse_datetime(fields.get('completed_at'), "concluida_em")
+        due_at = TaskImporter._parse_datetime(fields.get('due_at'), "vencimento")
+        remind_at = TaskImporter._parse_datetime(fields.get('remind_at'), "lembrete")
+        return {
+            'task_id': task_id,
+            'description': description,
+            'user': user or default_user,
+            'is_completed': is_completed,
+            'created_at': TaskImporter._parse_datetime(fields.get('created_at'), "criada_em") or now_iso,
+            'completed_at': (completed_at or now_iso) if is_completed else None,
+            'completed_by': (str(fields.get('completed_by') or "") or user or default_user) if is_completed else None,
+            'priority': priority,
+            'category': category,
+            'due_at': due_at,
+            'remind_at': remind_at,
+        }
+
+    @staticmethod
+    def run(file_path: Path, default_user: str, first_task_id: int,
+            commit_batch: Callable[[List[Dict]], None],
+            allow_other_users: bool = True,
+            batch_size: Optional[int] = None,
+            estimated_rows: int = 0,
+            progress_callback: Optional[ProgressCallback] = None,
+            cancel_event: Optional[threading.Event] = None) -> ImportSummary:
+        """Lê o arquivo e entrega as tarefas válidas a `commit_batch`, em lotes; os IDs começam em `first_task_id`."""
+        batch_size = batch_size or TaskImporter.BATCH_SIZE
+        summary = ImportSummary()
+        started_at = time.perf_counter()
+        now_iso = datetime.now().isoformat()
+        next_task_id = first_task_id
+        batch: List[Dict] = []
+        rows_read = 0
+        for line_number, record in TaskImporter.iter_records(file_path):
+            rows_read += 1
+            if isinstance(record, str):
+                summary.errors.append(ImportRowError(line_number, record))
+                continue
+            try:
+                batch.append(TaskImporter.build_task(record, str(next_task_id), default_user, allow_other_users, now_iso))
+                next_task_id += 1
+            except ValueError as e:
+                summary.errors.append(ImportRowError(line_number, str(e)))
+                continue
+            if len(batch) >= batch_size:
+                if cancel_event is not None and cancel_event.is_set():
+                    summary.cancelled = True
+                    break
+                commit_batch(batch)
+                summary.imported += len(batch)
+                batch = []
+                if progress_callback:
+                    progress_callback(rows_read, estimated_rows)
+        if batch and not summary.cancelled:
+            commit_batch(batch)
+            summary.imported += len(batch)
+        if progress_callback:
+            progress_callback(rows_read, estimated_rows)
+        summary.elapsed_s = time.perf_counter() - started_at
+        logger.info(f"Importação de {file_path.name}: {summary.imported} tarefa(s) importada(s), "
+                    f"{len(summary.errors)} linha(s) com erro, em {summary.elapsed_s:.1f}s"
+                    + (" (cancelada)" if summary.cancelled else "") + ".")
+        return summary
+
+    @staticmethod
+    def write_error_report(errors: List[ImportRowError], report_path: Path) -> Path:
+        """Grava as linhas rejeitadas em CSV (linha;erro), legível no Excel."""
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(report_path, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.writer(f, delimiter=';')
+            writer.writerow(["linha", "erro"])
+            writer.writerows((error.line_number, error.message) for error in errors)
+        return report_path
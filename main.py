@@ -1,4 +1,7 @@
-from AgendaCompPro import iniciar_app
+import multiprocessing
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support() # Necessário no executável (PyInstaller) para o pool de processos dos relatórios grandes
+    # Importado só aqui: os processos do pool ('spawn') reimportam este módulo e não devem carregar a aplicação
+    from AgendaCompPro import iniciar_app
     iniciar_app()
@@ -0,0 +1,137 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Deque, Dict, Iterator, Optional
+
+from config import Config, logger
+
+
+class _TimerStats:
+    """Durações recentes de uma operação (janela deslizante) e totais desde o início."""
+
+    def __init__(self, window_size: int):
+        self.durations: Deque[float] = deque(maxlen=window_size) # Em segundos
+        self.count = 0
+        self.errors = 0
+        self.total_s = 0.0
+        self.last_s = 0.0
+
+    def to_dict(self) -> Dict:
+        recent = sorted(self.durations)
+        def percentile_ms(quantile: float) -> float:
+            if not recent:
+                return 0.0
+            return recent[min(len(recent) - 1, int(round(quantile * (len(recent) - 1))))] * 1000
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'p50_ms': round(percentile_ms(0.50), 3),
+            'p95_ms': round(percentile_ms(0.95), 3),
+            'max_ms': round(recent[-1] * 1000, 3) if recent else 0.0,
+            'last_ms': round(self.last_s * 1000, 3),
+            'total_s': round(self.total_s, 3),
+        }
+
+
+class Metrics:
+    """Cronômetros e contadores dos caminhos críticos, mantidos em memória.
+
+    Os percentis (p50/p95/máx) são calculados sobre as últimas WINDOW_SIZE medições de cada
+    operação. Medir custa uma leitura de relógio e um append sob lock; a ordenação só acontece
+    ao consultar (`snapshot`) ou gravar o arquivo de métricas.
+    """
+    WINDOW_SIZE = 1000
+    METRICS_FILE_NAME = "metrics.json"
+
+    _lock = threading.Lock()
+    _timers: Dict[str, _TimerStats] = {}
+    _counters: Dict[str, int] = {}
+    _started_at = datetime.now()
+
+    # --- Registro ---
+    @staticmethod
+    def record(name: str, duration_s: float, failed: bool = False):
+        with Metrics._lock:
+            stats = Metrics._timers.get(name)
+            if stats is None:
+                stats = Metrics._timers[name] = _TimerStats(Metrics.WINDOW_SIZE)
+            stats.durations.append(duration_s)
+            stats.count += 1
+            stats.total_s += duration_s
+            stats.last_s = duration_s
+            if failed:
+                stats.errors += 1
+
+    @staticmethod
+    @contextmanager
+    def timer(name: str) -> Iterator[None]:
+        """Mede o bloco `with`; exceções contam como erro da operação e são propagadas."""
+        started_at = time.perf_counter()
+        failed = True
+        try:
+            yield
+            failed = False
+        finally:
+            Metrics.record(name, time.perf_counter() - started_at, failed)
+
+    @staticmethod
+    def timed(name: str) -> Callable[[Callable], Callable]:
+        """Decorador: mede cada chamada da função com o cronômetro `name`."""
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with Metrics.timer(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    @staticmethod
+    def increment(name: str, amount: int = 1):
+        with Metrics._lock:
+            Metrics._counters[name] = Metrics._counters.get(name, 0) + amount
+
+    # --- Consulta ---
+    @staticmethod
+    def snapshot() -> Dict:
+        """Estado atual: {'timers': {nome: estatísticas}, 'counters': {nome: valor}}."""
+        with Metrics._lock:
+            timers = {name: stats.to_dict() for name, stats in sorted(Metrics._timers.items())}
+            counters = dict(sorted(Metrics._counters.items()))
+        return {'timers': timers, 'counters': counters}
+
+    @staticmethod
+    def reset():
+        with Metrics._lock:
+            Metrics._timers.clear()
+            Metrics._counters.clear()
+            Metrics._started_at = datetime.now()
+
+    @staticmethod
+    def write_metrics_file(file_path: Optional[Path] = None) -> Optional[Path]:
+        """Grava o snapshot em JSON (padrão: Config.LOG_DIR/metrics.json). Retorna o caminho ou None se falhar."""
+        file_path = file_path or Config.LOG_DIR / Metrics.METRICS_FILE_NAME
+        content = {
+            'app': Config.APP_NAME,
+            'version': Config.VERSION,
+            'pid': os.getpid(),
+            'since': Metrics._started_at.isoformat(timespec='seconds'),
+            'written_at': datetime.now().isoformat(timespec='seconds'),
+            **Metrics.snapshot(),
+        }
+        temp_path = file_path.with_name(file_path.name + ".tmp")
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(content, f, indent=2, ensure_ascii=False)
+            os.replace(temp_path, file_path)
+            return file_path
+        except OSError as e:
+            logger.warning(f"Não foi possível gravar o arquivo de métricas {file_path}: {e}")
+            return None
+
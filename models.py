@@ -2,6 +2,17 @@ import uuid
 from datetime import datetime
 from typing import Dict, Optional
 
+
+def parse_local_datetime(iso_datetime_str: Optional[str]) -> Optional[datetime]:
+    """Data ISO como hora local sem fuso (as com fuso, ex.: '...Z', são convertidas); None se vazia ou inválida."""
+    if not iso_datetime_str:
+        return None
+    try:
+        parsed = datetime.fromisoformat(iso_datetime_str)
+    except ValueError:
+        return None
+    return parsed.astimezone().replace(tzinfo=None) if parsed.tzinfo is not None else parsed
+
 class User: # Sem alterações na classe User
     def __init__(self, username: str, password_hash: str, level: str, email: str = ""):
         self.username = username
@@ -34,7 +45,9 @@ class Task:
                  completed_at: Optional[str] = None,
                  completed_by: Optional[str] = None, 
                  priority: int = 1, 
-                 category: str = ""):
+                 category: str = "",
+                 due_at: Optional[str] = None,
+                 remind_at: Optional[str] = None):
         # O ID da tarefa (task_id) agora deve ser fornecido ao criar a tarefa.
         # Não há mais geração automática de UUID aqui.
         self.task_id = task_id 
@@ -46,6 +59,8 @@ class Task:
         self.completed_by = completed_by 
         self.priority = priority
         self.category = category
+        self.due_at = due_at # Vencimento (ISO), opcional
+        self.remind_at = remind_at # Quando lembrar o usuário (ISO), opcional
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'Task':
@@ -70,7 +85,9 @@ class Task:
             completed_at=data.get('completed_at'),
             completed_by=data.get('completed_by'), 
             priority=data.get('priority', 1),
-            category=data.get('category', '')
+            category=data.get('category', ''),
+            due_at=data.get('due_at'),
+            remind_at=data.get('remind_at')
         )
 
     def to_dict(self) -> Dict:
@@ -83,5 +100,14 @@ class Task:
             'completed_at': self.completed_at,
             'completed_by': self.completed_by, 
             'priority': self.priority,
-            'category': self.category
-        }
\ No newline at end of file
+            'category': self.category,
+            'due_at': self.due_at,
+            'remind_at': self.remind_at
+        }
+
+    def is_overdue(self, now: Optional[datetime] = None) -> bool:
+        """Pendente com vencimento já passado."""
+        if self.is_completed:
+            return False
+        due_at = parse_local_datetime(self.due_at) # Gravada com fuso por versões anteriores: compara na hora local
+        return due_at is not None and due_at <= (now or datetime.now())
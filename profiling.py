@@ -0,0 +1,173 @@
+import cProfile
+import io
+import os
+import platform
+import pstats
+import re
+import threading
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+from config import Config, logger
+
+# Ativação para a sessão inteira:
+#   AGENDA_PROFILE=1                 variável de ambiente
+#   python main.py --profile         opção de linha de comando
+PROFILE_ENV_VAR = "AGENDA_PROFILE"
+PROFILE_CLI_FLAG = "--profile"
+
+TRACEMALLOC_FRAMES = 10   # Profundidade da pilha guardada em cada alocação
+SUMMARY_TOP_FUNCTIONS = 40
+SUMMARY_TOP_ALLOCATIONS = 25
+
+
+@dataclass
+class ProfileCapture:
+    """Resultado de uma medição encerrada, pronto para ser gravado em disco."""
+    label: str
+    started_at: datetime
+    finished_at: datetime
+    profile: cProfile.Profile
+    start_snapshot: tracemalloc.Snapshot
+    end_snapshot: tracemalloc.Snapshot
+    current_bytes: int
+    peak_bytes: int
+    data_sizes: Dict[str, int]
+
+
+class Profiler:
+    """Perfilamento opcional (cProfile + tracemalloc) de uma sessão ou de um trecho de uso.
+
+    Desligado por padrão: só custa algo quando ativado pela variável AGENDA_PROFILE, pela opção
+    --profile ou pelo menu. O cProfile mede apenas a thread que chamou `start` (a thread do Tk,
+    onde os travamentos da interface acontecem); o tracemalloc vê as alocações de todas as threads.
+    Os arquivos vão para Config.LOG_DIR: `.prof` (pstats/snakeviz), `.tracemalloc`
+    (tracemalloc.Snapshot.load) e um resumo `.txt` com a versão e o tamanho dos dados.
+    """
+    _lock = threading.Lock()
+    _profile: Optional[cProfile.Profile] = None
+    _label = ""
+    _started_at: Optional[datetime] = None
+    _start_snapshot: Optional[tracemalloc.Snapshot] = None
+    _data_sizes_provider: Optional[Callable[[], Dict[str, int]]] = None
+
+    @staticmethod
+    def session_requested(argv: Sequence[str]) -> bool:
+        """True se o perfilamento da sessão foi pedido pela variável de ambiente ou pela linha de comando."""
+        env_value = os.getenv(PROFILE_ENV_VAR, "").strip().lower()
+        return env_value in ("1", "true", "sim", "yes") or PROFILE_CLI_FLAG in argv
+
+    @staticmethod
+    def set_data_sizes_provider(provider: Optional[Callable[[], Dict[str, int]]]):
+        """Registra quem informa o volume de dados em memória (ex.: a janela principal com o repositório)."""
+        Profiler._data_sizes_provider = provider
+
+    @staticmethod
+    def is_active() -> bool:
+        return Profiler._profile is not None
+
+    @staticmethod
+    def start(label: str) -> bool:
+        """Inicia a medição na thread atual. Retorna False se já havia uma medição em andamento."""
+        with Profiler._lock:
+            if Profiler._profile is not None:
+                return False
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(TRACEMALLOC_FRAMES)
+            tracemalloc.reset_peak()
+            Profiler._start_snapshot = tracemalloc.take_snapshot()
+            Profiler._label = label
+            Profiler._started_at = datetime.now()
+            Profiler._profile = cProfile.Profile()
+            Profiler._profile.enable()
+        logger.info(f"Perfilamento '{label}' iniciado (cProfile + tracemalloc).")
+        return True
+
+    @staticmethod
+    def stop() -> Optional[ProfileCapture]:
+        """Encerra a medição (na mesma thread de `start`) e devolve o resultado; None se não havia medição.
+
+        Só coleta os dados: a gravação (`write_capture`) pode ser feita em outra thread.
+        """
+        with Profiler._lock:
+            profile = Profiler._profile
+            if profile is None:
+                return None
+            profile.disable()
+            end_snapshot = tracemalloc.take_snapshot()
+            current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            capture = ProfileCapture(
+                label=Profiler._label, started_at=Profiler._started_at, finished_at=datetime.now(),
+                profile=profile, start_snapshot=Profiler._start_snapshot, end_snapshot=end_snapshot,
+                current_bytes=current_bytes, peak_bytes=peak_bytes, data_sizes=Profiler._collect_data_sizes(),
+            )
+            Profiler._profile = None
+            Profiler._start_snapshot = None
+        logger.info(f"Perfilamento '{capture.label}' encerrado após {(capture.finished_at - capture.started_at).total_seconds():.1f}s.")
+        return capture
+
+    @staticmethod
+    def stop_and_write() -> Optional[Path]:
+        capture = Profiler.stop()
+        return Profiler.write_capture(capture) if capture else None
+
+    @staticmethod
+    def _collect_data_sizes() -> Dict[str, int]:
+        data_sizes: Dict[str, int] = {}
+        for key, file_path in (('tasks_json_bytes', Config.TASKS_FILE), ('users_json_bytes', Config.USERS_FILE)):
+            try:
+                data_sizes[key] = file_path.stat().st_size
+            except OSError:
+                pass
+        if Profiler._data_sizes_provider is not None:
+            try:
+                data_sizes.update(Profiler._data_sizes_provider())
+            except Exception as e:
+                logger.warning(f"Não foi possível obter o volume de dados para o perfil: {e}")
+        return data_sizes
+
+    @staticmethod
+    def write_capture(capture: ProfileCapture) -> Optional[Path]:
+        """Grava .prof, .tracemalloc e o resumo .txt em Config.LOG_DIR. Retorna o caminho do resumo ou None se falhar."""
+        safe_label = re.sub(r'[^\w-]+', '_', capture.label).strip('_') or "perfil"
+        base_path = Config.LOG_DIR / f"perfil_{safe_label}_{capture.started_at.strftime('%Y%m%d_%H%M%S')}"
+        profile_path = base_path.with_name(base_path.name + ".prof")
+        snapshot_path = base_path.with_name(base_path.name + ".tracemalloc")
+        summary_path = base_path.with_name(base_path.name + ".txt")
+        try:
+            Config.LOG_DIR.mkdir(parents=True, exist_ok=True)
+            capture.profile.dump_stats(str(profile_path))
+            capture.end_snapshot.dump(str(snapshot_path))
+            summary_path.write_text(Profiler._build_summary(capture, profile_path, snapshot_path), encoding='utf-8')
+        except OSError as e:
+            logger.error(f"Não foi possível gravar o perfil '{capture.label}' em {Config.LOG_DIR}: {e}")
+            return None
+        logger.info(f"Perfil '{capture.label}' gravado em {summary_path}")
+        return summary_path
+
+    @staticmethod
+    def _build_summary(capture: ProfileCapture, profile_path: Path, snapshot_path: Path) -> str:
+        duration_s = (capture.finished_at - capture.started_at).total_seconds()
+        lines: List[str] = [
+            f"{Config.APP_NAME} v{Config.VERSION} - perfil '{capture.label}'",
+            f"Início: {capture.started_at.isoformat(timespec='seconds')}   Fim: {capture.finished_at.isoformat(timespec='seconds')}   Duração: {duration_s:.1f}s",
+            f"Python {platform.python_version()} - {platform.platform()} - PID {os.getpid()}",
+            "Dados: " + (", ".join(f"{key}={value}" for key, value in sorted(capture.data_sizes.items())) or "(desconhecido)"),
+            f"Memória rastreada: atual {capture.current_bytes / 1024 ** 2:.1f} MiB, pico {capture.peak_bytes / 1024 ** 2:.1f} MiB",
+            f"Arquivos: {profile_path.name} (pstats), {snapshot_path.name} (tracemalloc)",
+            "",
+            f"== Funções por tempo acumulado (top {SUMMARY_TOP_FUNCTIONS}, thread da interface) ==",
+        ]
+        stats_output = io.StringIO()
+        pstats.Stats(capture.profile, stream=stats_output).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(SUMMARY_TOP_FUNCTIONS)
+        lines.append(stats_output.getvalue().strip())
+        lines += ["", f"== Crescimento de memória por linha desde o início (top {SUMMARY_TOP_ALLOCATIONS}) =="]
+        # As alocações do próprio tracemalloc e do mecanismo de importação só atrapalham a leitura
+        ignored = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, "<frozen importlib._bootstrap*>")]
+        memory_diff = capture.end_snapshot.filter_traces(ignored).compare_to(capture.start_snapshot.filter_traces(ignored), 'lineno')
+        lines += [str(stat) for stat in memory_diff[:SUMMARY_TOP_ALLOCATIONS]]
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,152 @@
+"""Geração de relatórios sem interface gráfica (ex.: agendado no cron ou no Agendador de Tarefas).
+
+Uso:
+    python relatorios_cli.py                         # todos os relatórios
+    python relatorios_cli.py pendentes analise       # apenas os indicados
+    python relatorios_cli.py usuarios --usuario ana  # por usuário, só de 'ana'
+
+Os PDFs são gravados em Config.REPORTS_DIR. Cada relatório roda num processo do pool.
+As tarefas vêm da mesma origem que a interface usa (AGENDA_API_URL, AGENDA_SHARED_DIR ou os arquivos locais).
+O código de saída é 0 se todos foram gerados, 1 se algum falhou e 2 se as tarefas não puderam ser carregadas.
+"""
+import argparse
+import multiprocessing
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from config import Config, logger, init_app, HAS_NUMPY
+
+REPORT_PENDING = "pendentes"
+REPORT_COMPLETED = "concluidas"
+REPORT_PER_USER = "usuarios"
+REPORT_ANALYTICS = "analise"
+REPORT_KINDS = [REPORT_PENDING, REPORT_COMPLETED, REPORT_PER_USER, REPORT_ANALYTICS]
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="relatorios_cli",
+        description=f"Gera relatórios PDF do {Config.APP_NAME} sem abrir a interface gráfica.",
+    )
+    parser.add_argument("relatorios", nargs="*", metavar="RELATORIO",
+                        help=f"Relatórios a gerar: {', '.join(REPORT_KINDS)} (padrão: todos).")
+    parser.add_argument("--usuario", action="append", dest="usuarios", metavar="NOME",
+                        help="Limita os relatórios por usuário a este usuário (pode repetir).")
+    parser.add_argument("--processos", type=int, default=None, metavar="N",
+                        help="Número de processos do pool (padrão: número de CPUs).")
+    args = parser.parse_args(argv)
+    # Validado aqui e não com `choices`: com nargs="*" o argparse rejeita a lista vazia (Python < 3.12)
+    invalid_kinds = [kind for kind in args.relatorios if kind not in REPORT_KINDS]
+    if invalid_kinds:
+        parser.error(f"relatório desconhecido: {', '.join(invalid_kinds)} (opções: {', '.join(REPORT_KINDS)})")
+    return args
+
+
+def _safe_name(text: str) -> str:
+    """Nome de usuário utilizável em nome de arquivo."""
+    return re.sub(r'[^\w-]+', '_', text).strip('_') or "sem_nome"
+
+
+def _plan_jobs(tasks_data: List[Dict], report_kinds: List[str], usernames: Optional[List[str]]) -> List[Dict]:
+    """Monta a lista de relatórios: cada item leva o rótulo, o tipo e apenas as tarefas que usa."""
+    jobs = []
+    if REPORT_PENDING in report_kinds:
+        jobs.append({'label': "Tarefas pendentes", 'report_type': "pending",
+                     'tasks_data': [task_dict for task_dict in tasks_data if not task_dict.get('is_completed')]})
+    if REPORT_COMPLETED in report_kinds:
+        jobs.append({'label': "Tarefas concluídas", 'report_type': "completed",
+                     'tasks_data': [task_dict for task_dict in tasks_data if task_dict.get('is_completed')]})
+    if REPORT_PER_USER in report_kinds:
+        tasks_by_user: Dict[str, List[Dict]] = {}
+        for task_dict in tasks_data:
+            tasks_by_user.setdefault(task_dict.get('user') or "", []).append(task_dict)
+        for username in usernames or sorted(tasks_by_user):
+            jobs.append({'label': f"Tarefas do usuário '{username}'", 'report_type': f"usuario {_safe_name(username)}",
+                         'tasks_data': tasks_by_user.get(username, [])})
+    if REPORT_ANALYTICS in report_kinds:
+        jobs.append({'label': "Análise de produtividade", 'report_type': REPORT_ANALYTICS, 'tasks_data': tasks_data})
+    return jobs
+
+
+def _generate_report(job: Dict) -> Optional[str]:
+    """Gera um relatório (executado num processo do pool). Retorna o caminho do PDF ou None se não há tarefas."""
+    from utils import PDFGenerator
+    if job['report_type'] == REPORT_ANALYTICS:
+        from analytics import ProductivityAnalytics, TaskColumns
+        summary = ProductivityAnalytics.summarize(TaskColumns.from_dicts(job['tasks_data']))
+        return PDFGenerator.generate_analytics_report(summary, evict_cache=False)
+    if not job['tasks_data']:
+        return None
+    # Este processo já é um dos trabalhadores do pool: relatórios grandes não abrem outro pool.
+    # A limpeza do cache fica para o fim da execução (run), que preserva todos os relatórios do lote
+    return PDFGenerator.generate_task_report(job['tasks_data'], job['report_type'], use_processes=False, evict_cache=False)
+
+
+def run(argv: Optional[List[str]] = None) -> int:
+    args = _parse_args(argv)
+    init_app()
+    report_kinds = args.relatorios or REPORT_KINDS
+    if REPORT_ANALYTICS in report_kinds and not HAS_NUMPY:
+        print("Análise de produtividade ignorada: requer a biblioteca NumPy (pip install numpy).", file=sys.stderr)
+        report_kinds = [kind for kind in report_kinds if kind != REPORT_ANALYTICS]
+
+    # Mesma origem das tarefas que a GUI: arquivos locais, o servidor (AGENDA_API_URL) ou a réplica (AGENDA_SHARED_DIR)
+    from api_client import ApiClientError, task_backend
+    from sync_engine import ReplicaTaskService
+    task_service = task_backend()
+    if isinstance(task_service, ReplicaTaskService) and not task_service.sync_engine.sync_once():
+        print("Pasta compartilhada indisponível: relatórios gerados com a réplica local, que pode estar desatualizada.",
+              file=sys.stderr)
+    try:
+        tasks_data = task_service.load_tasks()
+    except (ApiClientError, OSError, ValueError) as e:
+        print(f"Não foi possível carregar as tarefas: {e}", file=sys.stderr)
+        return 2
+    jobs = _plan_jobs(tasks_data, report_kinds, args.usuarios)
+    if not jobs:
+        print("Nenhum relatório a gerar.")
+        return 0
+
+    max_workers = max(1, min(len(jobs), args.processos or os.cpu_count() or 1))
+    logger.info(f"Gerando {len(jobs)} relatório(s) sem interface, com {max_workers} processo(s).")
+    started_at = time.perf_counter()
+    results: List[Tuple[str, Optional[str], Optional[BaseException]]] = []
+    # 'spawn' como nos relatórios grandes da GUI: mesmo comportamento no Windows e no Linux
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+        futures = {executor.submit(_generate_report, job): job['label'] for job in jobs}
+        for future in as_completed(futures):
+            label = futures[future]
+            try:
+                results.append((label, future.result(), None))
+            except Exception as e:
+                logger.error(f"Falha ao gerar o relatório '{label}': {e}", exc_info=e)
+                results.append((label, None, e))
+
+    from utils import ReportCache
+    ReportCache.evict(keep=[Path(report_path) for _, report_path, _ in results if report_path])
+
+    failures = 0
+    for label, report_path, error in sorted(results, key=lambda result: result[0]):
+        if error is not None:
+            failures += 1
+            print(f"ERRO   {label}: {error}")
+        elif report_path is None:
+            print(f"VAZIO  {label}: nenhuma tarefa")
+        elif not Path(report_path).exists():
+            # Ex.: removido por uma limpeza do cache feita por outro processo (a GUI) durante a execução
+            failures += 1
+            print(f"ERRO   {label}: o arquivo {report_path} não existe mais")
+        else:
+            print(f"OK     {label}: {report_path}")
+    print(f"{len(results) - failures} de {len(results)} relatório(s) gerado(s) em {time.perf_counter() - started_at:.1f}s.")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(run())
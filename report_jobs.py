@@ -0,0 +1,192 @@
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from config import logger
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+JOB_STATUS_LABELS = {
+    JOB_QUEUED: "Na fila",
+    JOB_RUNNING: "Em andamento",
+    JOB_DONE: "Concluído",
+    JOB_FAILED: "Falhou",
+    JOB_CANCELLED: "Cancelado",
+}
+
+
+class ReportCancelledError(Exception):
+    """Levantada por um gerador de relatório/exportação quando o job é cancelado."""
+
+
+class ReportJob:
+    """Um relatório ou exportação na fila: estado, progresso e sinal de cancelamento."""
+    PROGRESS_NOTIFY_INTERVAL_S = 0.2 # Evita inundar a GUI com atualizações de progresso
+
+    def __init__(self, job_id: int, key: Hashable, label: str, manager: 'ReportJobManager'):
+        self.job_id = job_id
+        self.key = key
+        self.label = label
+        self.status = JOB_QUEUED
+        self.total_rows: Optional[int] = None
+        self.rows_done = 0
+        self.pages_done = 0
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.cancel_event = threading.Event()
+        self._manager = manager
+        self._last_notify = 0.0
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in (JOB_QUEUED, JOB_RUNNING)
+
+    @property
+    def status_label(self) -> str:
+        return JOB_STATUS_LABELS[self.status]
+
+    def describe_progress(self) -> str:
+        if self.status == JOB_QUEUED:
+            return ""
+        parts = []
+        if self.total_rows:
+            parts.append(f"{self.rows_done}/{self.total_rows} linhas")
+        elif self.rows_done:
+            parts.append(f"{self.rows_done} linhas")
+        if self.pages_done:
+            parts.append(f"{self.pages_done} páginas")
+        return ", ".join(parts)
+
+    def report_progress(self, rows_done: Optional[int] = None, pages_done: Optional[int] = None,
+                        total_rows: Optional[int] = None):
+        """Atualiza o progresso (chamado pelo gerador) e verifica o cancelamento."""
+        if rows_done is not None:
+            self.rows_done = rows_done
+        if pages_done is not None:
+            self.pages_done = pages_done
+        if total_rows is not None:
+            self.total_rows = total_rows
+        self.raise_if_cancelled()
+        now = time.monotonic()
+        if now - self._last_notify >= self.PROGRESS_NOTIFY_INTERVAL_S:
+            self._last_notify = now
+            self._manager._notify(self)
+
+    def raise_if_cancelled(self):
+        if self.cancel_event.is_set():
+            raise ReportCancelledError(f"Relatório '{self.label}' cancelado.")
+
+
+class ReportJobManager:
+    """Fila de relatórios/exportações executados por um pool limitado de threads.
+
+    Pedidos iguais (mesma chave) enquanto um job equivalente está na fila ou em andamento
+    são unificados: `submit` devolve o job existente. Ouvintes e `on_finished` são chamados
+    na thread do job; a GUI deve repassá-los para a thread do Tk.
+    """
+    MAX_WORKERS = 2
+    MAX_FINISHED_JOBS = 20 # Histórico mantido para a janela da fila
+
+    def __init__(self, max_workers: int = MAX_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ReportJob")
+        self._jobs: Dict[int, ReportJob] = {}
+        self._active_by_key: Dict[Hashable, ReportJob] = {}
+        self._listeners: List[Callable[[ReportJob], None]] = []
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    # --- Assinaturas ---
+    def subscribe(self, listener: Callable[[ReportJob], None]) -> Callable[[], None]:
+        """Registra `listener(job)`, chamado a cada mudança de estado/progresso. Retorna a função para cancelar."""
+        self._listeners.append(listener)
+        def unsubscribe():
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+        return unsubscribe
+
+    def _notify(self, job: ReportJob):
+        for listener in list(self._listeners):
+            try:
+                listener(job)
+            except Exception as e:
+                logger.error(f"Erro em ouvinte da fila de relatórios: {e}", exc_info=True)
+
+    # --- Consultas ---
+    def jobs(self) -> List[ReportJob]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    @property
+    def active_count(self) -> int:
+        with self._lock:
+            return len(self._active_by_key)
+
+    # --- Operações ---
+    def submit(self, key: Hashable, label: str, work: Callable[[ReportJob], Any],
+               on_finished: Optional[Callable[[ReportJob], None]] = None) -> Tuple[ReportJob, bool]:
+        """Enfileira `work(job)`. Retorna (job, criado); `criado` é False se um job igual já estava pendente."""
+        with self._lock:
+            existing_job = self._active_by_key.get(key)
+            if existing_job is not None:
+                return existing_job, False
+            job = ReportJob(next(self._ids), key, label, self)
+            self._jobs[job.job_id] = job
+            self._active_by_key[key] = job
+            self._trim_history()
+            self._executor.submit(self._run, job, work, on_finished)
+        logger.info(f"Relatório enfileirado: #{job.job_id} {label}")
+        self._notify(job)
+        return job, True
+
+    def _run(self, job: ReportJob, work: Callable[[ReportJob], Any],
+             on_finished: Optional[Callable[[ReportJob], None]]):
+        try:
+            job.raise_if_cancelled()
+            job.status = JOB_RUNNING
+            self._notify(job)
+            job.result = work(job)
+            job.status = JOB_DONE
+        except ReportCancelledError:
+            job.status = JOB_CANCELLED
+            logger.info(f"Relatório #{job.job_id} cancelado: {job.label}")
+        except Exception as e:
+            job.status, job.error = JOB_FAILED, e
+            logger.error(f"Relatório #{job.job_id} falhou ({job.label}): {e}", exc_info=True)
+        finally:
+            with self._lock:
+                if self._active_by_key.get(job.key) is job:
+                    del self._active_by_key[job.key]
+        self._notify(job)
+        if on_finished:
+            try:
+                on_finished(job)
+            except Exception as e:
+                logger.error(f"Erro no retorno do relatório #{job.job_id}: {e}", exc_info=True)
+
+    def cancel(self, job_id: int) -> bool:
+        """Cancela um job na fila ou em andamento. Retorna False se ele já tinha terminado."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or not job.is_active:
+                return False
+            job.cancel_event.set()
+        # Job ainda na fila: _run vê o sinal logo ao começar e termina como cancelado, sem executar o trabalho
+        return True
+
+    def _trim_history(self):
+        finished_ids = [job_id for job_id, job in self._jobs.items() if not job.is_active]
+        for job_id in finished_ids[:max(0, len(finished_ids) - self.MAX_FINISHED_JOBS)]:
+            del self._jobs[job_id]
+
+    def shutdown(self):
+        """Cancela os jobs pendentes e aguarda o término dos que estão em andamento."""
+        for job in self.jobs():
+            if job.is_active:
+                job.cancel_event.set()
+        self._executor.shutdown(wait=True)
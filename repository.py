@@ -0,0 +1,280 @@
+import threading
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from config import Config, logger
+from models import Task
+from api_client import task_backend
+
+# Eventos emitidos pelo repositório para os assinantes (views)
+EVENT_RESET = "reset"         # Conjunto de tarefas substituído por completo
+EVENT_ADDED = "added"
+EVENT_UPDATED = "updated"
+EVENT_REMOVED = "removed"
+EVENT_COMPLETED = "completed"
+EVENT_REOPENED = "reopened"
+
+RepositoryListener = Callable[[str, List[Task]], None]
+
+
+class TaskRepository:
+    """Mantém as tarefas da GUI em memória, indexadas por ID e particionadas por status.
+
+    Seleção, remoção e mudanças de estado são O(1). As views assinam as
+    mudanças com `subscribe` em vez de percorrer a lista inteira.
+    """
+
+    def __init__(self, tasks: Iterable[Task] = ()):
+        self._tasks: Dict[str, Task] = {}
+        # Dicionários usados como "conjuntos ordenados" para remoção O(1)
+        self._pending: Dict[str, Task] = {}
+        self._completed: Dict[str, Task] = {}
+        self._listeners: List[RepositoryListener] = []
+        self._index(tasks)
+
+    @classmethod
+    def from_dicts(cls, tasks_data: Iterable[Dict]) -> 'TaskRepository':
+        return cls(Task.from_dict(task_dict) for task_dict in tasks_data)
+
+    # --- Assinaturas ---
+    def subscribe(self, listener: RepositoryListener) -> Callable[[], None]:
+        """Registra um ouvinte `listener(evento, tarefas)`. Retorna a função para cancelar a assinatura."""
+        self._listeners.append(listener)
+        def unsubscribe():
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+        return unsubscribe
+
+    def _notify(self, event: str, tasks: List[Task]):
+        for listener in list(self._listeners):
+            try:
+                listener(event, tasks)
+            except Exception as e:
+                logger.error(f"Erro em ouvinte do repositório de tarefas (evento '{event}'): {e}", exc_info=True)
+
+    # --- Consultas ---
+    def get(self, task_id: str) -> Optional[Task]:
+        return self._tasks.get(task_id)
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._tasks
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __iter__(self) -> Iterator[Task]:
+        return iter(list(self._tasks.values()))
+
+    def pending(self) -> List[Task]:
+        return list(self._pending.values())
+
+    def completed(self) -> List[Task]:
+        return list(self._completed.values())
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    @property
+    def completed_count(self) -> int:
+        return len(self._completed)
+
+    def to_dicts(self) -> List[Dict]:
+        return [task.to_dict() for task in self._tasks.values()]
+
+    def highest_numeric_id(self) -> int:
+        """Maior ID numérico em memória (0 se não houver), incluindo tarefas ainda não gravadas."""
+        return max((int(task_id) for task_id in self._tasks if task_id.isdigit()), default=0)
+
+    # --- Mutações ---
+    def _index(self, tasks: Iterable[Task]):
+        self._tasks.clear()
+        self._pending.clear()
+        self._completed.clear()
+        for task in tasks:
+            if task.task_id in self._tasks:
+                logger.warning(f"Tarefa com ID duplicado '{task.task_id}' ignorada ao indexar o repositório.")
+                continue
+            self._tasks[task.task_id] = task
+            self._partition_for(task)[task.task_id] = task
+
+    def _partition_for(self, task: Task) -> Dict[str, Task]:
+        return self._completed if task.is_completed else self._pending
+
+    def reset(self, tasks: Iterable[Task]):
+        self._index(tasks)
+        self._notify(EVENT_RESET, list(self._tasks.values()))
+
+    def _existing(self, task_ids: Iterable[str]) -> List[Task]:
+        """Tarefas dos IDs, sem repetições; KeyError antes de qualquer alteração se algum não existir."""
+        task_ids = list(dict.fromkeys(task_ids))
+        missing = [task_id for task_id in task_ids if task_id not in self._tasks]
+        if missing:
+            raise KeyError(f"Tarefa(s) não encontrada(s): {', '.join(missing)}.")
+        return [self._tasks[task_id] for task_id in task_ids]
+
+    # As operações em lote aplicam tudo e emitem um único evento com todas as tarefas afetadas.
+    # As versões unitárias delegam para elas.
+    def add(self, task: Task) -> Task:
+        return self.add_many([task])[0]
+
+    def add_many(self, tasks: Iterable[Task]) -> List[Task]:
+        """Adiciona as tarefas; se algum ID já existir (ou se repetir), nenhuma é adicionada."""
+        tasks = list(tasks)
+        new_ids = set()
+        for task in tasks:
+            if task.task_id in self._tasks or task.task_id in new_ids:
+                raise KeyError(f"Já existe uma tarefa com o ID '{task.task_id}'.")
+            new_ids.add(task.task_id)
+        for task in tasks:
+            self._tasks[task.task_id] = task
+            self._partition_for(task)[task.task_id] = task
+        if tasks:
+            self._notify(EVENT_ADDED, tasks)
+        return tasks
+
+    def update(self, task_id: str, **fields) -> Task:
+        """Altera campos editáveis (descrição, prioridade, categoria...) de uma tarefa."""
+        return self.update_many([task_id], **fields)[0]
+
+    def update_many(self, task_ids: Iterable[str], **fields) -> List[Task]:
+        tasks = self._existing(task_ids)
+        for field_name in fields:
+            if field_name in ('task_id', 'is_completed') or any(not hasattr(task, field_name) for task in tasks):
+                raise AttributeError(f"Campo '{field_name}' não pode ser alterado via update().")
+        for task in tasks:
+            for field_name, value in fields.items():
+                setattr(task, field_name, value)
+        if tasks:
+            self._notify(EVENT_UPDATED, tasks)
+        return tasks
+
+    def put_many(self, tasks: Iterable[Task]) -> List[Task]:
+        """Insere ou substitui as tarefas pelo ID (ex.: alterações vindas da sincronização), num único evento."""
+        tasks = list(tasks)
+        for task in tasks:
+            previous = self._tasks.get(task.task_id)
+            if previous is not None:
+                self._partition_for(previous).pop(task.task_id, None)
+            self._tasks[task.task_id] = task
+            self._partition_for(task)[task.task_id] = task
+        if tasks:
+            self._notify(EVENT_UPDATED, tasks)
+        return tasks
+
+    def remove(self, task_id: str) -> Task:
+        return self.remove_many([task_id])[0]
+
+    def remove_many(self, task_ids: Iterable[str]) -> List[Task]:
+        removed = self._existing(task_ids) # Validado antes: um ID inexistente não deixa a remoção pela metade, sem evento
+        for task in removed:
+            del self._tasks[task.task_id]
+            self._partition_for(task).pop(task.task_id, None)
+        if removed:
+            self._notify(EVENT_REMOVED, removed)
+        return removed
+
+    def complete(self, task_id: str, completed_by: str) -> Task:
+        self.complete_many([task_id], completed_by)
+        return self._tasks[task_id]
+
+    def complete_many(self, task_ids: Iterable[str], completed_by: str) -> List[Task]:
+        """Conclui as tarefas pendentes indicadas. Retorna apenas as que mudaram de estado."""
+        completed_at = datetime.now().isoformat()
+        changed = []
+        for task in self._existing(task_ids):
+            if task.is_completed:
+                continue
+            task_id = task.task_id
+            self._pending.pop(task_id, None)
+            task.is_completed = True
+            task.completed_at = completed_at
+            task.completed_by = completed_by
+            self._completed[task_id] = task
+            changed.append(task)
+        if changed:
+            self._notify(EVENT_COMPLETED, changed)
+        return changed
+
+    def reopen(self, task_id: str) -> Task:
+        self.reopen_many([task_id])
+        return self._tasks[task_id]
+
+    def reopen_many(self, task_ids: Iterable[str]) -> List[Task]:
+        """Reabre as tarefas concluídas indicadas. Retorna apenas as que mudaram de estado."""
+        changed = []
+        for task in self._existing(task_ids):
+            if not task.is_completed:
+                continue
+            task_id = task.task_id
+            self._completed.pop(task_id, None)
+            task.is_completed = False
+            task.completed_at = None
+            task.completed_by = None
+            self._pending[task_id] = task
+            changed.append(task)
+        if changed:
+            self._notify(EVENT_REOPENED, changed)
+        return changed
+
+
+class TaskPrefetcher:
+    """Lê, interpreta e indexa o arquivo de tarefas em segundo plano enquanto o usuário faz login.
+
+    Após a autenticação, `take()` entrega o repositório já montado. Se o arquivo mudou
+    desde a leitura, ou se o login foi abandonado (`discard()`), o resultado é descartado.
+    """
+
+    def __init__(self):
+        self._thread: Optional[threading.Thread] = None
+        self._discarded = threading.Event()
+        self._repository: Optional[TaskRepository] = None
+        self._file_signature: Optional[Tuple[int, int]] = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="TaskPrefetcher", daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def _current_file_signature() -> Optional[Tuple[int, int]]:
+        try:
+            stat_result = Config.TASKS_FILE.stat()
+            return (stat_result.st_mtime_ns, stat_result.st_size)
+        except OSError:
+            return None
+
+    def _run(self):
+        try:
+            # A assinatura é lida antes do conteúdo: se o arquivo mudar durante a leitura, ela não confere em take()
+            signature = self._current_file_signature()
+            tasks_data = task_backend().load_tasks()
+            if self._discarded.is_set():
+                return
+            repository = TaskRepository.from_dicts(tasks_data)
+            if self._discarded.is_set():
+                return
+            self._repository, self._file_signature = repository, signature
+            logger.info(f"Pré-carregamento de tarefas concluído: {len(repository)} tarefas indexadas.")
+        except Exception as e:
+            logger.warning(f"Falha no pré-carregamento de tarefas; elas serão carregadas após o login: {e}", exc_info=True)
+
+    def take(self) -> Optional[TaskRepository]:
+        """Aguarda o pré-carregamento e entrega o repositório, ou None se não puder ser aproveitado."""
+        if self._thread is None or self._discarded.is_set():
+            return None
+        self._thread.join()
+        repository, self._repository = self._repository, None
+        self._discarded.set() # O resultado só pode ser adotado uma vez
+        if repository is None:
+            return None
+        if self._file_signature != self._current_file_signature():
+            logger.info("Arquivo de tarefas alterado durante o login; pré-carregamento descartado.")
+            return None
+        return repository
+
+    def discard(self):
+        """Descarta o resultado (ex.: login abandonado). A thread, se ainda ativa, termina sem publicar nada."""
+        self._discarded.set()
+        self._repository = None
@@ -1,11 +1,33 @@
+import asyncio
 import json
 import os
 import hashlib
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 import shutil 
 
 from config import Config, logger 
+from metrics import Metrics
+
+# Executor de uma única thread para as gravações assíncronas: mantém a ordem em que foram
+# pedidas (uma gravação nunca sobrescreve outra mais recente) sem precisar de locks.
+_write_executor: ThreadPoolExecutor | None = None
+
+def _get_write_executor() -> ThreadPoolExecutor:
+    global _write_executor
+    if _write_executor is None:
+        _write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="AgendaIOWriter")
+    return _write_executor
+
+async def _run_write(func, *args):
+    return await asyncio.get_running_loop().run_in_executor(_get_write_executor(), func, *args)
+
+# Os lotes do TaskService (carregar, alterar e gravar) podem rodar em qualquer thread: este lock
+# impede que uma gravação do executor caia no meio de um ciclo e seja perdida.
+_tasks_file_lock = threading.RLock()
 
 class UserService: # Sem alterações na UserService
     @staticmethod
@@ -68,6 +90,15 @@ class UserService: # Sem alterações na UserService
             logger.error(f"Erro ao salvar usuários em {Config.USERS_FILE}: {e}", exc_info=True)
             raise 
 
+    # --- Variantes assíncronas (executam a E/S fora do loop asyncio) ---
+    @staticmethod
+    async def load_users_async() -> Dict[str, Dict]:
+        return await asyncio.to_thread(UserService.load_users)
+
+    @staticmethod
+    async def save_users_async(users: Dict[str, Dict]):
+        await _run_write(UserService.save_users, users)
+
 class TaskService:
     @staticmethod
     def load_tasks() -> List[Dict]:
@@ -141,8 +172,76 @@ class TaskService:
             logger.error(f"Erro ao salvar usuários: {e}")
 
 
+class TaskBatchResult:
+    """Resultado de uma alteração em lote do TaskService.
+
+    `results` tem um item por entrada, na ordem recebida: {'task_id', 'ok', 'error'}. O lote é
+    atômico: se algum item falhou, `committed` é False e nada foi gravado.
+    """
+
+    def __init__(self, results: List[Dict], committed: bool):
+        self.results = results
+        self.committed = committed
+
+    @property
+    def failures(self) -> List[Dict]:
+        return [result for result in self.results if not result['ok']]
+
+    def raise_for_failures(self) -> List[str]:
+        """Levanta ValueError com o primeiro erro, se houver; senão retorna os task_ids, na ordem."""
+        failures = self.failures
+        if failures:
+            extra = f" (e mais {len(failures) - 1} erro(s))" if len(failures) > 1 else ""
+            raise ValueError(failures[0]['error'] + extra)
+        return [result['task_id'] for result in self.results]
+
+
 class TaskService:
+    # Regras dos campos editáveis, compartilhadas pelos diálogos da GUI e pela importação em lote
+    MAX_DESCRIPTION_LENGTH = 500
+    MAX_CATEGORY_LENGTH = 50
+    PRIORITIES = (1, 2, 3)
+    UPDATABLE_FIELDS = ('description', 'category', 'priority', 'user', 'due_at', 'remind_at')
+    DATETIME_INPUT_FORMATS = ("%d/%m/%Y %H:%M", "%d/%m/%Y") # Como o usuário digita nos diálogos
+
+    @staticmethod
+    def validate_task_fields(description: str, category: str, priority: int,
+                             due_at: Optional[str] = None, remind_at: Optional[str] = None) -> Optional[str]:
+        """Retorna a mensagem de erro dos campos informados, ou None se são válidos."""
+        if not description:
+            return "A descrição da tarefa é obrigatória."
+        if len(description) > TaskService.MAX_DESCRIPTION_LENGTH:
+            return f"A descrição não pode exceder {TaskService.MAX_DESCRIPTION_LENGTH} caracteres."
+        if len(category) > TaskService.MAX_CATEGORY_LENGTH:
+            return f"A categoria não pode exceder {TaskService.MAX_CATEGORY_LENGTH} caracteres."
+        if priority not in TaskService.PRIORITIES:
+            return f"Prioridade inválida: {priority} (use 1, 2 ou 3)."
+        for field_label, value in (("vencimento", due_at), ("lembrete", remind_at)):
+            if value is None:
+                continue
+            try:
+                parsed = datetime.fromisoformat(str(value))
+            except ValueError:
+                return f"Data de {field_label} inválida: '{value}'."
+            if parsed.tzinfo is not None: # As datas das tarefas são sempre na hora local, sem fuso
+                return f"Data de {field_label} com fuso horário: '{value}' (informe a hora local, sem fuso)."
+        return None
+
     @staticmethod
+    def parse_datetime_input(text: str) -> Optional[str]:
+        """Converte a data digitada (DD/MM/AAAA HH:MM ou DD/MM/AAAA) em ISO; None se vazia. Levanta ValueError."""
+        text = text.strip()
+        if not text:
+            return None
+        for date_format in TaskService.DATETIME_INPUT_FORMATS:
+            try:
+                return datetime.strptime(text, date_format).isoformat()
+            except ValueError:
+                continue
+        raise ValueError(f"Data inválida: '{text}' (use DD/MM/AAAA HH:MM).")
+
+    @staticmethod
+    @Metrics.timed("tarefas.carregar")
     def load_tasks() -> List[Dict]:
         if not Config.TASKS_FILE.exists():
             logger.info(f"Arquivo de tarefas não encontrado em {Config.TASKS_FILE}. Criando vazio.")
@@ -157,42 +256,169 @@ class TaskService:
             return []
 
     @staticmethod
+    @Metrics.timed("tarefas.salvar")
     def save_tasks(tasks: List[Dict]) -> None:
-        try:
-            with open(Config.TASKS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(tasks, f, indent=4, ensure_ascii=False)
-            logger.info(f"{len(tasks)} tarefas salvas em {Config.TASKS_FILE}.")
-        except Exception as e:
-            logger.error(f"Erro ao salvar tarefas: {e}")
+        """Grava num arquivo temporário e o troca pelo tasks.json: uma falha no meio nunca deixa o arquivo pela metade."""
+        temp_file = Config.TASKS_FILE.with_name(Config.TASKS_FILE.name + ".tmp")
+        with _tasks_file_lock:
+            try:
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(tasks, f, indent=4, ensure_ascii=False)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_file, Config.TASKS_FILE)
+            except Exception as e:
+                logger.error(f"Erro ao salvar tarefas: {e}")
+                temp_file.unlink(missing_ok=True)
+                raise
+        logger.info(f"{len(tasks)} tarefas salvas em {Config.TASKS_FILE}.")
 
+    # --- Variantes assíncronas (executam a E/S fora do loop asyncio) ---
     @staticmethod
-    def add_task(task_data: Dict) -> None:
-        tasks = TaskService.load_tasks()
-        tasks.append(task_data)
-        TaskService.save_tasks(tasks)
+    async def load_tasks_async() -> List[Dict]:
+        # Na mesma fila das gravações: a leitura só acontece depois das gravações pedidas antes dela
+        return await _run_write(TaskService.load_tasks)
+
+    @staticmethod
+    async def save_tasks_async(tasks: List[Dict]) -> None:
+        await _run_write(TaskService.save_tasks, tasks)
+
+    # --- Alterações em lote: um único ciclo carregar-gravar por chamada, atômico como um todo ---
+    @staticmethod
+    def _load_tasks_for_update() -> List[Dict]:
+        """Como load_tasks, mas levanta o erro de leitura: um lote não pode gravar por cima de um arquivo corrompido."""
+        if not Config.TASKS_FILE.exists():
+            return []
+        with open(Config.TASKS_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    @staticmethod
+    def _apply_batch(operation: str, items: Iterable,
+                     apply_item: Callable[[List[Optional[Dict]], Dict[str, int], object], Tuple[Optional[str], Optional[str]]]) -> "TaskBatchResult":
+        """Aplica `apply_item` a cada item sobre uma única carga das tarefas e grava só se todos deram certo.
+
+        `apply_item(tasks, index, item)` altera `tasks` (posições removidas viram None) e `index`
+        (task_id -> posição) e retorna (task_id, mensagem de erro ou None).
+        """
+        with Metrics.timer(f"tarefas.lote.{operation}"), _tasks_file_lock:
+            tasks: List[Optional[Dict]] = TaskService._load_tasks_for_update()
+            index = {str(task.get('task_id')): position for position, task in enumerate(tasks)}
+            results = []
+            for item in items:
+                task_id, error = apply_item(tasks, index, item)
+                results.append({'task_id': task_id, 'ok': error is None, 'error': error})
+            failed_count = sum(1 for result in results if not result['ok'])
+            if failed_count:
+                logger.warning(f"Lote '{operation}' descartado: {failed_count} de {len(results)} item(ns) com erro.")
+                return TaskBatchResult(results, committed=False)
+            if results:
+                TaskService.save_tasks([task for task in tasks if task is not None])
+                logger.info(f"Lote '{operation}' gravado: {len(results)} tarefa(s).")
+            return TaskBatchResult(results, committed=True)
+
+    @staticmethod
+    def add_tasks(tasks_data: Iterable[Dict]) -> "TaskBatchResult":
+        """Adiciona várias tarefas; as que vierem sem task_id recebem IDs numéricos novos."""
+        now_iso = datetime.now().isoformat()
+        next_id: List[int] = []
+
+        def add_one(tasks: List[Optional[Dict]], index: Dict[str, int], task_data: Dict):
+            task_dict = {'is_completed': False, 'created_at': now_iso, 'completed_at': None, 'completed_by': None,
+                         'priority': 1, 'category': "", **task_data}
+            if not task_dict.get('task_id'):
+                if not next_id:
+                    next_id.append(max((int(task_id) for task_id in index if task_id.isdigit()), default=0) + 1)
+                while str(next_id[0]) in index:
+                    next_id[0] += 1
+                task_dict['task_id'] = str(next_id[0])
+            task_id = task_dict['task_id'] = str(task_dict['task_id'])
+            if task_id in index:
+                return task_id, f"Já existe uma tarefa com o ID {task_id}."
+            if not task_dict.get('user'):
+                return task_id, "O usuário da tarefa é obrigatório."
+            error = TaskService.validate_task_fields(str(task_dict.get('description') or ""),
+                                                     str(task_dict.get('category') or ""), task_dict.get('priority'),
+                                                     task_dict.get('due_at'), task_dict.get('remind_at'))
+            if error:
+                return task_id, error
+            index[task_id] = len(tasks)
+            tasks.append(task_dict)
+            return task_id, None
+        return TaskService._apply_batch("adicionar", tasks_data, add_one)
+
+    @staticmethod
+    def remove_tasks(task_ids: Iterable[str]) -> "TaskBatchResult":
+        def remove_one(tasks: List[Optional[Dict]], index: Dict[str, int], task_id):
+            task_id = str(task_id)
+            position = index.pop(task_id, None)
+            if position is None:
+                return task_id, f"Tarefa {task_id} não encontrada."
+            tasks[position] = None
+            return task_id, None
+        return TaskService._apply_batch("remover", task_ids, remove_one)
+
+    @staticmethod
+    def complete_tasks(task_ids: Iterable[str], completed_by: str) -> "TaskBatchResult":
+        """Conclui as tarefas informadas; as que já estavam concluídas ficam como estão."""
+        now_iso = datetime.now().isoformat()
+
+        def complete_one(tasks: List[Optional[Dict]], index: Dict[str, int], task_id):
+            task_id = str(task_id)
+            position = index.get(task_id)
+            if position is None:
+                return task_id, f"Tarefa {task_id} não encontrada."
+            task = tasks[position]
+            if not task.get('is_completed'):
+                task['is_completed'] = True
+                task['completed_at'] = now_iso
+                task['completed_by'] = completed_by
+            return task_id, None
+        return TaskService._apply_batch("concluir", task_ids, complete_one)
+
+    @staticmethod
+    def update_tasks(updates: Iterable[Dict]) -> "TaskBatchResult":
+        """Altera campos de várias tarefas; cada item traz o task_id e os campos novos (UPDATABLE_FIELDS)."""
+        def update_one(tasks: List[Optional[Dict]], index: Dict[str, int], update: Dict):
+            task_id = str(update.get('task_id') or "")
+            position = index.get(task_id)
+            if position is None:
+                return task_id or None, f"Tarefa {task_id or '(sem ID)'} não encontrada."
+            fields = {name: value for name, value in update.items() if name != 'task_id'}
+            unknown_fields = sorted(set(fields) - set(TaskService.UPDATABLE_FIELDS))
+            if unknown_fields:
+                return task_id, f"Campo(s) que não podem ser alterados: {', '.join(unknown_fields)}."
+            updated_task = {**tasks[position], **fields}
+            if not updated_task.get('user'):
+                return task_id, "O usuário da tarefa é obrigatório."
+            error = TaskService.validate_task_fields(str(updated_task.get('description') or ""),
+                                                     str(updated_task.get('category') or ""), updated_task.get('priority'),
+                                                     updated_task.get('due_at'), updated_task.get('remind_at'))
+            if error:
+                return task_id, error
+            tasks[position] = updated_task
+            return task_id, None
+        return TaskService._apply_batch("alterar", updates, update_one)
+
+    # --- Uma tarefa por vez: atalhos para os lotes de um item (levantam ValueError se o item falhou) ---
+    @staticmethod
+    def add_task(task_data: Dict) -> str:
+        task_id = TaskService.add_tasks([task_data]).raise_for_failures()[0]
         logger.info(f"Tarefa adicionada: {task_data.get('description', '')}")
+        return task_id
 
     @staticmethod
     def remove_task(task_id: str) -> None:
-        tasks = TaskService.load_tasks()
-        tasks = [task for task in tasks if task.get('task_id') != task_id]
-        TaskService.save_tasks(tasks)
+        TaskService.remove_tasks([task_id]).raise_for_failures()
         logger.info(f"Tarefa removida: {task_id}")
 
     @staticmethod
     def complete_task(task_id: str, completed_by: str) -> None:
-        tasks = TaskService.load_tasks()
-        for task in tasks:
-            if task.get('task_id') == task_id:
-                task['is_completed'] = True
-                task['completed_at'] = datetime.now().isoformat()
-                task['completed_by'] = completed_by
-                break
-        TaskService.save_tasks(tasks)
+        TaskService.complete_tasks([task_id], completed_by).raise_for_failures()
         logger.info(f"Tarefa marcada como concluída: {task_id} por {completed_by}")
 
 
     @staticmethod
+    @Metrics.timed("tarefas.proximo_id")
     def get_next_task_id() -> str:
         tasks = TaskService.load_tasks()
         if not tasks:
@@ -203,3 +429,13 @@ class TaskService:
         except Exception as e:
             logger.warning(f"Falha ao gerar próximo task_id: {e}")
             return str(uuid.uuid4())  # fallback seguro
+
+    @staticmethod
+    def reserve_task_ids(count: int) -> int:
+        """Primeiro ID de um bloco de `count` IDs numéricos consecutivos, com uma única leitura do arquivo.
+
+        Com os arquivos locais o bloco é o que vem depois do maior ID gravado; no servidor
+        (api_server.py) ele fica reservado e não é entregue a outro cliente.
+        """
+        tasks = TaskService.load_tasks()
+        return max((int(task['task_id']) for task in tasks if str(task.get('task_id', "")).isdigit()), default=0) + 1
@@ -0,0 +1,67 @@
+import time
+from contextlib import contextmanager
+
+# Este módulo não importa `config` no topo de propósito: ele é importado antes de
+# tudo para medir o tempo de importação dos demais módulos.
+
+# Orçamento de inicialização (em milissegundos) usado no relatório do log
+LOGIN_WINDOW_BUDGET_MS = 1000
+MAIN_WINDOW_BUDGET_MS = 1500
+
+
+class StartupTimer:
+    """Mede o tempo de inicialização: importações, janela de login e janela principal."""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.imports: list[tuple[str, float]] = []   # (módulo, ms)
+        self.marks: dict[str, float] = {}            # etapa -> ms desde o início
+        self._reported: set[str] = set()
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started_at) * 1000
+
+    @contextmanager
+    def measure_import(self, module_name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.imports.append((module_name, (time.perf_counter() - start) * 1000))
+
+    def mark(self, step: str):
+        """Registra o instante de uma etapa (apenas a primeira ocorrência conta)."""
+        self.marks.setdefault(step, self.elapsed_ms())
+
+    def report(self, stage: str):
+        """Escreve no log o relatório de inicialização até a etapa `stage` ('login' ou 'principal')."""
+        if stage in self._reported:
+            return
+        self._reported.add(stage)
+        from config import logger
+
+        if stage == 'login':
+            for module_name, ms in self.imports:
+                logger.info(f"[Inicialização] Importação de '{module_name}': {ms:.1f} ms")
+            login_ms = self.marks.get('janela_login')
+            if login_ms is not None:
+                self._log_against_budget("Tempo até a janela de login", login_ms, LOGIN_WINDOW_BUDGET_MS)
+        elif stage == 'principal':
+            for module_name, ms in self.imports:
+                if module_name.startswith('gui.main_window'):
+                    logger.info(f"[Inicialização] Importação de '{module_name}': {ms:.1f} ms")
+            login_ok_ms = self.marks.get('login_confirmado')
+            main_ms = self.marks.get('janela_principal')
+            if login_ok_ms is not None and main_ms is not None:
+                self._log_against_budget("Tempo do login até a janela principal", main_ms - login_ok_ms, MAIN_WINDOW_BUDGET_MS)
+
+    @staticmethod
+    def _log_against_budget(label: str, ms: float, budget_ms: float):
+        from config import logger
+        if ms > budget_ms:
+            logger.warning(f"[Inicialização] {label}: {ms:.1f} ms (acima do orçamento de {budget_ms} ms)")
+        else:
+            logger.info(f"[Inicialização] {label}: {ms:.1f} ms (orçamento: {budget_ms} ms)")
+
+
+startup_timer = StartupTimer()
@@ -0,0 +1,477 @@
+"""Modo réplica: cada computador trabalha numa cópia local e troca só as tarefas alteradas com a pasta compartilhada.
+
+Com AGENDA_SHARED_DIR apontando para a pasta da rede, a GUI lê e grava apenas o tasks.json da
+pasta de dados local; o SyncEngine envia e busca as alterações em segundo plano. Na pasta
+compartilhada fica um registro de alterações (JSON Lines) por réplica, só acrescentado pela
+réplica dona; cada réplica guarda até onde já leu os registros das outras (marcas d'água).
+"""
+import json
+import os
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from config import Config, logger
+from metrics import Metrics
+from services import TaskService, _run_write
+
+SHARED_DIR_ENV_VAR = "AGENDA_SHARED_DIR"
+SYNC_INTERVAL_S = 30 # Intervalo entre sincronizações quando não há alterações locais
+PUSH_DELAY_S = 2 # Espera após uma gravação local antes do envio: agrupa alterações seguidas
+CHANGES_DIR_NAME = "alteracoes"
+LEGACY_TASKS_FILE_NAME = "tasks.json" # Arquivo único usado antes do modo réplica, importado uma vez
+TASK_FIELDS = ('task_id', 'description', 'user', 'is_completed', 'created_at',
+               'completed_at', 'completed_by', 'priority', 'category', 'due_at', 'remind_at')
+
+RemoteChangesListener = Callable[[List[Dict], List[str]], None] # (tarefas novas ou alteradas, IDs removidos)
+
+
+def _content(record: Optional[Dict]) -> Optional[Dict]:
+    """Campos da tarefa sem os metadados de sincronização: o que a GUI vê e edita."""
+    if record is None:
+        return None
+    return {field_name: record.get(field_name) for field_name in TASK_FIELDS}
+
+
+def _version_key(record: Dict) -> Tuple[int, str, str]:
+    return (int(record.get('version') or 0), str(record.get('updated_at') or ""),
+            json.dumps(record, sort_keys=True, ensure_ascii=False))
+
+
+def prevails(candidate: Dict, current: Dict) -> bool:
+    """True se `candidate` substitui `current` (registros do mesmo task_id).
+
+    É uma ordem total, então todas as réplicas escolhem o mesmo vencedor seja qual for a ordem
+    em que recebem as alterações:
+    1. created_at diferentes são tarefas diferentes que pegaram o mesmo ID: a criada antes fica
+       com ele (a outra é renumerada pela réplica que a criou);
+    2. maior `version`; 3. `updated_at` mais recente; 4. desempate pelo JSON do registro.
+    """
+    candidate_created, current_created = str(candidate.get('created_at') or ""), str(current.get('created_at') or "")
+    if candidate_created != current_created:
+        return candidate_created < current_created
+    return _version_key(candidate) > _version_key(current)
+
+
+def _write_json_atomic(file_path: Path, data) -> None:
+    temp_file = file_path.with_name(file_path.name + ".tmp")
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(temp_file, file_path)
+
+
+def _append_jsonl(file_path: Path, records: List[Dict]) -> None:
+    """Acrescenta os registros (um JSON por linha) com fsync; uma linha deixada pela metade fica isolada, não emendada."""
+    payload = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records).encode('utf-8')
+    with open(file_path, 'ab+') as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                payload = b"\n" + payload # Gravação anterior interrompida no meio da linha: ela é descartada pelos leitores
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+class SharedChangeLog:
+    """Registros de alterações na pasta compartilhada, um arquivo .jsonl por réplica.
+
+    Cada arquivo tem um único escritor, então não há disputa de gravação na rede; os leitores
+    só buscam os bytes depois da sua marca d'água.
+    """
+
+    def __init__(self, shared_dir: Path):
+        self.shared_dir = shared_dir
+        self.changes_dir = shared_dir / CHANGES_DIR_NAME
+
+    def append(self, replica_id: str, records: List[Dict]) -> None:
+        self.changes_dir.mkdir(parents=True, exist_ok=True)
+        _append_jsonl(self.changes_dir / f"{replica_id}.jsonl", records)
+
+    def read_since(self, watermarks: Dict[str, int], own_replica_id: str) -> Tuple[List[Dict], Dict[str, int]]:
+        """Alterações das outras réplicas depois das marcas d'água; retorna (registros, marcas novas)."""
+        records: List[Dict] = []
+        new_watermarks = dict(watermarks)
+        if not self.changes_dir.is_dir():
+            return records, new_watermarks
+        for log_path in sorted(self.changes_dir.glob("*.jsonl")):
+            if log_path.stem == own_replica_id:
+                continue
+            offset = watermarks.get(log_path.name, 0)
+            log_size = log_path.stat().st_size
+            if log_size < offset:
+                offset = 0 # Registro recriado: relê do início (reaplicar é inofensivo)
+            if log_size == offset:
+                continue
+            with open(log_path, 'rb') as f:
+                f.seek(offset)
+                chunk = f.read()
+            complete_length = chunk.rfind(b"\n") + 1 # Uma linha sem \n ainda está sendo gravada
+            for line in chunk[:complete_length].splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    logger.warning(f"Linha inválida ignorada em {log_path.name} (envio interrompido?).")
+                    continue
+                if isinstance(record, dict) and record.get('task_id') is not None:
+                    records.append(record)
+            new_watermarks[log_path.name] = offset + complete_length
+        return records, new_watermarks
+
+    def read_legacy_tasks(self) -> List[Dict]:
+        legacy_file = self.shared_dir / LEGACY_TASKS_FILE_NAME
+        if not legacy_file.exists():
+            return []
+        try:
+            with open(legacy_file, 'r', encoding='utf-8') as f:
+                tasks = json.load(f)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Arquivo antigo {legacy_file} ilegível; ele não será importado: {e}")
+            return []
+        return [task for task in tasks if isinstance(task, dict) and task.get('task_id') is not None]
+
+
+class ReplicaTaskService:
+    """Mesma interface de TaskService usada pela GUI, sobre a réplica local.
+
+    Leituras e gravações só tocam o disco local. `save_tasks` compara a lista recebida com a
+    réplica, carimba `version`/`updated_at` nas tarefas que mudaram (exclusões viram lápides)
+    e as põe na fila de saída, que o SyncEngine envia para a pasta compartilhada.
+    """
+
+    def __init__(self, shared_dir: Path, state_dir: Optional[Path] = None):
+        self.shared_log = SharedChangeLog(shared_dir)
+        self.state_dir = state_dir or Config.DATA_DIR / "sincronizacao"
+        self.state_file = self.state_dir / "estado.json"
+        self.outbox_file = self.state_dir / "pendentes.jsonl"
+        self.changes_pending = threading.Event() # Acorda o SyncEngine após uma gravação local
+        self.sync_engine = SyncEngine(self)
+        self._lock = threading.RLock()
+        self._records: Optional[Dict[str, Dict]] = None
+        self._state: Dict = {}
+        # Conteúdo que a GUI ainda mostra para tarefas alteradas por outras réplicas (None: a GUI
+        # não tem a tarefa), até ela confirmar com acknowledge(). Evita que um instantâneo tirado
+        # antes da mudança chegar à tela seja tomado por uma edição local e a desfaça.
+        self._superseded: Dict[str, Optional[Dict]] = {}
+        self._highest_reserved_id = 0
+        self._listeners: List[RemoteChangesListener] = []
+
+    # --- Estado local ---
+    def _ensure_loaded(self):
+        if self._records is not None:
+            return
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        tasks = TaskService._load_tasks_for_update()
+        self._records = {str(task['task_id']): task for task in tasks if task.get('task_id') is not None}
+        if self.state_file.exists():
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                self._state = json.load(f)
+            return
+        # Primeira execução: as tarefas locais existentes são publicadas como criadas aqui
+        now_iso = datetime.now().isoformat()
+        self._state = {'replica_id': uuid.uuid4().hex, 'watermarks': {}, 'tombstones': {},
+                       'created_here': {}, 'legacy_imported': False}
+        for task_id, record in self._records.items():
+            record.setdefault('version', 1)
+            record.setdefault('updated_at', now_iso)
+            self._state['created_here'][task_id] = record.get('created_at')
+        self._append_outbox(list(self._records.values()))
+        self._persist(write_tasks=bool(self._records))
+        logger.info(f"Réplica local criada ({self.replica_id}) com {len(self._records)} tarefa(s) a publicar.")
+
+    @property
+    def replica_id(self) -> str:
+        with self._lock:
+            self._ensure_loaded()
+            return self._state['replica_id']
+
+    @property
+    def legacy_imported(self) -> bool:
+        with self._lock:
+            self._ensure_loaded()
+            return bool(self._state.get('legacy_imported'))
+
+    def watermarks(self) -> Dict[str, int]:
+        with self._lock:
+            self._ensure_loaded()
+            return dict(self._state['watermarks'])
+
+    def _persist(self, write_tasks: bool):
+        if write_tasks:
+            TaskService.save_tasks(list(self._records.values()))
+        _write_json_atomic(self.state_file, self._state)
+
+    def _append_outbox(self, records: List[Dict]):
+        if not records:
+            return
+        _append_jsonl(self.outbox_file, records)
+        self.changes_pending.set()
+
+    def _allocate_ids(self, count: int) -> int:
+        # Lápides contam: um ID excluído não é reaproveitado para outra tarefa
+        known_ids = list(self._records) + list(self._state['tombstones'])
+        highest_id = max((int(task_id) for task_id in known_ids if task_id.isdigit()), default=0)
+        first_id = max(highest_id, self._highest_reserved_id) + 1
+        self._highest_reserved_id = first_id + count - 1
+        return first_id
+
+    # --- Interface usada pela GUI (a mesma de TaskService) ---
+    def load_tasks(self) -> List[Dict]:
+        with self._lock:
+            self._ensure_loaded()
+            self._superseded.clear() # Quem carrega passa a ver o estado atual
+            tasks = [dict(record) for record in self._records.values()]
+        logger.info(f"Tarefas carregadas da réplica local: {len(tasks)} registros.")
+        return tasks
+
+    def save_tasks(self, tasks: List[Dict]) -> None:
+        with Metrics.timer("replica.gravar"), self._lock:
+            self._ensure_loaded()
+            now_iso = datetime.now().isoformat()
+            tombstones, created_here = self._state['tombstones'], self._state['created_here']
+            incoming = {str(task_dict['task_id']): task_dict for task_dict in tasks}
+            changed: List[Dict] = []
+            for task_id, task_dict in incoming.items():
+                content, stored = _content(task_dict), self._records.get(task_id)
+                if stored is not None and content == _content(stored):
+                    self._superseded.pop(task_id, None)
+                    continue
+                if task_id in self._superseded and content == self._superseded[task_id]:
+                    continue # A GUI ainda não aplicou a alteração que veio de outra réplica
+                previous = stored or tombstones.get(task_id)
+                record = {**content, 'version': int((previous or {}).get('version') or 0) + 1, 'updated_at': now_iso}
+                if previous is None:
+                    created_here[task_id] = record['created_at']
+                self._records[task_id] = record
+                tombstones.pop(task_id, None)
+                self._superseded.pop(task_id, None)
+                changed.append(record)
+            for task_id in [task_id for task_id in self._records if task_id not in incoming]:
+                if task_id in self._superseded and self._superseded[task_id] is None:
+                    continue # Chegou de outra réplica e ainda não está na GUI
+                stored = self._records.pop(task_id)
+                tombstone = {'task_id': task_id, 'created_at': stored.get('created_at'), 'deleted': True,
+                             'version': int(stored.get('version') or 0) + 1, 'updated_at': now_iso}
+                tombstones[task_id] = tombstone
+                self._superseded.pop(task_id, None)
+                changed.append(tombstone)
+            if not changed:
+                return
+            self._append_outbox(changed)
+            self._persist(write_tasks=True)
+        logger.info(f"{len(changed)} alteração(ões) gravada(s) na réplica local e enfileirada(s) para envio.")
+
+    async def load_tasks_async(self) -> List[Dict]:
+        return await _run_write(self.load_tasks)
+
+    async def save_tasks_async(self, tasks: List[Dict]) -> None:
+        await _run_write(self.save_tasks, tasks)
+
+    def get_next_task_id(self) -> str:
+        with self._lock:
+            self._ensure_loaded()
+            return str(self._allocate_ids(1))
+
+    def reserve_task_ids(self, count: int) -> int:
+        with self._lock:
+            self._ensure_loaded()
+            return self._allocate_ids(count)
+
+    # --- Alterações vindas das outras réplicas ---
+    def subscribe(self, listener: RemoteChangesListener):
+        """`listener(alteradas, ids_removidos)` é chamado na thread do SyncEngine; quem aplicar deve chamar acknowledge()."""
+        self._listeners.append(listener)
+
+    def notify(self, changed: List[Dict], removed_ids: List[str]):
+        for listener in list(self._listeners):
+            try:
+                listener(changed, removed_ids)
+            except Exception as e:
+                logger.error(f"Erro em ouvinte da sincronização: {e}", exc_info=True)
+
+    def acknowledge(self, task_ids: Iterable[str]):
+        """A GUI já mostra o estado atual destas tarefas."""
+        with self._lock:
+            for task_id in task_ids:
+                self._superseded.pop(task_id, None)
+
+    async def acknowledge_async(self, task_ids: List[str]) -> None:
+        # Na mesma fila das gravações: gravações pedidas antes da confirmação ainda são tratadas como antigas
+        await _run_write(self.acknowledge, task_ids)
+
+    def apply_remote(self, records: List[Dict], watermarks: Dict[str, int],
+                     legacy_imported: bool = False) -> Tuple[List[Dict], List[str]]:
+        """Mescla registros recebidos e avança as marcas d'água; retorna (tarefas alteradas, IDs removidos)."""
+        with self._lock:
+            self._ensure_loaded()
+            tombstones, created_here = self._state['tombstones'], self._state['created_here']
+            changed: Dict[str, Dict] = {}
+            removed = set()
+            for incoming in records:
+                task_id = incoming['task_id'] = str(incoming['task_id'])
+                stored = self._records.get(task_id)
+                current = stored or tombstones.get(task_id)
+                if current is not None and not prevails(incoming, current):
+                    continue
+                if (stored is not None and created_here.get(task_id) == stored.get('created_at')
+                        and stored.get('created_at') != incoming.get('created_at')):
+                    rekeyed = self._rekey(stored)
+                    changed[rekeyed['task_id']] = rekeyed
+                self._superseded.setdefault(task_id, _content(stored))
+                if created_here.get(task_id) != incoming.get('created_at'):
+                    created_here.pop(task_id, None) # O ID ficou com uma tarefa criada em outra réplica
+                if incoming.get('deleted'):
+                    self._records.pop(task_id, None)
+                    tombstones[task_id] = incoming
+                    changed.pop(task_id, None)
+                    if stored is not None:
+                        removed.add(task_id)
+                else:
+                    self._records[task_id] = {**_content(incoming), 'version': incoming.get('version'),
+                                              'updated_at': incoming.get('updated_at')}
+                    tombstones.pop(task_id, None)
+                    changed[task_id] = self._records[task_id]
+                    removed.discard(task_id)
+            self._state['watermarks'] = watermarks
+            if legacy_imported:
+                self._state['legacy_imported'] = True
+            self._persist(write_tasks=bool(changed or removed))
+            return [dict(record) for record in changed.values()], sorted(removed)
+
+    def _rekey(self, stored: Dict) -> Dict:
+        """Renumera uma tarefa criada aqui cujo ID ficou com uma tarefa criada antes em outra réplica."""
+        old_task_id = stored['task_id']
+        record = {**stored, 'task_id': str(self._allocate_ids(1)), 'version': 1, 'updated_at': datetime.now().isoformat()}
+        self._records[record['task_id']] = record
+        self._state['created_here'].pop(old_task_id, None)
+        self._state['created_here'][record['task_id']] = record.get('created_at')
+        self._superseded[record['task_id']] = None
+        self._append_outbox([record])
+        logger.warning(f"O ID {old_task_id} também foi usado em outro computador: "
+                       f"a tarefa criada aqui passou a ser a {record['task_id']}.")
+        return record
+
+    # --- Fila de saída (lida e confirmada pelo SyncEngine) ---
+    def pending_changes(self) -> Tuple[List[Dict], int]:
+        """Registros ainda não enviados e o tamanho em bytes do trecho lido (para confirm_pushed)."""
+        with self._lock:
+            self._ensure_loaded()
+            if not self.outbox_file.exists():
+                return [], 0
+            content = self.outbox_file.read_bytes()
+        records = []
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                # Linha deixada pela metade por uma queda: é descartada junto com o trecho enviado, senão travaria a fila
+                logger.warning(f"Linha inválida descartada da fila de saída {self.outbox_file.name}.")
+        return records, len(content)
+
+    def confirm_pushed(self, byte_count: int):
+        with self._lock:
+            remaining = self.outbox_file.read_bytes()[byte_count:]
+            if remaining:
+                temp_file = self.outbox_file.with_name(self.outbox_file.name + ".tmp")
+                temp_file.write_bytes(remaining)
+                os.replace(temp_file, self.outbox_file)
+            else:
+                self.outbox_file.unlink()
+
+
+class SyncEngine:
+    """Thread que envia a fila de saída da réplica e busca as alterações das outras réplicas.
+
+    Roda a cada SYNC_INTERVAL_S e logo depois das gravações locais. Se a pasta compartilhada
+    estiver fora do ar, a réplica local continua funcionando e a fila espera o próximo ciclo.
+    """
+
+    def __init__(self, replica: ReplicaTaskService, interval_s: float = SYNC_INTERVAL_S):
+        self.replica = replica
+        self.interval_s = interval_s
+        self.last_sync_at: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="SyncEngine", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout_s: float = 5.0):
+        """Para a thread depois de um último envio da fila de saída (esperando no máximo `timeout_s`)."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self.replica.changes_pending.set()
+        self._thread.join(timeout_s)
+        self._thread = None
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            self.sync_once()
+            self.replica.changes_pending.wait(self.interval_s)
+            self._stop_event.wait(PUSH_DELAY_S)
+        self.sync_once(pull=False)
+
+    def _push(self) -> List[Dict]:
+        self.replica.changes_pending.clear()
+        pending, pending_size = self.replica.pending_changes()
+        if pending:
+            self.replica.shared_log.append(self.replica.replica_id, pending)
+            self.replica.confirm_pushed(pending_size)
+        return pending
+
+    def sync_once(self, pull: bool = True) -> bool:
+        """Um ciclo: envia a fila de saída e, com `pull`, aplica o que as outras réplicas gravaram."""
+        try:
+            with Metrics.timer("sincronizacao.ciclo"):
+                pending = self._push()
+                changed, removed = [], []
+                if pull:
+                    incoming, watermarks = self.replica.shared_log.read_since(self.replica.watermarks(), self.replica.replica_id)
+                    legacy_import = not self.replica.legacy_imported
+                    if legacy_import:
+                        # Versão 0: qualquer alteração feita no modo réplica prevalece sobre o arquivo antigo
+                        incoming = [{**task, 'version': 0, 'updated_at': ""}
+                                    for task in self.replica.shared_log.read_legacy_tasks()] + incoming
+                    changed, removed = self.replica.apply_remote(incoming, watermarks, legacy_imported=legacy_import)
+                    if self.replica.changes_pending.is_set():
+                        pending += self._push() # Tarefas renumeradas numa colisão de ID saem no mesmo ciclo
+        except (OSError, ValueError) as e:
+            if self.last_error != str(e):
+                logger.warning(f"Sincronização com {self.replica.shared_log.shared_dir} falhou; "
+                               f"a réplica local segue funcionando: {e}")
+            self.last_error = str(e)
+            Metrics.increment("sincronizacao.falhas")
+            return False
+        if self.last_error is not None:
+            logger.info("Sincronização com a pasta compartilhada restabelecida.")
+        self.last_sync_at, self.last_error = datetime.now(), None
+        if pending or changed or removed:
+            logger.info(f"Sincronização: {len(pending)} alteração(ões) enviada(s), {len(changed)} tarefa(s) "
+                        f"recebida(s), {len(removed)} removida(s).")
+        if changed or removed:
+            self.replica.notify(changed, removed)
+        return True
+
+
+_replica_service: Optional[ReplicaTaskService] = None
+
+def replica_backend(shared_dir: Path) -> ReplicaTaskService:
+    """ReplicaTaskService da pasta compartilhada (um por processo)."""
+    global _replica_service
+    if _replica_service is None or _replica_service.shared_log.shared_dir != shared_dir:
+        _replica_service = ReplicaTaskService(shared_dir)
+        logger.info(f"Modo réplica: sincronizando com a pasta compartilhada {shared_dir}.")
+    return _replica_service
@@ -0,0 +1,169 @@
+import unicodedata
+from typing import Dict, Iterable, Optional, Set
+
+from models import Task
+
+STATUS_ALL = "all"
+STATUS_PENDING = "pending"
+STATUS_COMPLETED = "completed"
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Normaliza texto para busca: sem acentos, sem diferença de maiúsculas e espaços extras."""
+    if not text:
+        return ""
+    decomposed = unicodedata.normalize('NFKD', str(text))
+    without_accents = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(without_accents.casefold().split())
+
+
+class TaskFilterCriteria:
+    """Critérios do filtro rápido. Campos vazios/None significam "qualquer valor"."""
+
+    def __init__(self, text: str = "", category: Optional[str] = None, user: Optional[str] = None,
+                 priority: Optional[int] = None, status: str = STATUS_ALL):
+        self.tokens = tuple(normalize_text(text).split())
+        self.category = normalize_text(category) if category else None
+        self.user = normalize_text(user) if user else None
+        self.priority = priority
+        self.status = status
+
+    @property
+    def is_empty(self) -> bool:
+        return (not self.tokens and self.category is None and self.user is None
+                and self.priority is None and self.status == STATUS_ALL)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TaskFilterCriteria):
+            return NotImplemented
+        return (self.tokens, self.category, self.user, self.priority, self.status) == \
+               (other.tokens, other.category, other.user, other.priority, other.status)
+
+    def narrows(self, previous: 'TaskFilterCriteria') -> bool:
+        """True se todo resultado destes critérios também satisfaz `previous` (consulta mais específica)."""
+        def field_narrows(new_value, old_value) -> bool:
+            return old_value is None or old_value == new_value
+        return (all(any(old_token in new_token for new_token in self.tokens) for old_token in previous.tokens)
+                and field_narrows(self.category, previous.category)
+                and field_narrows(self.user, previous.user)
+                and field_narrows(self.priority, previous.priority)
+                and (previous.status == STATUS_ALL or previous.status == self.status))
+
+
+class TaskFilter:
+    """Filtro rápido sobre as tarefas da GUI.
+
+    Os campos de busca são normalizados uma única vez por tarefa (e atualizados quando a
+    tarefa muda). Se a nova consulta apenas restringe a anterior, avalia somente o
+    resultado anterior em vez de todas as tarefas.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[str, Task] = {}
+        self._search_text: Dict[str, str] = {}     # task_id -> id/descrição/categoria/usuário normalizados
+        self._category: Dict[str, str] = {}
+        self._user: Dict[str, str] = {}
+        self._last_criteria: Optional[TaskFilterCriteria] = None
+        self._last_result: Optional[Set[str]] = None
+
+    # --- Índice de campos normalizados ---
+    def reset(self, tasks: Iterable[Task]):
+        self._tasks.clear()
+        self._search_text.clear()
+        self._category.clear()
+        self._user.clear()
+        for task in tasks:
+            self._index(task)
+        self._last_result = None
+        if self._last_criteria is not None:
+            self.apply(self._last_criteria)
+
+    def _index(self, task: Task):
+        task_id = task.task_id
+        self._tasks[task_id] = task
+        self._category[task_id] = normalize_text(task.category)
+        self._user[task_id] = normalize_text(task.user)
+        self._search_text[task_id] = " ".join(
+            (normalize_text(task_id), normalize_text(task.description), self._category[task_id], self._user[task_id])
+        )
+
+    def update(self, tasks: Iterable[Task]):
+        """Reindexa tarefas alteradas/adicionadas e ajusta o último resultado apenas para elas."""
+        for task in tasks:
+            self._index(task)
+            if self._last_result is not None:
+                if self._matches(task.task_id, self._last_criteria):
+                    self._last_result.add(task.task_id)
+                else:
+                    self._last_result.discard(task.task_id)
+
+    def forget(self, task_ids: Iterable[str]):
+        for task_id in task_ids:
+            self._tasks.pop(task_id, None)
+            self._search_text.pop(task_id, None)
+            self._category.pop(task_id, None)
+            self._user.pop(task_id, None)
+            if self._last_result is not None:
+                self._last_result.discard(task_id)
+
+    # --- Avaliação ---
+    def _matches(self, task_id: str, criteria: TaskFilterCriteria) -> bool:
+        task = self._tasks[task_id]
+        if criteria.status == STATUS_PENDING and task.is_completed:
+            return False
+        if criteria.status == STATUS_COMPLETED and not task.is_completed:
+            return False
+        if criteria.priority is not None and task.priority != criteria.priority:
+            return False
+        if criteria.category is not None and self._category[task_id] != criteria.category:
+            return False
+        if criteria.user is not None and self._user[task_id] != criteria.user:
+            return False
+        search_text = self._search_text[task_id]
+        return all(token in search_text for token in criteria.tokens)
+
+    def apply(self, criteria: TaskFilterCriteria) -> Optional[Set[str]]:
+        """Retorna o conjunto de IDs visíveis, ou None quando não há filtro ativo."""
+        if criteria.is_empty:
+            self._last_criteria, self._last_result = criteria, None
+            return None
+        if self._last_result is not None and criteria == self._last_criteria:
+            return self._last_result
+        search_text = self._search_text
+        tokens = sorted(criteria.tokens, key=len, reverse=True) # Tokens mais longos costumam ser mais seletivos
+        if (self._last_result is not None and criteria.narrows(self._last_criteria)
+                and len(self._last_result) <= len(self._tasks) // 2):
+            # Reaproveita o resultado anterior; se ele ainda cobre mais da metade das tarefas,
+            # a varredura direta (sem buscas no dicionário) acaba sendo mais rápida.
+            candidate_ids = self._last_result
+        elif tokens:
+            # Varredura completa: o primeiro token é avaliado direto sobre os itens, sem buscas no dicionário
+            first_token = tokens.pop(0)
+            candidate_ids = [tid for tid, text in search_text.items() if first_token in text]
+        else:
+            candidate_ids = self._tasks.keys()
+
+        # Um critério por passada, cada uma numa compreensão simples: bem mais rápido do que
+        # chamar _matches() por tarefa quando há centenas de milhares de linhas.
+        tasks = self._tasks
+        if criteria.status != STATUS_ALL:
+            wants_completed = criteria.status == STATUS_COMPLETED
+            candidate_ids = [tid for tid in candidate_ids if tasks[tid].is_completed == wants_completed]
+        if criteria.priority is not None:
+            candidate_ids = [tid for tid in candidate_ids if tasks[tid].priority == criteria.priority]
+        if criteria.category is not None:
+            category_by_id = self._category
+            candidate_ids = [tid for tid in candidate_ids if category_by_id[tid] == criteria.category]
+        if criteria.user is not None:
+            user_by_id = self._user
+            candidate_ids = [tid for tid in candidate_ids if user_by_id[tid] == criteria.user]
+        for token in tokens:
+            candidate_ids = [tid for tid in candidate_ids if token in search_text[tid]]
+
+        self._last_result = set(candidate_ids)
+        self._last_criteria = criteria
+        return self._last_result
+
+    @property
+    def visible_ids(self) -> Optional[Set[str]]:
+        return self._last_result
@@ -4,7 +4,8 @@ from tkinter import messagebox
 
 # Tenta importar a configuração primeiro para configurar o logging o mais cedo possível
 try:
-    from config import logger, Config # Config para APP_NAME em erro fatal
+    from config import logger, Config, init_app # Config para APP_NAME em erro fatal
+    init_app()
 except ImportError as e:
     # Fallback de logging se config.py falhar ao importar
     import logging
@@ -1,14 +1,31 @@
-import tkinter as tk
-from tkinter import ttk
-from fpdf import FPDF # Dependência: pip install fpdf
+import hashlib
+import json
+import os
+import threading
+import time
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path 
-from typing import List, Dict, Optional # Importações de tipos
+from typing import Callable, Iterable, List, Dict, Optional, Tuple, TYPE_CHECKING # Importações de tipos
 
+if TYPE_CHECKING:
+    from fpdf import FPDF # Dependência: pip install fpdf (importada sob demanda em generate_task_report)
+    from analytics import GroupStats, ProductivitySummary
+
+from asset_cache import AssetCache
 from config import Config, logger, HAS_PIL 
+from metrics import Metrics
+from report_jobs import ReportCancelledError
+
+# progress_callback(linhas_diagramadas, paginas_gravadas), chamado periodicamente durante a geração
+ProgressCallback = Callable[[int, int], None]
 
 class Tooltip:
-    """Cria um tooltip (dica de ferramenta) para um widget."""
+    """Cria um tooltip (dica de ferramenta) para um widget.
+
+    O tkinter só é importado ao exibir o tooltip: os relatórios deste módulo também rodam sem interface (relatorios_cli.py).
+    """
     def __init__(self, widget, text: str):
         self.widget = widget
         self.text = text
@@ -17,6 +34,8 @@ class Tooltip:
         self.widget.bind("<Leave>", self.hide_tooltip)
 
     def show_tooltip(self, event=None):
+        import tkinter as tk
+        from tkinter import ttk
         x, y, _, _ = self.widget.bbox("insert") 
         x += self.widget.winfo_rootx() + 25
         y += self.widget.winfo_rooty() + 20 
@@ -41,6 +60,200 @@ class Tooltip:
             self.tooltip_window.destroy()
         self.tooltip_window = None
 
+class TextLayoutCache:
+    """Cache das medidas de texto usadas no layout das tabelas do PDF.
+
+    Guarda a largura de cada palavra por (fonte, estilo, tamanho) e o resultado da quebra de
+    linhas de cada texto por largura de coluna. Categorias, usuários, datas e palavras das
+    descrições se repetem muito, então quase tudo é medido uma única vez.
+    """
+    MAX_ENTRIES = 200_000 # Por dicionário; ao passar do limite o cache é esvaziado
+
+    def __init__(self):
+        self._widths: Dict[Tuple, float] = {}
+        self._wraps: Dict[Tuple, List[str]] = {}
+
+    @staticmethod
+    def _font_key(pdf: 'FPDF') -> Tuple:
+        return (pdf.font_family, pdf.font_style, pdf.font_size_pt)
+
+    def string_width(self, pdf: 'FPDF', text: str) -> float:
+        key = (self._font_key(pdf), text)
+        width = self._widths.get(key)
+        if width is None:
+            if len(self._widths) >= self.MAX_ENTRIES:
+                self._widths.clear()
+            width = self._widths[key] = pdf.get_string_width(text)
+        return width
+
+    def wrap(self, pdf: 'FPDF', text: str, width: float) -> List[str]:
+        """Quebra `text` em linhas que cabem em `width` mm na fonte atual (por palavras, como multi_cell)."""
+        key = (self._font_key(pdf), width, text)
+        lines = self._wraps.get(key)
+        if lines is None:
+            if len(self._wraps) >= self.MAX_ENTRIES:
+                self._wraps.clear()
+            lines = self._wraps[key] = self._wrap_uncached(pdf, text, width - 2 * pdf.c_margin)
+        return lines
+
+    def _wrap_uncached(self, pdf: 'FPDF', text: str, available_width: float) -> List[str]:
+        # As larguras das fontes padrão do PDF são aditivas (sem kerning): a largura de uma linha
+        # é a soma das larguras das palavras e dos espaços entre elas.
+        space_width = self.string_width(pdf, ' ')
+        lines: List[str] = []
+        for paragraph in text.split('\n'):
+            line_words: List[str] = []
+            line_width = 0.0
+            for word in paragraph.split(' '):
+                word_width = self.string_width(pdf, word)
+                candidate_width = line_width + space_width + word_width if line_words else word_width
+                if candidate_width <= available_width:
+                    line_words.append(word)
+                    line_width = candidate_width
+                    continue
+                if line_words:
+                    lines.append(' '.join(line_words))
+                if word_width <= available_width:
+                    line_words, line_width = [word], word_width
+                    continue
+                # Palavra maior que a célula: quebra por caracteres
+                current_chunk = ""
+                for char in word:
+                    if current_chunk and self.string_width(pdf, current_chunk + char) > available_width:
+                        lines.append(current_chunk)
+                        current_chunk = ""
+                    current_chunk += char
+                line_words, line_width = [current_chunk], self.string_width(pdf, current_chunk)
+            lines.append(' '.join(line_words))
+        return lines or [""]
+
+
+_text_layout_cache = TextLayoutCache() # Um por processo (inclusive nos processos dos relatórios grandes)
+
+
+class ReportCache:
+    """Cache de relatórios PDF em Config.REPORTS_DIR, indexado pelo conteúdo.
+
+    A chave é o hash de (tipo de relatório, tarefas incluídas, versão do modelo). Se um PDF
+    com a mesma chave já existe, ele é reaproveitado em vez de gerado de novo. Relatórios
+    antigos são removidos por idade e quando o diretório passa dos limites de quantidade/tamanho.
+    """
+    FILE_PREFIX = "relatorio_tarefas_"
+    MAX_AGE_DAYS = 30
+    MAX_FILES = 50
+    MAX_TOTAL_BYTES = 200 * 1024 * 1024
+
+    @staticmethod
+    def key_for(report_type: str, tasks_data: List[Dict], template_version: int) -> str:
+        hasher = hashlib.sha256(f"{template_version}|{report_type.lower()}|{len(tasks_data)}".encode('utf-8'))
+        for task_dict in tasks_data: # Tarefa por tarefa, sem montar um JSON único gigante
+            hasher.update(b"\n")
+            hasher.update(json.dumps(task_dict, sort_keys=True, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+        return hasher.hexdigest()
+
+    @staticmethod
+    def path_for(report_type: str, cache_key: str) -> Path:
+        return Config.REPORTS_DIR / f"{ReportCache.FILE_PREFIX}{report_type.lower().replace(' ', '_')}_{cache_key[:16]}.pdf"
+
+    @staticmethod
+    def lookup(report_type: str, cache_key: str) -> Optional[Path]:
+        report_path = ReportCache.path_for(report_type, cache_key)
+        try:
+            os.utime(report_path) # Marca o uso: a idade conta a partir do último acesso
+        except OSError:
+            return None
+        return report_path
+
+    @staticmethod
+    def store(pdf: 'FPDF', report_type: str, cache_key: str, evict: bool = True) -> Path:
+        """Grava o PDF com a chave de conteúdo no nome do arquivo."""
+        return ReportCache.write(pdf, ReportCache.path_for(report_type, cache_key), evict)
+
+    @staticmethod
+    def write(pdf: 'FPDF', report_path: Path, evict: bool = True) -> Path:
+        """Grava um PDF no diretório de relatórios (temporário + os.replace) e aplica a limpeza do cache.
+
+        `evict=False` adia a limpeza para quem gera vários relatórios de uma vez (relatorios_cli.py):
+        senão um relatório do lote poderia apagar outro gerado pouco antes.
+        """
+        temp_path = report_path.with_name(report_path.name + ".tmp")
+        pdf.output(str(temp_path), 'F')
+        os.replace(temp_path, report_path)
+        if evict:
+            ReportCache.evict(keep=[report_path])
+        return report_path
+
+    @staticmethod
+    def evict(keep: Iterable[Path] = ()):
+        """Remove relatórios expirados e, se preciso, os menos usados até respeitar os limites (exceto os de `keep`)."""
+        keep = {Path(report_path) for report_path in keep}
+        try:
+            entries = []
+            for report_path in Config.REPORTS_DIR.glob(f"{ReportCache.FILE_PREFIX}*.pdf"):
+                stat_result = report_path.stat()
+                entries.append((stat_result.st_mtime, stat_result.st_size, report_path))
+        except OSError as e:
+            logger.warning(f"Não foi possível verificar o cache de relatórios em {Config.REPORTS_DIR}: {e}")
+            return
+
+        entries.sort(reverse=True) # Mais recentes primeiro
+        oldest_allowed = time.time() - ReportCache.MAX_AGE_DAYS * 86400
+        kept_files, kept_bytes = 0, 0
+        for mtime, size, report_path in entries:
+            within_limits = (mtime >= oldest_allowed and kept_files < ReportCache.MAX_FILES
+                             and kept_bytes + size <= ReportCache.MAX_TOTAL_BYTES)
+            if within_limits or report_path in keep:
+                kept_files += 1
+                kept_bytes += size
+                continue
+            try:
+                report_path.unlink()
+                logger.info(f"Relatório removido do cache: {report_path.name}")
+            except OSError as e:
+                logger.warning(f"Não foi possível remover o relatório antigo {report_path}: {e}")
+
+
+@lru_cache(maxsize=None)
+def _report_pdf_class():
+    """Cria (uma vez por processo) a subclasse de FPDF usada nos relatórios."""
+    from fpdf import FPDF # Importação adiada: só é necessária ao gerar relatórios
+
+    class ReportFPDF(FPDF):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.page_offset = 0 # Páginas renderizadas antes deste documento (relatórios em partes)
+            self.prerendered_pages: set = set() # Páginas recebidas prontas, já com rodapé
+
+        def footer(self):
+            if self.page in self.prerendered_pages:
+                return
+            self.set_y(-15)
+            PDFGenerator._apply_style(self, 'footer') 
+            self.cell(0, 10, f"Página {self.page_no() + self.page_offset}/{{nb}}", border=0, align='C')
+
+    return ReportFPDF
+
+
+def _render_report_chunk(chunk: Dict) -> List[str]:
+    """Renderiza um intervalo de páginas de um relatório grande (executado nos processos do pool).
+
+    Retorna o conteúdo bruto de cada página, pronto para ser anexado ao documento final.
+    """
+    pdf = PDFGenerator._new_report_pdf()
+    pdf.page_offset = chunk['first_page'] - 1
+    columns = chunk['columns']
+    row_index = chunk['first_row_index']
+    for page_rows in chunk['pages']:
+        pdf.add_page()
+        PDFGenerator._draw_table_header(pdf, columns)
+        for row_values in page_rows:
+            lines_per_cell, row_height = PDFGenerator._layout_row(pdf, row_values, columns)
+            PDFGenerator._draw_row(pdf, lines_per_cell, row_height, columns, fill=row_index % 2 == 1)
+            row_index += 1
+    PDFGenerator._finish_page(pdf)
+    return [pdf.pages[page_no] for page_no in range(1, pdf.page + 1)]
+
+
 class PDFGenerator:
     """Classe responsável por gerar relatórios de tarefas em formato PDF."""
     STYLES = {
@@ -56,7 +269,15 @@ class PDFGenerator:
         'row_even': (240, 248, 255),    
         'row_odd': (255, 255, 255),     
     }
+    TEMPLATE_VERSION = 2 # Incremente ao mudar o layout: invalida os relatórios em cache
     CELL_HEIGHT = 8 # Altura padrão da célula da tabela em mm
+    LINE_HEIGHT = 5 # Altura de cada linha de texto quebrado dentro de uma célula, em mm
+    PAGE_BOTTOM_MARGIN = 15
+
+    # Modo de relatório grande: páginas pré-calculadas e renderizadas em partes num pool de processos
+    LARGE_REPORT_THRESHOLD = 2000 # A partir de quantas tarefas o modo é usado
+    PAGES_PER_CHUNK = 25
+    MAX_REPORT_WORKERS = 4
 
     @staticmethod
     def _format_datetime_pdf(iso_datetime_str: Optional[str]) -> str: 
@@ -66,19 +287,32 @@ class PDFGenerator:
         except ValueError: return iso_datetime_str[:16] 
 
     @staticmethod
-    def _apply_style(pdf: FPDF, style_name: str):
+    def _apply_style(pdf: 'FPDF', style_name: str):
         style = PDFGenerator.STYLES[style_name]
         pdf.set_font(style['font'], style['style'], style['size'])
         pdf.set_text_color(*style['color'])
 
     @staticmethod
-    def _add_document_header(pdf: FPDF, report_title: str):
+    def _new_report_pdf() -> 'FPDF':
+        pdf = _report_pdf_class()(orientation='P', unit='mm', format='A4')
+        # As fontes são registradas sempre na mesma ordem: o conteúdo das páginas referencia as
+        # fontes pelo número (/F1, /F2...), e páginas renderizadas em outro processo precisam bater.
+        for style_name in PDFGenerator.STYLES:
+            PDFGenerator._apply_style(pdf, style_name)
+        pdf.set_left_margin(10)
+        pdf.set_right_margin(10)
+        # Sem quebra automática: as quebras são decididas pela altura já calculada de cada linha
+        pdf.set_auto_page_break(auto=False)
+        return pdf
+
+    @staticmethod
+    def _add_document_header(pdf: 'FPDF', report_title: str):
         if Config.LOGO_PATH.exists() and HAS_PIL:
-            try:
-                pdf.image(str(Config.LOGO_PATH), x=10, y=8, w=30) 
+            # A logo é lida e decodificada uma única vez por processo (AssetCache)
+            if AssetCache.embed_in_pdf(pdf, Config.LOGO_PATH, x=10, y=8, w=30):
                 pdf.ln(15) 
-            except Exception as e:
-                logger.warning(f"Não foi possível adicionar logo ao PDF ({Config.LOGO_PATH}): {e}")
+            else:
+                logger.warning(f"Não foi possível adicionar logo ao PDF ({Config.LOGO_PATH}).")
                 pdf.ln(10)
         else:
             pdf.ln(10)
@@ -96,93 +330,360 @@ class PDFGenerator:
         return {1: "Baixa", 2: "Média", 3: "Alta"}.get(priority_value, "N/D")
 
     @staticmethod
-    def generate_task_report(tasks_data: List[Dict], report_type: str) -> str:
+    def _is_completed_report(report_type: str) -> bool:
+        return report_type.lower() in ("completed", "concluídas")
+
+    @staticmethod
+    def _report_columns(report_type: str) -> List[Tuple[str, float, str]]:
+        """Colunas da tabela: (cabeçalho, largura em mm, alinhamento)."""
+        if PDFGenerator._is_completed_report(report_type):
+            # Total: 15+50+20+25+25+20+25 = 180
+            return [('ID', 15, 'C'), ('Descrição', 50, 'L'), ('Prior.', 20, 'C'), ('Categoria', 25, 'L'),
+                    ('Criada em', 25, 'C'), ('Status', 20, 'C'), ('Concluída em', 25, 'C')]
+        return [('ID', 15, 'C'), ('Descrição', 70, 'L'), ('Prior.', 20, 'C'), ('Categoria', 30, 'L'),
+                ('Criada em', 25, 'C'), ('Status', 30, 'C')]
+
+    @staticmethod
+    def _row_values(task_dict: Dict, include_completed_at: bool) -> List[str]:
+        row_values = [
+            task_dict.get('task_id', '')[:8], 
+            task_dict.get('description', ''),
+            PDFGenerator._get_priority_label_pdf(task_dict.get('priority', 1)),
+            task_dict.get('category', 'N/D')[:25], # Limita caracteres da categoria
+            PDFGenerator._format_datetime_pdf(task_dict.get('created_at')),
+            "Concluída" if task_dict.get('is_completed') else "Pendente"
+        ]
+        if include_completed_at:
+            row_values.append(PDFGenerator._format_datetime_pdf(task_dict.get('completed_at')))
+        return [str(value) for value in row_values]
+
+    @staticmethod
+    def _draw_table_header(pdf: 'FPDF', columns: List[Tuple[str, float, str]]):
+        PDFGenerator._apply_style(pdf, 'table_header')
+        pdf.set_fill_color(*PDFGenerator.COLORS['table_header_fill'])
+        for header_text, width, _ in columns:
+            pdf.cell(width, PDFGenerator.CELL_HEIGHT, header_text, border=1, ln=0, align='C', fill=True)
+        pdf.ln()
+        PDFGenerator._apply_style(pdf, 'table_row')
+
+    # --- Layout de linhas: cada célula é medida e quebrada uma vez, antes de desenhar ---
+    @staticmethod
+    def _layout_row(pdf: 'FPDF', row_values: List[str], columns: List[Tuple[str, float, str]]) -> Tuple[List[List[str]], float]:
+        """Retorna as linhas de cada célula e a altura real da linha da tabela."""
+        lines_per_cell = [_text_layout_cache.wrap(pdf, text, width) for text, (_, width, _) in zip(row_values, columns)]
+        max_lines = max(len(lines) for lines in lines_per_cell)
+        row_height = max(PDFGenerator.CELL_HEIGHT, max_lines * PDFGenerator.LINE_HEIGHT + 3)
+        return lines_per_cell, row_height
+
+    @staticmethod
+    def _draw_row(pdf: 'FPDF', lines_per_cell: List[List[str]], row_height: float,
+                  columns: List[Tuple[str, float, str]], fill: bool):
+        pdf.set_fill_color(*(PDFGenerator.COLORS['row_even'] if fill else PDFGenerator.COLORS['row_odd']))
+        x_pos, y_start_of_row = pdf.l_margin, pdf.get_y()
+        for lines, (_, width, align) in zip(lines_per_cell, columns):
+            pdf.rect(x_pos, y_start_of_row, width, row_height, 'DF' if fill else 'D')
+            text_y = y_start_of_row + (row_height - len(lines) * PDFGenerator.LINE_HEIGHT) / 2
+            for line in lines:
+                pdf.set_xy(x_pos, text_y)
+                pdf.cell(width, PDFGenerator.LINE_HEIGHT, line, border=0, ln=0, align=align)
+                text_y += PDFGenerator.LINE_HEIGHT
+            x_pos += width
+        pdf.set_xy(pdf.l_margin, y_start_of_row + row_height)
+
+    @staticmethod
+    def _finish_page(pdf: 'FPDF'):
+        """Desenha o rodapé e fecha a página atual (o que FPDF.add_page faz antes de abrir outra)."""
+        pdf.in_footer = 1
+        pdf.footer()
+        pdf.in_footer = 0
+        pdf._endpage()
+
+    @staticmethod
+    def _append_prerendered_page(pdf: 'FPDF', page_content: str):
+        """Anexa ao documento uma página renderizada em outro processo (conteúdo bruto, já com rodapé).
+
+        Depende da estrutura interna do PyFPDF 1.7 (`pages`, `_beginpage`), a mesma que ele usa em add_page.
+        """
+        PDFGenerator._finish_page(pdf)
+        pdf._beginpage('')
+        pdf.pages[pdf.page] = page_content
+        pdf.prerendered_pages.add(pdf.page)
+
+    @staticmethod
+    def _paginate(pdf: 'FPDF', rows: List[List[str]], columns: List[Tuple[str, float, str]],
+                  first_page_top: float, progress: '_ReportProgress') -> List[Tuple[int, int]]:
+        """Pré-calcula a paginação: retorna (primeira linha, linha final exclusiva) de cada página."""
+        page_break_y = pdf.h - PDFGenerator.PAGE_BOTTOM_MARGIN
+        next_pages_top = pdf.t_margin + PDFGenerator.CELL_HEIGHT # Cabeçalho da tabela repetido em cada página
+        pages: List[Tuple[int, int]] = []
+        page_start, y_pos = 0, first_page_top
+        for row_index, row_values in enumerate(rows):
+            progress.row_done(row_index)
+            _, row_height = PDFGenerator._layout_row(pdf, row_values, columns)
+            if y_pos + row_height > page_break_y and row_index > page_start:
+                pages.append((page_start, row_index))
+                page_start, y_pos = row_index, next_pages_top
+            y_pos += row_height
+        pages.append((page_start, len(rows)))
+        progress.rows_done = len(rows)
+        return pages
+
+    @staticmethod
+    def _build_large_report(tasks_data: List[Dict], report_type: str, progress: '_ReportProgress',
+                            use_processes: bool = True) -> 'FPDF':
+        """Monta o relatório em modo grande: paginação pré-calculada e páginas renderizadas em partes.
+
+        A primeira página (com logo e título) é renderizada aqui; as demais são divididas em blocos de
+        PAGES_PER_CHUNK páginas renderizados num pool de processos e anexadas em ordem. Cada processo
+        recebe só as linhas do seu bloco, e no máximo 2 blocos por processo ficam em andamento.
+        """
+        columns = PDFGenerator._report_columns(report_type)
+        include_completed_at = PDFGenerator._is_completed_report(report_type)
+        rows = [PDFGenerator._row_values(task_dict, include_completed_at) for task_dict in tasks_data]
+
+        pdf = PDFGenerator._new_report_pdf()
+        pdf.alias_nb_pages()
+        pdf.add_page()
+        PDFGenerator._add_document_header(pdf, f"Listagem de Tarefas {report_type.capitalize()}")
+        PDFGenerator._draw_table_header(pdf, columns)
+
+        pages = PDFGenerator._paginate(pdf, rows, columns, first_page_top=pdf.get_y(), progress=progress)
+        first_page_end = pages[0][1]
+        for row_index in range(first_page_end):
+            lines_per_cell, row_height = PDFGenerator._layout_row(pdf, rows[row_index], columns)
+            PDFGenerator._draw_row(pdf, lines_per_cell, row_height, columns, fill=row_index % 2 == 1)
+
+        def iter_chunks():
+            for chunk_start in range(1, len(pages), PDFGenerator.PAGES_PER_CHUNK):
+                chunk_pages = pages[chunk_start:chunk_start + PDFGenerator.PAGES_PER_CHUNK]
+                yield {
+                    'first_page': chunk_start + 1,
+                    'first_row_index': chunk_pages[0][0],
+                    'columns': columns,
+                    'pages': [rows[start:end] for start, end in chunk_pages],
+                }
+
+        if not use_processes:
+            for chunk in iter_chunks():
+                for page_content in _render_report_chunk(chunk):
+                    PDFGenerator._append_prerendered_page(pdf, page_content)
+                progress.page_written(pdf.page)
+            return pdf
+
+        # Importações adiadas: só são necessárias em relatórios grandes
+        import multiprocessing
+        from collections import deque
+        from concurrent.futures import ProcessPoolExecutor
+
+        max_workers = max(1, min(PDFGenerator.MAX_REPORT_WORKERS, os.cpu_count() or 1))
+        chunks = iter_chunks()
+        # 'spawn' em todas as plataformas: fork com o Tk e as threads da GUI ativas não é seguro
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+            in_flight = deque(executor.submit(_render_report_chunk, chunk)
+                              for chunk in islice(chunks, max_workers * 2))
+            while in_flight:
+                page_contents = in_flight.popleft().result()
+                for page_content in page_contents:
+                    PDFGenerator._append_prerendered_page(pdf, page_content)
+                try:
+                    progress.page_written(pdf.page)
+                except ReportCancelledError:
+                    executor.shutdown(wait=False, cancel_futures=True) # Descarta os blocos ainda não iniciados
+                    raise
+                next_chunk = next(chunks, None)
+                if next_chunk is not None:
+                    in_flight.append(executor.submit(_render_report_chunk, next_chunk))
+        return pdf
+
+    @staticmethod
+    @Metrics.timed("relatorio.pdf")
+    def generate_task_report(tasks_data: List[Dict], report_type: str,
+                             progress_callback: Optional[ProgressCallback] = None,
+                             cancel_event: Optional[threading.Event] = None,
+                             use_processes: bool = True, evict_cache: bool = True) -> str:
+        """Gera (ou reaproveita do cache) o relatório PDF e retorna o caminho do arquivo.
+
+        Com `cancel_event` sinalizado, a geração é interrompida com ReportCancelledError.
+        `use_processes=False` renderiza relatórios grandes no próprio processo (quem chama já paraleliza);
+        `evict_cache=False` deixa a limpeza do cache para quem chama (ver ReportCache.write).
+        """
+        progress = _ReportProgress(progress_callback, cancel_event)
         try:
             Config.REPORTS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            class CustomFPDF(FPDF): 
-                def footer(self):
-                    self.set_y(-15)
-                    PDFGenerator._apply_style(self, 'footer') 
-                    self.cell(0, 10, f"Página {self.page_no()}/{{nb}}", border=0, align='C')
-
-            pdf = CustomFPDF(orientation='P', unit='mm', format='A4') 
-            pdf.alias_nb_pages() 
-            pdf.add_page()
-            pdf.set_auto_page_break(auto=True, margin=15) 
-            pdf.set_left_margin(10)
-            pdf.set_right_margin(10)
-
-            report_title = f"Listagem de Tarefas {report_type.capitalize()}"
-            PDFGenerator._add_document_header(pdf, report_title)
-            
-            col_widths = {'id': 15, 'desc': 70, 'prio': 20, 'cat': 30, 'criada': 25, 'status': 30}
-            headers = ['ID', 'Descrição', 'Prior.', 'Categoria', 'Criada em', 'Status']
-
-            if report_type.lower() == "completed" or report_type.lower() == "concluídas":
-                col_widths['concluida'] = 25 
-                headers.append('Concluída em')
-                col_widths['desc'] = 50 
-                col_widths['cat'] = 25
-                col_widths['status'] = 20 # Reduzido para caber 'concluida'
-                # Total: 15+50+20+25+25+20+25 = 180. OK.
-
-            PDFGenerator._apply_style(pdf, 'table_header')
-            pdf.set_fill_color(*PDFGenerator.COLORS['table_header_fill'])
-            for i, header_text in enumerate(headers):
-                col_name = list(col_widths.keys())[i]
-                pdf.cell(col_widths[col_name], PDFGenerator.CELL_HEIGHT, header_text, border=1, ln=0, align='C', fill=True)
-            pdf.ln()
-
-            PDFGenerator._apply_style(pdf, 'table_row')
-            fill = False 
-            for task_dict in tasks_data:
-                pdf.set_fill_color(*(PDFGenerator.COLORS['row_even'] if fill else PDFGenerator.COLORS['row_odd']))
-                
-                row_values = [
-                    task_dict.get('task_id', '')[:8], 
-                    task_dict.get('description', ''),
-                    PDFGenerator._get_priority_label_pdf(task_dict.get('priority', 1)),
-                    task_dict.get('category', 'N/D')[:25], # Limita caracteres da categoria
-                    PDFGenerator._format_datetime_pdf(task_dict.get('created_at')),
-                    "Concluída" if task_dict.get('is_completed') else "Pendente"
-                ]
-                if report_type.lower() == "completed" or report_type.lower() == "concluídas":
-                    row_values.append(PDFGenerator._format_datetime_pdf(task_dict.get('completed_at')))
-
-                # Guarda a posição Y inicial da linha
-                y_start_of_row = pdf.get_y()
-                x_pos = pdf.get_x() # Margem esquerda (ex: 10)
-
-                for i, col_name_key in enumerate(list(col_widths.keys())[:len(row_values)]):
-                    width = col_widths[col_name_key]
-                    text = str(row_values[i])
-                    
-                    # Define a posição X,Y para cada célula da linha
-                    pdf.set_xy(x_pos, y_start_of_row)
-                    
-                    if col_name_key == 'desc': 
-                        pdf.multi_cell(width, PDFGenerator.CELL_HEIGHT, text, border=1, align='L', fill=fill)
-                        # multi_cell com ln (padrão 0) avança X para x_start + width e Y para y_start + H
-                        # No entanto, o FPDF padrão pode se comportar de forma que o Y é atualizado para a próxima linha.
-                        # Por segurança, após um multi_cell, é bom resetar X e Y para a próxima célula *na mesma linha lógica*.
-                    else:
-                        pdf.cell(width, PDFGenerator.CELL_HEIGHT, text, border=1, ln=0, align='C' if col_name_key != 'cat' else 'L', fill=fill)
-                    
-                    x_pos += width # Avança a posição X para a próxima célula na linha
-
-                # Após todas as células da linha, avança para a próxima linha da tabela
-                pdf.ln(PDFGenerator.CELL_HEIGHT) 
-                fill = not fill 
-
-            report_filename = f"relatorio_tarefas_{report_type.lower().replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-            report_file_path = Config.REPORTS_DIR / report_filename
-            
-            pdf.output(str(report_file_path), 'F') 
+
+            cache_key = ReportCache.key_for(report_type, tasks_data, PDFGenerator.TEMPLATE_VERSION)
+            cached_report_path = ReportCache.lookup(report_type, cache_key)
+            if cached_report_path is not None:
+                Metrics.increment("relatorio.pdf.cache_reaproveitado")
+                logger.info(f"Relatório reaproveitado do cache (dados inalterados): {cached_report_path}")
+                return str(cached_report_path)
+
+            if len(tasks_data) >= PDFGenerator.LARGE_REPORT_THRESHOLD:
+                from concurrent.futures.process import BrokenProcessPool
+                try:
+                    pdf = PDFGenerator._build_large_report(tasks_data, report_type, progress, use_processes=use_processes)
+                except (OSError, BrokenProcessPool) as e:
+                    logger.warning(f"Pool de processos indisponível para o relatório; renderizando em um único processo: {e}")
+                    pdf = PDFGenerator._build_large_report(tasks_data, report_type, progress, use_processes=False)
+                logger.info(f"Relatório grande montado em modo paginado: {len(tasks_data)} tarefas, {pdf.page} páginas.")
+            else:
+                pdf = PDFGenerator._build_report(tasks_data, report_type, progress)
+
+            progress.finish(len(tasks_data), pdf.page)
+            report_file_path = ReportCache.store(pdf, report_type, cache_key, evict=evict_cache)
 
             logger.info(f"Relatório PDF gerado com sucesso: {report_file_path}")
             return str(report_file_path)
 
+        except ReportCancelledError:
+            raise
         except Exception as e:
             logger.error(f"Erro ao gerar relatório PDF: {str(e)}", exc_info=True)
-            raise RuntimeError(f"Falha ao gerar o relatório PDF: {str(e)}")
\ No newline at end of file
+            raise RuntimeError(f"Falha ao gerar o relatório PDF: {str(e)}")
+
+    @staticmethod
+    def _build_report(tasks_data: List[Dict], report_type: str, progress: '_ReportProgress') -> 'FPDF':
+        pdf = PDFGenerator._new_report_pdf()
+        pdf.alias_nb_pages() 
+        pdf.add_page()
+
+        report_title = f"Listagem de Tarefas {report_type.capitalize()}"
+        PDFGenerator._add_document_header(pdf, report_title)
+
+        columns = PDFGenerator._report_columns(report_type)
+        include_completed_at = PDFGenerator._is_completed_report(report_type)
+        PDFGenerator._draw_table_header(pdf, columns)
+
+        page_break_y = pdf.h - PDFGenerator.PAGE_BOTTOM_MARGIN
+        for row_index, task_dict in enumerate(tasks_data):
+            progress.row_done(row_index, pdf.page)
+            row_values = PDFGenerator._row_values(task_dict, include_completed_at)
+            lines_per_cell, row_height = PDFGenerator._layout_row(pdf, row_values, columns)
+            if pdf.get_y() + row_height > page_break_y:
+                pdf.add_page()
+                PDFGenerator._draw_table_header(pdf, columns)
+            PDFGenerator._draw_row(pdf, lines_per_cell, row_height, columns, fill=row_index % 2 == 1)
+        return pdf
+
+
+    # --- Relatório de análise de produtividade ---
+    ANALYTICS_FILE_TAG = "analise_produtividade"
+    ANALYTICS_STATS_COLUMNS = [('Tarefas', 30, 'C'), ('Mediana', 30, 'C'), ('P90', 30, 'C'), ('Máximo', 30, 'C')]
+
+    @staticmethod
+    @Metrics.timed("relatorio.analise")
+    def generate_analytics_report(summary: 'ProductivitySummary', evict_cache: bool = True) -> str:
+        """Gera o relatório PDF da análise de produtividade e retorna o caminho do arquivo.
+
+        Não passa pelo cache por conteúdo: as idades do backlog dependem do momento da geração.
+        O arquivo leva o prefixo dos relatórios e entra na mesma limpeza por idade/quantidade.
+        """
+        try:
+            Config.REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+            pdf = PDFGenerator._build_analytics_report(summary)
+            file_name = f"{ReportCache.FILE_PREFIX}{PDFGenerator.ANALYTICS_FILE_TAG}_{summary.generated_at.strftime('%Y%m%d_%H%M%S')}.pdf"
+            report_file_path = ReportCache.write(pdf, Config.REPORTS_DIR / file_name, evict=evict_cache)
+            logger.info(f"Relatório de análise de produtividade gerado: {report_file_path}")
+            return str(report_file_path)
+        except Exception as e:
+            logger.error(f"Erro ao gerar relatório de análise: {str(e)}", exc_info=True)
+            raise RuntimeError(f"Falha ao gerar o relatório de análise: {str(e)}")
+
+    @staticmethod
+    def _build_analytics_report(summary: 'ProductivitySummary') -> 'FPDF':
+        from analytics import ProductivityAnalytics
+        format_days = ProductivityAnalytics.format_days
+
+        pdf = PDFGenerator._new_report_pdf()
+        pdf.alias_nb_pages()
+        pdf.add_page()
+        PDFGenerator._add_document_header(pdf, "Análise de Produtividade")
+        PDFGenerator._apply_style(pdf, 'subheader')
+        pdf.cell(0, 7, f"{summary.total_tasks} tarefas | {summary.completed_count} concluídas | "
+                       f"{summary.pending_count} pendentes", ln=True, align='C')
+
+        # Concluídas por usuário nas últimas semanas (Total: 44 + 8x15 + 16 = 180)
+        week_columns = [('Usuário', 44, 'L')]
+        week_columns += [(week_start.strftime('%d/%m'), 15, 'C') for week_start in summary.week_starts]
+        week_columns.append(('Total', 16, 'C'))
+        week_rows = [[user] + [str(count) for count in counts] + [str(sum(counts))]
+                     for user, counts in summary.weekly_by_user]
+        if week_rows:
+            week_rows.append(["Total"] + [str(count) for count in summary.weekly_totals] + [str(sum(summary.weekly_totals))])
+        PDFGenerator._draw_analytics_section(
+            pdf, "Concluídas por usuário e semana (início na segunda-feira)", week_columns, week_rows)
+
+        def stats_rows(stats_list: List['GroupStats'], overall: Optional['GroupStats'], label_for) -> List[List[str]]:
+            rows = [[label_for(stats.key), str(stats.count), format_days(stats.median_days),
+                     format_days(stats.p90_days), format_days(stats.max_days)] for stats in stats_list]
+            if overall is not None:
+                rows.append(["Todas", str(overall.count), format_days(overall.median_days),
+                             format_days(overall.p90_days), format_days(overall.max_days)])
+            return rows
+
+        priority_label = PDFGenerator._get_priority_label_pdf
+        PDFGenerator._draw_analytics_section(
+            pdf, "Tempo de conclusão (da criação à conclusão)",
+            [('Prioridade', 60, 'L')] + PDFGenerator.ANALYTICS_STATS_COLUMNS,
+            stats_rows(summary.lead_time_by_priority, summary.lead_time, priority_label))
+        PDFGenerator._draw_analytics_section(
+            pdf, "Idade das pendentes por prioridade",
+            [('Prioridade', 60, 'L')] + PDFGenerator.ANALYTICS_STATS_COLUMNS,
+            stats_rows(summary.backlog_age_by_priority, summary.backlog_age, priority_label))
+        PDFGenerator._draw_analytics_section(
+            pdf, "Idade das pendentes por categoria",
+            [('Categoria', 60, 'L')] + PDFGenerator.ANALYTICS_STATS_COLUMNS,
+            stats_rows(summary.backlog_age_by_category, None, str))
+        return pdf
+
+    @staticmethod
+    def _draw_analytics_section(pdf: 'FPDF', title: str, columns: List[Tuple[str, float, str]], rows: List[List[str]]):
+        """Título + tabela; a tabela continua na página seguinte (com o cabeçalho repetido) se precisar."""
+        page_break_y = pdf.h - PDFGenerator.PAGE_BOTTOM_MARGIN
+        # Título, cabeçalho e ao menos uma linha ficam juntos na mesma página
+        if pdf.get_y() + 10 + 2 * PDFGenerator.CELL_HEIGHT > page_break_y:
+            pdf.add_page()
+        pdf.ln(3)
+        PDFGenerator._apply_style(pdf, 'header')
+        pdf.cell(0, 10, title, ln=True, align='L')
+        if not rows:
+            PDFGenerator._apply_style(pdf, 'subheader')
+            pdf.cell(0, 7, "Sem dados para o período.", ln=True, align='L')
+            return
+        PDFGenerator._draw_table_header(pdf, columns)
+        for row_index, row_values in enumerate(rows):
+            lines_per_cell, row_height = PDFGenerator._layout_row(pdf, row_values, columns)
+            if pdf.get_y() + row_height > page_break_y:
+                pdf.add_page()
+                PDFGenerator._draw_table_header(pdf, columns)
+            PDFGenerator._draw_row(pdf, lines_per_cell, row_height, columns, fill=row_index % 2 == 1)
+
+
+class _ReportProgress:
+    """Repassa o progresso da geração ao `progress_callback` e verifica o cancelamento a cada lote de linhas."""
+    ROWS_PER_UPDATE = 200
+
+    def __init__(self, progress_callback: Optional[ProgressCallback], cancel_event: Optional[threading.Event]):
+        self.progress_callback = progress_callback
+        self.cancel_event = cancel_event
+        self.rows_done = 0
+
+    def check_cancelled(self):
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise ReportCancelledError("Geração do relatório cancelada.")
+
+    def row_done(self, row_index: int, pages_written: int = 0):
+        if row_index % self.ROWS_PER_UPDATE == 0:
+            self.rows_done = row_index
+            self.check_cancelled()
+            if self.progress_callback:
+                self.progress_callback(row_index, pages_written)
+
+    def finish(self, total_rows: int, total_pages: int):
+        self.rows_done = total_rows
+        self.page_written(total_pages)
+
+    def page_written(self, pages_written: int):
+        self.check_cancelled()
+        if self.progress_callback:
+            self.progress_callback(self.rows_done, pages_written)